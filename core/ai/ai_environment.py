@@ -6,12 +6,22 @@ class TradingEnvironment:
     A simplified trading environment for Reinforcement Learning, 
     inspired by OpenAI Gym and FinRL.
     """
-    def __init__(self, data_path, initial_balance=100.0):
-        self.df = pd.read_csv(data_path)
+    def __init__(self, data_path=None, initial_balance=100.0, df=None):
+        self.df = df if df is not None else pd.read_csv(data_path)
         self.initial_balance = initial_balance
         self._add_indicators()
         self.reset()
 
+    @classmethod
+    def from_store(cls, symbol="SOLUSDT", interval="15m", start=None, end=None, store=None, initial_balance=100.0):
+        """
+        Builds the environment from the local OHLCV store (core.data) instead of a CSV.
+        """
+        from core.data.ohlcv_store import OHLCVStore
+        store = store or OHLCVStore()
+        df = store.to_frame(symbol, interval, start, end, columns=["time", "open", "high", "low", "close", "volume"])
+        return cls(initial_balance=initial_balance, df=df)
+
     def _add_indicators(self):
         """Adds technical indicators to the dataframe for state enrichment."""
         # Clean numeric data
@@ -29,7 +39,12 @@ class TradingEnvironment:
         self.df['rsi'] = 100 - (100 / (1 + rs))
         
         # Fill NaNs
-        self.df.fillna(method='bfill', inplace=True)
+        self.df = self.df.bfill()
+
+        # Contiguous per-step arrays: stepping indexes these, never the DataFrame
+        self.features = np.ascontiguousarray(self.df[['close', 'ema9', 'ema21', 'rsi']].to_numpy(dtype=np.float32))
+        self.prices = self.df['close'].to_numpy(dtype=np.float64).tolist()
+        self.n_steps = len(self.prices)
 
     def reset(self):
         """Resets the environment to initial state."""
@@ -42,16 +57,11 @@ class TradingEnvironment:
 
     def _get_observation(self):
         """Returns the current market state/observation."""
-        row = self.df.iloc[self.current_step]
-        obs = np.array([
-            row['close'],
-            row['ema9'],
-            row['ema21'],
-            row['rsi'],
-            self.balance,
-            self.inventory,
-            self.current_step / len(self.df)
-        ], dtype=np.float32)
+        obs = np.empty(7, dtype=np.float32)
+        obs[:4] = self.features[self.current_step]
+        obs[4] = self.balance
+        obs[5] = self.inventory
+        obs[6] = self.current_step / self.n_steps
         return obs
 
     def step(self, action):
@@ -59,7 +69,7 @@ class TradingEnvironment:
         Executes an action in the environment.
         Actions: 0 = HOLD, 1 = BUY ALL, 2 = SELL ALL
         """
-        current_price = self.df.iloc[self.current_step]['close']
+        current_price = self.prices[self.current_step]
         reward = 0
         
         # BUY
@@ -77,7 +87,7 @@ class TradingEnvironment:
             self.total_trades += 1
 
         self.current_step += 1
-        if self.current_step >= len(self.df) - 1:
+        if self.current_step >= self.n_steps - 1:
             self.done = True
         
         obs = self._get_observation()
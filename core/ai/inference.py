@@ -0,0 +1,131 @@
+import os
+import threading
+import functools
+import numpy as np
+
+# Torch-free DQN inference for live signals.
+# The trained weights (trading_agent.pth) are exported once to a small .npz
+# file; evaluating the MLP is then three matrix multiplies in NumPy, with no
+# torch import. get_model() loads the network lazily and shares it across
+# every strategy in the process.
+
+MODEL_PATH = "trading_agent.pth"
+EXPORT_PATH = "trading_agent.npz"
+
+class NumpyDQN:
+    """
+    Linear/ReLU stack equivalent to the DQN in core/ai/train_agent.py.
+    model(states) -> Q-values, states of shape (state_dim,) or (N, state_dim).
+    """
+    def __init__(self, layers):
+        self.layers = [(np.ascontiguousarray(w, dtype=np.float32), np.asarray(b, dtype=np.float32)) for w, b in layers]
+        self.state_dim = self.layers[0][0].shape[0]
+        self.action_dim = self.layers[-1][0].shape[1]
+
+    def __call__(self, states):
+        x = np.asarray(states, dtype=np.float32)
+        last = len(self.layers) - 1
+        for i, (w, b) in enumerate(self.layers):
+            x = x @ w + b
+            if i < last:
+                np.maximum(x, 0, out=x)
+        return x
+
+    def predict(self, states):
+        """
+        Greedy action(s) for the given state(s).
+        """
+        return self(states).argmax(axis=-1)
+
+    @classmethod
+    def from_state_dict(cls, state_dict):
+        """
+        From a torch DQN state_dict (fc.<i>.weight / fc.<i>.bias, weight as out x in).
+        """
+        indices = sorted({int(k.split(".")[1]) for k in state_dict if k.endswith(".weight")})
+        to_numpy = lambda t: t.detach().cpu().numpy() if hasattr(t, "detach") else np.asarray(t)
+        return cls([(to_numpy(state_dict[f"fc.{i}.weight"]).T, to_numpy(state_dict[f"fc.{i}.bias"])) for i in indices])
+
+    def save(self, path=EXPORT_PATH):
+        arrays = {}
+        for i, (w, b) in enumerate(self.layers):
+            arrays[f"w{i}"] = w
+            arrays[f"b{i}"] = b
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path=EXPORT_PATH):
+        with np.load(path) as data:
+            count = len([k for k in data.files if k.startswith("w")])
+            return cls([(data[f"w{i}"], data[f"b{i}"]) for i in range(count)])
+
+def export_model(model_path=MODEL_PATH, out_path=EXPORT_PATH):
+    """
+    Converts a trained torch checkpoint into the NumPy .npz artifact (needs torch once).
+    """
+    import torch
+    model = NumpyDQN.from_state_dict(torch.load(model_path, map_location="cpu"))
+    model.save(out_path)
+    print(f"💾 Exported {model_path} -> {out_path}")
+    return model
+
+_model = None
+_loaded = False
+_lock = threading.Lock()
+
+def load_model(model_path=MODEL_PATH, export_path=EXPORT_PATH):
+    """
+    The .npz export if it is up to date, else the torch checkpoint (which
+    is exported on the way so the next start skips torch). None if there is
+    no trained model.
+    """
+    has_export = os.path.exists(export_path)
+    has_checkpoint = os.path.exists(model_path)
+    if has_export and (not has_checkpoint or os.path.getmtime(export_path) >= os.path.getmtime(model_path)):
+        return NumpyDQN.load(export_path)
+    if has_checkpoint:
+        try:
+            return export_model(model_path, export_path)
+        except Exception as e:
+            print(f"⚠️ Failed to load AI model: {e}")
+            if has_export:
+                return NumpyDQN.load(export_path)
+    return None
+
+def get_model(reload=False):
+    """
+    Process-wide shared model, loaded on first use.
+    """
+    global _model, _loaded
+    if not _loaded or reload:
+        with _lock:
+            if not _loaded or reload:
+                try:
+                    _model = load_model()
+                except Exception as e:
+                    print(f"⚠️ Failed to load AI model: {e}")
+                    _model = None
+                _loaded = True
+    return _model
+
+@functools.lru_cache(maxsize=None)
+def torch_dqn_class():
+    """
+    train_agent.DQN, the one torch definition of the network, imported on
+    demand so importing this module never imports torch.
+    """
+    import sys
+    # train_agent uses flat imports from core/ai
+    ai_dir = os.path.dirname(os.path.abspath(__file__))
+    if ai_dir not in sys.path:
+        sys.path.insert(0, ai_dir)
+    from train_agent import DQN
+    return DQN
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Export the trained DQN to a torch-free .npz")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--out", default=EXPORT_PATH)
+    args = parser.parse_args()
+    export_model(args.model, args.out)
@@ -0,0 +1,101 @@
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+def peak_rss_mb():
+    """
+    Peak resident memory of this process in MB (None if unavailable).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+class TrainingProfiler:
+    """
+    Per-phase wall-clock timings for a training run:
+        with profiler.phase("env_step"):
+            env.step(action)
+        profiler.count("steps")
+    A disabled profiler costs one attribute check per phase.
+    trace_memory=True also records the peak of Python allocations
+    (tracemalloc, slow); the process peak RSS is always reported.
+    """
+    def __init__(self, enabled=True, trace_memory=False):
+        self.enabled = enabled
+        self.trace_memory = trace_memory and enabled
+        self.timings = {}
+        self.calls = {}
+        self.counters = {}
+        self.started = None
+        self.elapsed = 0.0
+        self.python_peak_mb = None
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    def phase(self, name):
+        return self._timed(name) if self.enabled else nullcontext()
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def start(self):
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+        self.started = time.perf_counter()
+
+    def stop(self):
+        if self.started is not None:
+            self.elapsed = time.perf_counter() - self.started
+        if self.trace_memory:
+            import tracemalloc
+            self.python_peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+
+    def report(self):
+        """
+        {"elapsed": s, "phases": {name: {"seconds", "calls", "share"}},
+         "rates": {counter/s}, "counters": {...}, "peak_rss_mb", "python_peak_mb"}
+        """
+        elapsed = self.elapsed or sum(self.timings.values()) or 1e-9
+        return {
+            "elapsed": elapsed,
+            "phases": {name: {"seconds": t, "calls": self.calls[name], "share": t / elapsed}
+                       for name, t in sorted(self.timings.items(), key=lambda kv: -kv[1])},
+            "rates": {f"{name}/s": n / elapsed for name, n in self.counters.items()},
+            "counters": dict(self.counters),
+            "peak_rss_mb": peak_rss_mb(),
+            "python_peak_mb": self.python_peak_mb,
+        }
+
+    def print_report(self):
+        r = self.report()
+        print("\n" + "=" * 52)
+        print(f"⏱️ TRAINING PROFILE ({r['elapsed']:.2f}s)")
+        print("=" * 52)
+        for name, p in r["phases"].items():
+            print(f"{name:<16} {p['seconds']:>8.3f}s {p['share'] * 100:>6.1f}%  {p['calls']:>9} calls")
+        other = r["elapsed"] - sum(p["seconds"] for p in r["phases"].values())
+        print(f"{'(other)':<16} {max(other, 0):>8.3f}s")
+        for name, rate in r["rates"].items():
+            print(f"{name:<16} {rate:>12,.0f}")
+        if r["peak_rss_mb"] is not None:
+            print(f"Peak RSS:        {r['peak_rss_mb']:.1f} MB")
+        if r["python_peak_mb"] is not None:
+            print(f"Python peak:     {r['python_peak_mb']:.1f} MB")
+        print("=" * 52)
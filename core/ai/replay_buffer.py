@@ -0,0 +1,128 @@
+import numpy as np
+
+class SumTree:
+    """
+    Binary tree over `capacity` leaf priorities where every node holds the sum
+    of its children, for O(log n) proportional sampling. Updates and lookups
+    work on whole index batches, one tree level at a time.
+    """
+    def __init__(self, capacity):
+        self.leaves = 1
+        while self.leaves < capacity:
+            self.leaves *= 2
+        self.tree = np.zeros(2 * self.leaves) # node 1 is the root, leaves start at self.leaves
+
+    def total(self):
+        return self.tree[1]
+
+    def update(self, indices, priorities):
+        nodes = np.asarray(indices) + self.leaves
+        self.tree[nodes] = priorities
+        nodes = np.unique(nodes // 2)
+        while nodes[0] >= 1:
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+            if nodes[0] == 1:
+                break
+            nodes = np.unique(nodes // 2)
+
+    def find(self, values):
+        """
+        Leaf index whose cumulative priority range contains each value.
+        """
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.int64)
+        while nodes[0] < self.leaves:
+            left = 2 * nodes
+            go_right = values > self.tree[left]
+            values -= np.where(go_right, self.tree[left], 0.0)
+            nodes = left + go_right
+        return nodes - self.leaves
+
+class ReplayBuffer:
+    """
+    Fixed-size experience memory in preallocated arrays (a ring buffer: the
+    oldest transition is overwritten once full). sample() returns ready-made
+    arrays, so no per-minibatch Python lists are built.
+
+    prioritized=True samples transitions proportionally to priority**alpha
+    (sum tree) and returns importance-sampling weights, annealing beta to 1;
+    feed the TD errors back with update_priorities().
+    """
+    def __init__(self, capacity, state_dim, prioritized=False, alpha=0.6, beta=0.4, beta_increment=1e-4, eps=1e-5, seed=None):
+        self.capacity = capacity
+        self.states = np.zeros((capacity, state_dim), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_dim), dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=np.float32)
+        self.pos = 0
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+
+        self.prioritized = prioritized
+        self.alpha = alpha
+        self.beta = beta
+        self.beta_increment = beta_increment
+        self.eps = eps
+        self.max_priority = 1.0
+        self.tree = SumTree(capacity) if prioritized else None
+
+    def __len__(self):
+        return self.size
+
+    def add(self, state, action, reward, next_state, done):
+        i = self.pos
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self.pos = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        if self.tree is not None:
+            # New transitions get the highest priority so they are replayed at least once
+            self.tree.update([i], [self.max_priority ** self.alpha])
+
+    def add_batch(self, states, actions, rewards, next_states, dones):
+        """
+        Inserts N transitions at once (e.g. one vector environment step).
+        """
+        n = len(actions)
+        idx = (self.pos + np.arange(n)) % self.capacity
+        self.states[idx] = states
+        self.actions[idx] = actions
+        self.rewards[idx] = rewards
+        self.next_states[idx] = next_states
+        self.dones[idx] = dones
+        self.pos = int((self.pos + n) % self.capacity)
+        self.size = min(self.size + n, self.capacity)
+        if self.tree is not None:
+            self.tree.update(idx, np.full(n, self.max_priority ** self.alpha))
+
+    def sample(self, batch_size):
+        """
+        Returns (states, actions, rewards, next_states, dones, indices, weights).
+        Weights are all 1 unless prioritized.
+        """
+        if self.tree is None:
+            idx = self.rng.integers(0, self.size, batch_size)
+            weights = np.ones(batch_size, dtype=np.float32)
+        else:
+            # One draw per equal slice of the total priority (stratified)
+            total = self.tree.total()
+            bounds = np.linspace(0.0, total, batch_size + 1)
+            values = self.rng.uniform(bounds[:-1], bounds[1:])
+            idx = np.minimum(self.tree.find(values), self.size - 1)
+            probs = np.maximum(self.tree.tree[idx + self.tree.leaves] / total, 1e-12)
+            weights = (self.size * probs) ** -self.beta
+            weights = (weights / weights.max()).astype(np.float32)
+            self.beta = min(1.0, self.beta + self.beta_increment)
+        return (self.states[idx], self.actions[idx], self.rewards[idx], self.next_states[idx],
+                self.dones[idx], idx, weights)
+
+    def update_priorities(self, indices, td_errors):
+        if self.tree is None:
+            return
+        priorities = np.abs(td_errors) + self.eps
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self.tree.update(indices, priorities ** self.alpha)
@@ -3,8 +3,11 @@ import torch.nn as nn
 import torch.optim as optim
 import random
 import numpy as np
-from collections import deque
 from ai_environment import TradingEnvironment
+from replay_buffer import ReplayBuffer
+from vector_env import VectorTradingEnvironment
+from profiler import TrainingProfiler
+from inference import NumpyDQN, EXPORT_PATH
 
 # Neural Network for DQN
 class DQN(nn.Module):
@@ -22,10 +25,10 @@ class DQN(nn.Module):
         return self.fc(x)
 
 class Agent:
-    def __init__(self, state_dim, action_dim):
+    def __init__(self, state_dim, action_dim, prioritized=False):
         self.state_dim = state_dim
         self.action_dim = action_dim
-        self.memory = deque(maxlen=5000)
+        self.memory = ReplayBuffer(5000, state_dim, prioritized=prioritized)
         self.gamma = 0.99 # Higher gamma for long-term vision
         self.epsilon = 1.0
         self.epsilon_min = 0.05
@@ -37,6 +40,7 @@ class Agent:
         
         self.optimizer = optim.Adam(self.model.parameters(), lr=0.0005) # Slower LR for precision
         self.criterion = nn.MSELoss()
+        self.profiler = TrainingProfiler(enabled=False)
 
     def update_target_model(self):
         """Copies weights from model to target_model."""
@@ -50,73 +54,163 @@ class Agent:
             q_values = self.model(state)
         return torch.argmax(q_values).item()
 
+    def act_batch(self, states):
+        """
+        Epsilon-greedy actions for a (N, state_dim) batch with one forward pass.
+        """
+        states = np.asarray(states, dtype=np.float32)
+        with torch.no_grad():
+            actions = self.model(torch.from_numpy(states)).argmax(1).numpy()
+        explore = np.random.rand(len(states)) <= self.epsilon
+        actions[explore] = np.random.randint(0, self.action_dim, explore.sum())
+        return actions
+
     def remember(self, state, action, reward, next_state, done):
-        self.memory.append((state, action, reward, next_state, done))
+        self.memory.add(state, action, reward, next_state, done)
 
     def replay(self, batch_size):
         if len(self.memory) < batch_size:
             return
         
-        minibatch = random.sample(self.memory, batch_size)
-        
-        states = torch.FloatTensor(np.array([s for s, a, r, n, d in minibatch]))
-        actions = torch.LongTensor([a for s, a, r, n, d in minibatch])
-        rewards = torch.FloatTensor([r for s, a, r, n, d in minibatch])
-        next_states = torch.FloatTensor(np.array([n for s, a, r, n, d in minibatch]))
-        dones = torch.FloatTensor([d for s, a, r, n, d in minibatch])
+        with self.profiler.phase("replay_sample"):
+            states, actions, rewards, next_states, dones, indices, weights = self.memory.sample(batch_size)
+            states = torch.from_numpy(states)
+            actions = torch.from_numpy(actions)
+            rewards = torch.from_numpy(rewards)
+            next_states = torch.from_numpy(next_states)
+            dones = torch.from_numpy(dones)
 
-        # Current Q values
-        q_values = self.model(states)
-        current_q = q_values.gather(1, actions.unsqueeze(1)).squeeze(1)
+        with self.profiler.phase("learn"):
+            # Current Q values
+            q_values = self.model(states)
+            current_q = q_values.gather(1, actions.unsqueeze(1)).squeeze(1)
 
-        # Target Q values using Target Network (Classic DQN)
-        with torch.no_grad():
-            next_q_values = self.target_model(next_states)
-            max_next_q = next_q_values.max(1)[0]
-            targets = rewards + (1 - dones) * self.gamma * max_next_q
+            # Target Q values using Target Network (Classic DQN)
+            with torch.no_grad():
+                next_q_values = self.target_model(next_states)
+                max_next_q = next_q_values.max(1)[0]
+                targets = rewards + (1 - dones) * self.gamma * max_next_q
 
-        loss = self.criterion(current_q, targets)
-        
-        self.optimizer.zero_grad()
-        loss.backward()
-        self.optimizer.step()
+            if self.memory.prioritized:
+                td_errors = current_q - targets
+                # Importance-sampling weights correct the bias of prioritized sampling
+                loss = (torch.from_numpy(weights) * td_errors.pow(2)).mean()
+                self.memory.update_priorities(indices, td_errors.detach().abs().numpy())
+            else:
+                loss = self.criterion(current_q, targets)
+            
+            self.optimizer.zero_grad()
+            loss.backward()
+            self.optimizer.step()
+        self.profiler.count("samples", batch_size)
         
         if self.epsilon > self.epsilon_min:
             self.epsilon *= self.epsilon_decay
 
-def train():
-    env = TradingEnvironment("SOLUSDT_15m_historical.csv")
+def train(num_envs=1, profile=False, env=None, episodes=200, save=True, verbose=True, prioritized=False):
+    """
+    profile=True reports per-phase timings (env step, action selection,
+    replay sampling, learning), steps/s, samples/s and peak memory.
+    prioritized=True samples replay by TD error (see ReplayBuffer).
+    Returns the agent; the report is agent.profiler.report().
+    """
+    env = env or TradingEnvironment("SOLUSDT_15m_historical.csv")
     state_dim = 7 # [price, ema9, ema21, rsi, balance, inventory, progress]
     action_dim = 3 # HOLD, BUY, SELL
-    agent = Agent(state_dim, action_dim)
-    episodes = 200 # Increased for precision
+    agent = Agent(state_dim, action_dim, prioritized=prioritized)
+    profiler = agent.profiler = TrainingProfiler(enabled=profile)
     batch_size = 64
     target_update_freq = 10 # Update target every 10 episodes
 
     print("🚀 Starting AI Training (Reinforcement Learning)...")
-    for e in range(episodes):
-        state = env.reset()
-        episode_reward = 0
-        for time_step in range(300):
-            action = agent.act(state)
-            next_state, reward, done, info = env.step(action)
-            agent.remember(state, action, reward, next_state, done)
-            state = next_state
-            episode_reward += reward
-            if done:
-                break
-            if len(agent.memory) > batch_size and time_step % 20 == 0:
-                agent.replay(batch_size)
-        
-        if e % target_update_freq == 0:
-            agent.update_target_model()
-        
-        print(f"Episode: {e+1}/{episodes} | Reward: {episode_reward:.2f} | Net Worth: {info['net_worth']:.2f} | Epsilon: {agent.epsilon:.2f}")
+    profiler.start()
+    if num_envs > 1:
+        train_vectorized(agent, env, episodes, batch_size, target_update_freq, num_envs, verbose)
+    else:
+        for e in range(episodes):
+            state = env.reset()
+            episode_reward = 0
+            for time_step in range(300):
+                with profiler.phase("act"):
+                    action = agent.act(state)
+                with profiler.phase("env_step"):
+                    next_state, reward, done, info = env.step(action)
+                with profiler.phase("remember"):
+                    agent.remember(state, action, reward, next_state, done)
+                profiler.count("steps")
+                state = next_state
+                episode_reward += reward
+                if done:
+                    break
+                if len(agent.memory) > batch_size and time_step % 20 == 0:
+                    agent.replay(batch_size)
+            
+            if e % target_update_freq == 0:
+                agent.update_target_model()
+            
+            if verbose:
+                print(f"Episode: {e+1}/{episodes} | Reward: {episode_reward:.2f} | Net Worth: {info['net_worth']:.2f} | Epsilon: {agent.epsilon:.2f}")
+    profiler.stop()
     
-    # Save the trained model
-    torch.save(state_dim, "trading_agent_metadata.pth") # Save metadata
-    torch.save(agent.model.state_dict(), "trading_agent.pth")
-    print("💾 AI Model Saved: trading_agent.pth")
+    if save:
+        # Save the trained model
+        torch.save(state_dim, "trading_agent_metadata.pth") # Save metadata
+        torch.save(agent.model.state_dict(), "trading_agent.pth")
+        # Torch-free copy used for live inference (core/ai/inference.py)
+        NumpyDQN.from_state_dict(agent.model.state_dict()).save(EXPORT_PATH)
+        print(f"💾 AI Model Saved: trading_agent.pth (+ {EXPORT_PATH})")
+
+    if profile:
+        profiler.print_report()
+    return agent
+
+def train_vectorized(agent, env, episodes, batch_size, target_update_freq, num_envs, verbose=True):
+    """
+    Same training loop over `num_envs` episodes stepped in lockstep
+    (random start offsets). One replay per 20 transitions, as in train().
+    As in train(), only the end of the data is stored as done; the 300-step
+    cut-off is not, and its row keeps the episode's final observation.
+    """
+    profiler = agent.profiler
+    venv = VectorTradingEnvironment([env], num_envs=num_envs, initial_balance=env.initial_balance, max_steps=300)
+    states = venv.reset()
+    episode_rewards = np.zeros(num_envs)
+    finished = 0
+    transitions = 0
+    replays = 0
+    while finished < episodes:
+        with profiler.phase("act"):
+            actions = agent.act_batch(states)
+        with profiler.phase("env_step"):
+            next_states, rewards, terminated, truncated, info = venv.step(actions)
+        with profiler.phase("remember"):
+            agent.memory.add_batch(states, actions, rewards, info["final_observation"], terminated)
+        profiler.count("steps", num_envs)
+        episode_rewards += rewards
+        states = next_states
+        transitions += num_envs
+        # Replays owed by the transition count, independent of num_envs
+        due = transitions // 20
+        if len(agent.memory) > batch_size:
+            for _ in range(due - replays):
+                agent.replay(batch_size)
+        replays = due
+
+        for i in np.flatnonzero(terminated | truncated):
+            if finished % target_update_freq == 0:
+                agent.update_target_model()
+            finished += 1
+            if verbose:
+                print(f"Episode: {finished}/{episodes} | Reward: {episode_rewards[i]:.2f} | Net Worth: {info['net_worth'][i]:.2f} | Epsilon: {agent.epsilon:.2f}")
+            episode_rewards[i] = 0
+            if finished >= episodes:
+                break
 
 if __name__ == "__main__":
-    train()
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-envs", type=int, default=1, help="Episodes stepped in lockstep (batched inference)")
+    parser.add_argument("--profile", action="store_true", help="Report per-phase timings and peak memory")
+    parser.add_argument("--prioritized", action="store_true", help="Prioritized experience replay")
+    args = parser.parse_args()
+    train(num_envs=args.num_envs, profile=args.profile, prioritized=args.prioritized)
@@ -0,0 +1,103 @@
+import numpy as np
+
+class VectorTradingEnvironment:
+    """
+    Runs N independent TradingEnvironment episodes in lockstep with array ops.
+    Same rules, observation layout and rewards as TradingEnvironment.step(),
+    but step() takes N actions and returns stacked (N, 7) observations so the
+    agent can pick all N actions with one forward pass.
+
+    sources: TradingEnvironment instances (one per symbol/dataset); only
+    their precomputed `features` and `prices` are used. Env i runs on
+    sources[i % len(sources)] with fees[i % len(fees)] charged per trade.
+    Finished episodes restart automatically at a random offset; `max_steps`
+    caps an episode's length like the training loop's 300-step horizon.
+    That cap is a truncation, not a terminal state: step() reports it
+    separately so learners keep bootstrapping through it.
+    """
+    def __init__(self, sources, num_envs=8, initial_balance=100.0, fees=(0.0,), max_steps=300,
+                 start_step=21, random_start=True, seed=None):
+        self.num_envs = num_envs
+        self.initial_balance = initial_balance
+        self.max_steps = max_steps
+        self.start_step = start_step
+        self.random_start = random_start
+        self.rng = np.random.default_rng(seed)
+
+        # All sources back to back; env i reads rows base[i] .. base[i] + length[i] - 1
+        self.features = np.concatenate([s.features for s in sources]).astype(np.float32, copy=False)
+        self.prices = np.concatenate([np.asarray(s.prices, dtype=np.float64) for s in sources])
+        offsets = np.cumsum([0] + [len(s.prices) for s in sources])
+        src = np.arange(num_envs) % len(sources)
+        self.base = offsets[src]
+        self.length = np.diff(offsets)[src]
+        self.fee = np.asarray(fees, dtype=np.float64)[np.arange(num_envs) % len(fees)]
+
+        self.balance = np.zeros(num_envs)
+        self.inventory = np.zeros(num_envs)
+        self.current_step = np.zeros(num_envs, dtype=np.int64)
+        self.steps_taken = np.zeros(num_envs, dtype=np.int64)
+        self.total_trades = np.zeros(num_envs, dtype=np.int64)
+
+    def _start_steps(self, idx):
+        if not self.random_start:
+            return np.full(len(idx), self.start_step)
+        # Leave room for a full episode when the series is long enough
+        high = np.maximum(self.start_step + 1, self.length[idx] - self.max_steps - 1)
+        return self.rng.integers(self.start_step, high)
+
+    def _reset_envs(self, idx):
+        self.balance[idx] = self.initial_balance
+        self.inventory[idx] = 0.0
+        self.current_step[idx] = self._start_steps(idx)
+        self.steps_taken[idx] = 0
+        self.total_trades[idx] = 0
+
+    def reset(self):
+        self._reset_envs(np.arange(self.num_envs))
+        return self._get_observation()
+
+    def _get_observation(self):
+        obs = np.empty((self.num_envs, 7), dtype=np.float32)
+        obs[:, :4] = self.features[self.base + self.current_step]
+        obs[:, 4] = self.balance
+        obs[:, 5] = self.inventory
+        obs[:, 6] = self.current_step / self.length
+        return obs
+
+    def step(self, actions):
+        """
+        actions: (N,) ints, 0 = HOLD, 1 = BUY ALL, 2 = SELL ALL.
+        Returns (obs, rewards, terminated, truncated, info). terminated: the
+        data ran out (a true episode end); truncated: the `max_steps` cap was
+        hit. Rows of finished envs in `obs` already hold the first
+        observation of their next episode; info["final_observation"] holds
+        the observation every env reached before any reset.
+        """
+        actions = np.asarray(actions)
+        price = self.prices[self.base + self.current_step]
+
+        buy = (actions == 1) & (self.balance > 10)
+        self.inventory[buy] = self.balance[buy] * (1 - self.fee[buy]) / price[buy]
+        self.balance[buy] = 0.0
+
+        sell = (actions == 2) & (self.inventory > 0)
+        self.balance[sell] = self.inventory[sell] * price[sell] * (1 - self.fee[sell])
+        self.inventory[sell] = 0.0
+        self.total_trades += buy | sell
+
+        self.current_step += 1
+        self.steps_taken += 1
+        terminated = self.current_step >= self.length - 1
+        truncated = ~terminated & (self.steps_taken >= self.max_steps)
+
+        net_worth = self.balance + self.inventory * price
+        rewards = net_worth - self.initial_balance
+        final_obs = self._get_observation()
+        info = {"net_worth": net_worth, "total_trades": self.total_trades.copy(), "final_observation": final_obs}
+
+        dones = terminated | truncated
+        if not dones.any():
+            return final_obs, rewards, terminated, truncated, info
+        self._reset_envs(np.flatnonzero(dones))
+        return self._get_observation(), rewards, terminated, truncated, info
@@ -0,0 +1,79 @@
+import time
+import threading
+
+class ClockSync:
+    """
+    Estimates the exchange clock offset so signed requests can be
+    timestamped locally instead of asking the server for its time first.
+
+    Each sample brackets a server-time call with local timestamps t0/t1 and
+    assumes the server read its clock at the RTT midpoint (NTP style):
+        offset = server_time - (t0 + t1) / 2
+    The sample with the smallest RTT is kept, as it has the tightest error
+    bound (+/- RTT/2). A daemon thread refreshes the estimate periodically.
+    """
+    def __init__(self, fetch_server_time, samples=3, refresh_interval=300, retry_interval=10):
+        self.fetch_server_time = fetch_server_time # callable returning server time in ms
+        self.samples = samples
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.offset_ms = 0.0
+        self.rtt_ms = None
+        self.synced_at = None
+        self._last_attempt = 0.0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def sync(self):
+        """
+        Takes `samples` measurements and keeps the lowest-RTT one.
+        Returns the offset in ms; raises if no sample succeeded.
+        """
+        self._last_attempt = time.monotonic()
+        best = None
+        for _ in range(self.samples):
+            try:
+                t0 = time.time() * 1000
+                server = float(self.fetch_server_time())
+                t1 = time.time() * 1000
+            except Exception:
+                continue
+            rtt = t1 - t0
+            if best is None or rtt < best[0]:
+                best = (rtt, server - (t0 + t1) / 2)
+        if best is None:
+            raise RuntimeError("Clock sync failed: server time unavailable")
+        with self._lock:
+            self.rtt_ms, self.offset_ms = best
+            self.synced_at = time.monotonic()
+        return self.offset_ms
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(self.refresh_interval)
+            try:
+                self.sync()
+            except Exception:
+                pass # keep the last good offset
+
+    def start(self):
+        """
+        Starts the background refresher (idempotent).
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._refresh_loop, name="clock-sync", daemon=True)
+                self._thread.start()
+
+    def now_ms(self):
+        """
+        Current server time estimate in ms. The first call syncs once
+        (blocking); after that no network round trip is made.
+        """
+        if self.synced_at is None and time.monotonic() - self._last_attempt >= self.retry_interval:
+            try:
+                self.sync()
+            except Exception:
+                pass # fall back to the local clock until a sync succeeds
+            self.start()
+        return int(time.time() * 1000 + self.offset_ms)
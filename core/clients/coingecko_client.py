@@ -0,0 +1,192 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from core.clients import transport
+from core.clients.env import load_env, cache_dir as default_cache_dir
+
+# CoinGecko public API with as few calls as possible:
+# - snapshots for many coins come from the multi-id endpoints
+#   (/coins/markets, /simple/price), one call per 250 ids;
+# - market_chart history is cached per coin and granularity (in memory, and
+#   on disk when QUANT_CACHE_DIR is set, like TTLCache), so a
+#   refresh only asks /market_chart/range for the points after the last
+#   cached one. The newest point of a chart is CoinGecko's live price, so it
+#   is treated as provisional and replaced on the next refresh.
+
+BASE_URL = "https://api.coingecko.com/api/v3"
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+MAX_IDS = 250
+# Days of cached history kept per granularity
+RETENTION_DAYS = {300000: 2, 3600000: 90, 86400000: 3650}
+
+def granularity_ms(days):
+    """
+    Point spacing CoinGecko uses for a `days` long chart (5 min, hourly or daily).
+    """
+    if days <= 1:
+        return 300000
+    if days <= 90:
+        return 3600000
+    return 86400000
+
+def _incremental_ok(step, gap_seconds):
+    # /market_chart/range only returns `step` spaced points for short enough ranges
+    return gap_seconds < {300000: 86400, 3600000: 90 * 86400}.get(step, float("inf"))
+
+def merge_points(cached, new, step):
+    """
+    Appends `new` [time_ms, value] points after the cached ones, thinned to
+    one per `step` (the latest point is always kept). The last cached point
+    is provisional and is dropped first.
+    """
+    merged = [list(p) for p in cached[:-1]]
+    new = sorted(new, key=lambda p: p[0])
+    for i, point in enumerate(new):
+        if merged and point[0] <= merged[-1][0]:
+            continue
+        if not merged or point[0] - merged[-1][0] >= step * 0.9 or i == len(new) - 1:
+            merged.append(list(point))
+    return merged
+
+class CoinGeckoClient:
+    """
+    cache_dir: where market_chart history is kept (default $QUANT_CACHE_DIR;
+    unset or "" keeps it in memory only). Charts younger than `max_age`
+    seconds are served without a request.
+    """
+    def __init__(self, vs_currency="usd", cache_dir=None, max_age=300):
+        load_env()
+        self.vs_currency = vs_currency
+        if cache_dir is None:
+            cache_dir = default_cache_dir()
+        self.cache_dir = os.path.join(cache_dir, "coingecko") if cache_dir else None
+        self.max_age = max_age
+        self.charts = {}
+        self.requests = 0
+
+    def _get(self, path, params):
+        self.requests += 1
+        response = transport.get(f"{BASE_URL}{path}", params=params, headers=HEADERS, verify=False, timeout=10)
+        if response.status_code != 200:
+            # 429s also pause CoinGecko's rate limiter bucket (see transport)
+            raise RuntimeError(f"CoinGecko HTTP {response.status_code} on {path}")
+        return response.json()
+
+    def get_markets(self, ids):
+        """
+        /coins/markets rows (current_price, price_change_percentage_24h,
+        total_volume, ...) for every id, keyed by id. Missing ids are left out.
+        """
+        ids = list(dict.fromkeys(ids))
+        rows = {}
+        for i in range(0, len(ids), MAX_IDS):
+            chunk = ids[i:i + MAX_IDS]
+            try:
+                data = self._get("/coins/markets", {"vs_currency": self.vs_currency, "ids": ",".join(chunk),
+                                                    "per_page": MAX_IDS, "page": 1, "price_change_percentage": "24h"})
+                rows.update({row["id"]: row for row in data})
+            except Exception as e:
+                print(f"⚠️ Error fetching CoinGecko markets: {e}")
+        return rows
+
+    def get_simple_prices(self, ids):
+        """
+        {id: {"price": float, "change_24h": float}} from /simple/price.
+        """
+        ids = list(dict.fromkeys(ids))
+        prices = {}
+        for i in range(0, len(ids), MAX_IDS):
+            chunk = ids[i:i + MAX_IDS]
+            try:
+                data = self._get("/simple/price", {"ids": ",".join(chunk), "vs_currencies": self.vs_currency,
+                                                   "include_24hr_change": "true"})
+            except Exception as e:
+                print(f"⚠️ Error fetching CoinGecko prices: {e}")
+                continue
+            for coin_id, row in data.items():
+                if self.vs_currency in row:
+                    prices[coin_id] = {"price": row[self.vs_currency],
+                                       "change_24h": row.get(f"{self.vs_currency}_24h_change") or 0.0}
+        return prices
+
+    def _path(self, coin_id, step):
+        return os.path.join(self.cache_dir, f"{coin_id}_{self.vs_currency}_{step // 1000}s.json") if self.cache_dir else None
+
+    def _load_chart(self, coin_id, step):
+        key = (coin_id, step)
+        chart = self.charts.get(key)
+        path = self._path(coin_id, step)
+        if chart is None and path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    chart = self.charts[key] = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Ignoring unreadable chart cache {path}: {e}")
+        return chart
+
+    def _save_chart(self, coin_id, step, chart):
+        self.charts[(coin_id, step)] = chart
+        path = self._path(coin_id, step)
+        if not path:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(chart, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"⚠️ Could not save chart cache: {e}")
+
+    def get_market_chart(self, coin_id, days=1):
+        """
+        {"prices": [[ms, price], ...], "total_volumes": [[ms, volume], ...]}
+        covering the last `days`. Only points newer than the cache are
+        fetched; on failure the cached chart is returned (None if there is none).
+        """
+        step = granularity_ms(days)
+        now = time.time()
+        start_ms = (now - days * 86400) * 1000
+        chart = self._load_chart(coin_id, step)
+
+        fresh = chart is not None and now - chart["fetched_at"] < self.max_age
+        covered = chart is not None and len(chart["prices"]) > 1 and chart["prices"][0][0] <= start_ms + step
+        if not (fresh and covered):
+            try:
+                since = chart["prices"][-2][0] / 1000 if covered else None
+                if covered and _incremental_ok(step, now - since):
+                    data = self._get(f"/coins/{coin_id}/market_chart/range",
+                                     {"vs_currency": self.vs_currency, "from": int(since), "to": int(now)})
+                    chart = {name: merge_points(chart[name], data.get(name, []), step)
+                             for name in ("prices", "total_volumes")}
+                else:
+                    data = self._get(f"/coins/{coin_id}/market_chart", {"vs_currency": self.vs_currency, "days": days})
+                    chart = {name: data.get(name, []) for name in ("prices", "total_volumes")}
+                keep_ms = (now - max(days, RETENTION_DAYS[step]) * 86400) * 1000
+                chart = {name: [p for p in points if p[0] >= keep_ms] for name, points in chart.items()}
+                chart["fetched_at"] = now
+                self._save_chart(coin_id, step, chart)
+            except Exception as e:
+                print(f"⚠️ Error fetching {coin_id} chart: {e}")
+                if chart is None:
+                    return None
+
+        return {name: [p for p in chart[name] if p[0] >= start_ms] for name in ("prices", "total_volumes")}
+
+    def get_market_charts(self, ids, days=1, workers=4):
+        """
+        {id: chart} for many coins (see get_market_chart); coins that could not
+        be fetched are left out. Requests are paced by CoinGecko's rate limiter.
+        """
+        ids = list(dict.fromkeys(ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            charts = dict(zip(ids, pool.map(lambda coin_id: self.get_market_chart(coin_id, days), ids)))
+        return {coin_id: chart for coin_id, chart in charts.items() if chart}
+
+if __name__ == "__main__":
+    client = CoinGeckoClient()
+    print(client.get_simple_prices(["bitcoin", "solana"]))
+    chart = client.get_market_chart("solana", days=1)
+    print(f"SOL: {len(chart['prices']) if chart else 0} points | {client.requests} requests")
@@ -0,0 +1,154 @@
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Per-endpoint health tracking for mirrored REST hosts.
+# Latency and error rate are smoothed with an EWMA; endpoints are tried in
+# order of health, a circuit breaker skips hosts that keep failing until a
+# cool-down passes, and read-only calls can be hedged: if the first host has
+# not answered by its p95 latency, the next one is fired as well and the
+# first good answer wins.
+
+_hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+
+class EndpointStats:
+    def __init__(self):
+        self.latency = None       # EWMA seconds
+        self.error_rate = 0.0     # EWMA of failures (0..1)
+        self.failures = 0         # consecutive failures
+        self.open_until = 0.0     # circuit open (skipped) until this time
+        self.samples = deque(maxlen=50)
+
+    def p95(self):
+        if len(self.samples) < 5:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+class EndpointHealth:
+    def __init__(self, alpha=0.2, failure_threshold=3, cooldown=30.0, default_hedge_delay=0.5, min_hedge_delay=0.05):
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint):
+        stats = self.stats.get(endpoint)
+        if stats is None:
+            stats = self.stats[endpoint] = EndpointStats()
+        return stats
+
+    def record_success(self, endpoint, latency):
+        with self._lock:
+            s = self._get(endpoint)
+            s.latency = latency if s.latency is None else (1 - self.alpha) * s.latency + self.alpha * latency
+            s.error_rate = (1 - self.alpha) * s.error_rate
+            s.failures = 0
+            s.open_until = 0.0
+            s.samples.append(latency)
+
+    def record_failure(self, endpoint):
+        with self._lock:
+            s = self._get(endpoint)
+            s.error_rate = (1 - self.alpha) * s.error_rate + self.alpha
+            s.failures += 1
+            if s.failures >= self.failure_threshold:
+                s.open_until = time.monotonic() + self.cooldown
+
+    def is_available(self, endpoint):
+        """
+        False while the endpoint's circuit is open. Once the cool-down has
+        passed it is tried again (half-open); one more failure re-opens it.
+        """
+        s = self.stats.get(endpoint)
+        return s is None or time.monotonic() >= s.open_until
+
+    def score(self, endpoint):
+        """
+        Lower is better: smoothed latency inflated by the error rate.
+        Unmeasured endpoints score 0 so they get probed.
+        """
+        s = self.stats.get(endpoint)
+        if s is None:
+            return 0.0
+        latency = s.latency
+        if latency is None:
+            # Never answered: only probe it first if it has not failed either
+            latency = 0.0 if s.error_rate == 0 else self.default_hedge_delay
+        return latency * (1 + 4 * s.error_rate)
+
+    def ordered(self, endpoints):
+        """
+        Endpoints sorted by health, skipping open circuits. If every circuit
+        is open they are all returned anyway (best first) rather than failing outright.
+        """
+        available = [e for e in endpoints if self.is_available(e)]
+        if not available:
+            available = list(endpoints)
+        # sorted() is stable, so ties keep the configured priority
+        return sorted(available, key=self.score)
+
+    def hedge_delay(self, endpoint):
+        s = self.stats.get(endpoint)
+        p95 = s.p95() if s else None
+        return max(self.min_hedge_delay, p95 if p95 is not None else self.default_hedge_delay)
+
+    def _timed(self, fn, endpoint):
+        started = time.perf_counter()
+        try:
+            result = fn(endpoint)
+        except Exception:
+            self.record_failure(endpoint)
+            raise
+        self.record_success(endpoint, time.perf_counter() - started)
+        return result
+
+    def call(self, fn, endpoints, hedge=False):
+        """
+        Calls fn(endpoint) on the healthiest endpoint, failing over to the
+        next one when it raises. With hedge=True (read-only calls only) the
+        next endpoint is also fired when the current one is slower than its
+        p95 latency; the first successful result is returned.
+        Raises the last error if every endpoint fails.
+        """
+        candidates = self.ordered(endpoints)
+        last_error = RuntimeError("No endpoints available")
+
+        if not hedge:
+            for endpoint in candidates:
+                try:
+                    return self._timed(fn, endpoint)
+                except Exception as e:
+                    last_error = e
+            raise last_error
+
+        pending = {}
+        launched = []
+
+        def launch():
+            if len(launched) == len(candidates):
+                return
+            endpoint = candidates[len(launched)]
+            launched.append(endpoint)
+            pending[_hedge_pool.submit(self._timed, fn, endpoint)] = endpoint
+
+        launch()
+        while pending:
+            timeout = self.hedge_delay(launched[-1]) if len(launched) < len(candidates) else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()  # hedge: current host is slow, race the next one
+                continue
+            for future in done:
+                pending.pop(future)
+                try:
+                    # Calls still in flight finish in the background and update their stats
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+                    launch()
+        raise last_error
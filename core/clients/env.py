@@ -0,0 +1,26 @@
+import os
+
+# .env loading shared by the clients. python-dotenv is imported on the first
+# call (when a client is created or the first HTTP session is built), not
+# when a module is imported.
+
+_loaded = False
+
+def load_env():
+    """
+    Loads .env into os.environ once; existing variables are not overridden.
+    """
+    global _loaded
+    if not _loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _loaded = True
+
+def cache_dir():
+    """
+    Directory of the on-disk caches shared between processes:
+    $QUANT_CACHE_DIR (e.g. QUANT_CACHE_DIR=.cache in .env). None when unset;
+    caches are then kept in memory, shared within the process only.
+    """
+    load_env()
+    return os.getenv("QUANT_CACHE_DIR") or None
@@ -1,23 +1,201 @@
-import google.generativeai as genai
 import os
-from dotenv import load_dotenv
+import re
+import json
+import time
+import hashlib
+import threading
+from core.clients.env import load_env, cache_dir
 
-load_dotenv()
+# Scores are cached per headline (keyed by a hash of its normalised text) in
+# memory and, when QUANT_CACHE_DIR is set, in a JSON file there (the same
+# policy as TTLCache), so a headline is sent to Gemini once no matter
+# how many symbols or polling cycles see it. Only unseen headlines are
+# scored, in batched prompts. The least recently used entries are evicted
+# beyond `max_entries`.
+
+BATCH_SIZE = 50
+
+def headline_key(headline):
+    normalised = " ".join(headline.lower().split())
+    return hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+
+class HeadlineScoreCache:
+    """
+    LRU map of headline hash -> score, persisted to `path` (None = memory only).
+    """
+    def __init__(self, path=None, max_entries=5000):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = {} # key -> [score, last_used]
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable sentiment cache {self.path}: {e}")
+
+    def _evict(self):
+        excess = len(self.entries) - self.max_entries
+        if excess > 0:
+            for key in sorted(self.entries, key=lambda k: self.entries[k][1])[:excess]:
+                del self.entries[key]
+
+    def save(self):
+        """
+        Writes the cache, keeping entries other processes saved meanwhile.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            try:
+                with open(self.path) as f:
+                    on_disk = json.load(f)
+                for key, entry in on_disk.items():
+                    if key not in self.entries:
+                        self.entries[key] = entry
+                self._evict()
+            except (OSError, ValueError):
+                pass
+            data = json.dumps(self.entries)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save sentiment cache: {e}")
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            entry[1] = time.time()
+            return entry[0]
+
+    def put_many(self, scores):
+        now = time.time()
+        with self._lock:
+            for key, score in scores.items():
+                self.entries[key] = [score, now]
+            self._evict()
+
+    def __len__(self):
+        return len(self.entries)
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+def shared_cache(path, max_entries=5000):
+    """
+    One HeadlineScoreCache per file, shared by every client in the process.
+    """
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = HeadlineScoreCache(path, max_entries)
+        return cache
+
+def parse_scores(text, count):
+    """
+    Reads `count` scores from a batch reply: a JSON array, or one
+    "index: score" / bare number per line. Returns None if the count is off.
+    """
+    match = re.search(r"\[[^\[\]]*\]", text)
+    if match:
+        try:
+            scores = [float(s) for s in json.loads(match.group())]
+            if len(scores) == count:
+                return [max(-1.0, min(1.0, s)) for s in scores]
+        except (ValueError, TypeError):
+            pass
+    scores = []
+    for line in text.splitlines():
+        found = re.findall(r"[-+]?\d*\.\d+|[-+]?\d+", line)
+        if found:
+            scores.append(max(-1.0, min(1.0, float(found[-1]))))
+    return scores if len(scores) == count else None
 
 class GeminiClient:
     """
     Client for Institutional-Grade Sentiment Analysis using Gemini AI.
+    model: anything with generate_content(prompt) -> object with .text
+    (e.g. a local stub); by default a Gemini model is built from GEMINI_API_KEY.
+    cache_path: score cache file (default $QUANT_CACHE_DIR/gemini_scores.json,
+    or a cache shared in memory by the process when QUANT_CACHE_DIR is unset);
+    "" keeps scores in memory for this client only.
     """
-    def __init__(self):
+    def __init__(self, model=None, cache_path=None, max_entries=5000):
+        load_env()
+        if cache_path is None:
+            directory = cache_dir()
+            self.cache = shared_cache(os.path.join(directory, "gemini_scores.json") if directory else None, max_entries)
+        elif cache_path:
+            self.cache = shared_cache(cache_path, max_entries)
+        else:
+            self.cache = HeadlineScoreCache(None, max_entries)
+        self.requests = 0
+        self.model = model
+        if model is not None:
+            return
+
         self.api_key = os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             print("⚠️ GEMINI_API_KEY not found in .env file.")
-            self.model = None
             return
-        
+
+        import google.generativeai as genai
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel('gemini-flash-latest')
 
+    def _score_batch(self, headlines):
+        prompt = ("Score each of the following crypto news headlines from -1.0 (extremely bearish) "
+                  "to 1.0 (extremely bullish). Return only a JSON array of numbers, one per headline, in order:\n\n")
+        prompt += "\n".join(f"{i + 1}. {h}" for i, h in enumerate(headlines))
+        self.requests += 1
+        response = self.model.generate_content(prompt)
+        return parse_scores(response.text.strip(), len(headlines))
+
+    def score_headlines(self, headlines):
+        """
+        Returns one score per headline (-1.0 .. 1.0). Cached headlines are not
+        sent again; the rest go out in batches of BATCH_SIZE. Headlines that
+        could not be scored get 0.0 and are not cached.
+        """
+        keys = [headline_key(h) for h in headlines]
+        scores = {k: self.cache.get(k) for k in set(keys)}
+        unseen = {}
+        for k, h in zip(keys, headlines):
+            if scores[k] is None and k not in unseen:
+                unseen[k] = h
+
+        if unseen and self.model:
+            pending = list(unseen.items())
+            fresh = {}
+            for i in range(0, len(pending), BATCH_SIZE):
+                batch = pending[i:i + BATCH_SIZE]
+                try:
+                    batch_scores = self._score_batch([h for _, h in batch])
+                except Exception as e:
+                    print(f"⚠️ Error with Gemini AI: {e}")
+                    continue
+                if batch_scores is None:
+                    print("⚠️ Gemini reply did not match the headline count. Skipping batch.")
+                    continue
+                fresh.update({k: s for (k, _), s in zip(batch, batch_scores)})
+            if fresh:
+                self.cache.put_many(fresh)
+                self.cache.save()
+                scores.update(fresh)
+
+        return [scores[k] if scores[k] is not None else 0.0 for k in keys]
+
     def analyze_sentiment(self, headlines):
         """
         Analyzes a list of news headlines and returns a sentiment score.
@@ -25,23 +203,8 @@ class GeminiClient:
         """
         if not self.model or not headlines:
             return 0.0
-            
-        prompt = f"Analyze the following crypto news headlines and provide a single sentiment score from -1.0 (extremely bearish) to 1.0 (extremely bullish). Only return the numeric score:\n\n"
-        prompt += "\n".join(headlines)
-        
-        try:
-            response = self.model.generate_content(prompt)
-            score_str = response.text.strip()
-            # Basic cleaning to handle potential text around the number
-            import re
-            match = re.search(r"[-+]?\d*\.\d+|\d+", score_str)
-            if match:
-                score = float(match.group())
-                return max(-1.0, min(1.0, score))
-            return 0.0
-        except Exception as e:
-            print(f"⚠️ Error with Gemini AI: {e}")
-            return 0.0
+        scores = self.score_headlines(headlines)
+        return sum(scores) / len(scores)
 
 if __name__ == "__main__":
     client = GeminiClient()
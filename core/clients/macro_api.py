@@ -1,17 +1,40 @@
-import requests
-import urllib3
-import time
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from core.clients import transport
+from core.clients.ttl_cache import TTLCache
 
 class MacroClient:
     """
     Client to fetch Macro Economic data like DXY (US Dollar Index).
     """
+    # DXY moves slowly next to a 15m strategy; one fetch per few minutes is
+    # shared by every client (and, with QUANT_CACHE_DIR, every process)
+    cache = TTLCache("dxy", ttl=300, stale_ttl=900)
+
     def __init__(self):
         # We use a public finance API endpoint to get DXY
         self.dxy_url = "https://query1.finance.yahoo.com/v8/finance/chart/DX-Y=F"
 
+    def _fetch_dxy(self):
+        headers = {
+            'User-Agent': 'Mozilla/5.0'
+        }
+        response = transport.get(self.dxy_url, headers=headers, verify=False, timeout=10)
+        data = response.json()
+        
+        meta = data['chart']['result'][0]['meta']
+        current_price = meta['regularMarketPrice']
+        prev_close = meta['previousClose']
+        
+        change_pct = ((current_price - prev_close) / prev_close) * 100
+        
+        # For Crypto, DXY UP = BAD (Bearish), DXY DOWN = GOOD (Bullish)
+        sentiment = "BULLISH" if change_pct < 0 else "BEARISH"
+        
+        return {
+            "price": current_price,
+            "change_pct": change_pct,
+            "sentiment": sentiment
+        }
+
     def get_dxy_trend(self):
         """
         Fetches the current DXY price and trend (24h change).
@@ -22,34 +45,15 @@ class MacroClient:
                 "sentiment": str (BEARISH/BULLISH)
             }
         """
-        headers = {
-            'User-Agent': 'Mozilla/5.0'
+        result = self.cache.get("DX-Y=F", self._fetch_dxy)
+        if result:
+            return dict(result)
+        # Fallback: Treat as Neutral to avoid breaking strategy
+        return {
+            "price": 0,
+            "change_pct": 0,
+            "sentiment": "NEUTRAL"
         }
-        try:
-            response = requests.get(self.dxy_url, headers=headers, verify=False, timeout=10)
-            data = response.json()
-            
-            meta = data['chart']['result'][0]['meta']
-            current_price = meta['regularMarketPrice']
-            prev_close = meta['previousClose']
-            
-            change_pct = ((current_price - prev_close) / prev_close) * 100
-            
-            # For Crypto, DXY UP = BAD (Bearish), DXY DOWN = GOOD (Bullish)
-            sentiment = "BULLISH" if change_pct < 0 else "BEARISH"
-            
-            return {
-                "price": current_price,
-                "change_pct": change_pct,
-                "sentiment": sentiment
-            }
-        except Exception as e:
-            # Fallback: Treat as Neutral to avoid breaking strategy
-            return {
-                "price": 0,
-                "change_pct": 0,
-                "sentiment": "NEUTRAL"
-            }
 
 if __name__ == "__main__":
     client = MacroClient()
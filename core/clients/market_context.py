@@ -0,0 +1,235 @@
+import os
+import abc
+import numpy as np
+
+# Non-kline inputs of HybridStrategy._calculate_signals(): Fear & Greed,
+# DXY trend, funding rate and BTC 24h change. Every getter takes `ts`, the
+# open time (ms) of the candle being evaluated; live providers ignore it.
+
+NEUTRAL_FNG = {"value": 50, "classification": "Neutral (Default)"}
+NEUTRAL_DXY = {"price": 0, "change_pct": 0, "sentiment": "NEUTRAL"}
+
+class MarketContextProvider(abc.ABC):
+    """
+    Interface for the market inputs the strategy reads besides klines.
+    """
+    @abc.abstractmethod
+    def get_fear_greed(self, ts=None):
+        """{"value": int, "classification": str}"""
+
+    @abc.abstractmethod
+    def get_dxy_trend(self, ts=None):
+        """{"price": float, "change_pct": float, "sentiment": "BULLISH" | "BEARISH" | "NEUTRAL"}"""
+
+    @abc.abstractmethod
+    def get_funding_rate(self, symbol, ts=None):
+        """Funding rate of a futures symbol such as SOL_USDT."""
+
+    @abc.abstractmethod
+    def get_btc_ticker_24h(self, ts=None):
+        """{"priceChangePercent": float, ...}"""
+
+class LiveMarketContext(MarketContextProvider):
+    """
+    Fetches every input from the exchange / public APIs at call time.
+    """
+    def __init__(self, client, futures_client, sentiment_engine, macro_client):
+        self.client = client
+        self.futures_client = futures_client
+        self.sentiment_engine = sentiment_engine
+        self.macro_client = macro_client
+
+    def get_fear_greed(self, ts=None):
+        return self.sentiment_engine.get_fear_greed_score()
+
+    def get_dxy_trend(self, ts=None):
+        return self.macro_client.get_dxy_trend()
+
+    def get_funding_rate(self, symbol, ts=None):
+        return self.futures_client.get_funding_rate(symbol)
+
+    def get_btc_ticker_24h(self, ts=None):
+        return self.client.get_ticker_24h("BTCUSDT")
+
+class SnapshotMarketContext(MarketContextProvider):
+    """
+    Inputs fetched once and served unchanged, e.g. one concurrent fetch per
+    signal evaluation or per multi-symbol scan.
+    """
+    def __init__(self, fng=None, dxy=None, funding_rates=None, btc_ticker=None):
+        self.fng = fng or dict(NEUTRAL_FNG)
+        self.dxy = dxy or dict(NEUTRAL_DXY)
+        self.funding_rates = funding_rates or {}
+        self.btc_ticker = btc_ticker or {"priceChangePercent": 0}
+
+    def get_fear_greed(self, ts=None):
+        return self.fng
+
+    def get_dxy_trend(self, ts=None):
+        return self.dxy
+
+    def get_funding_rate(self, symbol, ts=None):
+        return self.funding_rates.get(symbol, 0)
+
+    def get_btc_ticker_24h(self, ts=None):
+        return self.btc_ticker
+
+async def fetch_snapshot(context, futures_symbols=()):
+    """
+    Fetches Fear & Greed, DXY, the BTC 24h ticker and the funding rate of
+    each futures symbol (e.g. SOL_USDT) from `context` concurrently.
+    Returns a SnapshotMarketContext.
+    """
+    import asyncio
+    futures_symbols = list(futures_symbols)
+    results = await asyncio.gather(
+        asyncio.to_thread(context.get_fear_greed),
+        asyncio.to_thread(context.get_dxy_trend),
+        asyncio.to_thread(context.get_btc_ticker_24h),
+        *[asyncio.to_thread(context.get_funding_rate, s) for s in futures_symbols]
+    )
+    fng, dxy, btc_ticker = results[:3]
+    return SnapshotMarketContext(fng, dxy, dict(zip(futures_symbols, results[3:])), btc_ticker)
+
+def _to_ms(values):
+    """
+    Normalises epoch timestamps to milliseconds (Alternative.me uses seconds).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(values < 1e11, values * 1000, values)
+
+def _asof(times, ts):
+    """
+    Index of the last row with time <= ts (-1 if none). ts may be an array;
+    None means "latest".
+    """
+    if ts is None:
+        return len(times) - 1
+    return np.searchsorted(times, ts, side="right") - 1
+
+class HistoricalMarketContext(MarketContextProvider):
+    """
+    Time-indexed inputs loaded from local CSV files, so backtests make no
+    network calls and are reproducible. Each lookup returns the last value
+    known at `ts`; inputs without a file fall back to neutral values.
+
+    File formats (header row required):
+        fng_path:     timestamp,value,classification
+        dxy_path:     timestamp,price,change_pct
+        funding_path: timestamp,symbol,fundingRate   (symbol like SOL_USDT)
+        btc_path:     klines CSV as written by data_collector (time,...,close,...)
+    """
+    def __init__(self, fng_path=None, dxy_path=None, funding_path=None, btc_path=None):
+        self.fng = self.dxy = self.btc = None
+        self.funding = {}
+        if not (fng_path or dxy_path or funding_path or btc_path):
+            return
+
+        import pandas as pd
+
+        if fng_path:
+            df = pd.read_csv(fng_path).sort_values("timestamp")
+            self.fng = (_to_ms(df["timestamp"]), df["value"].to_numpy(dtype=np.float64),
+                        df["classification"].astype(str).to_numpy())
+        if dxy_path:
+            df = pd.read_csv(dxy_path).sort_values("timestamp")
+            self.dxy = (_to_ms(df["timestamp"]), df["price"].to_numpy(dtype=np.float64),
+                        df["change_pct"].to_numpy(dtype=np.float64))
+        if funding_path:
+            df = pd.read_csv(funding_path).sort_values("timestamp")
+            for symbol, rows in df.groupby("symbol"):
+                self.funding[symbol] = (_to_ms(rows["timestamp"]), rows["fundingRate"].to_numpy(dtype=np.float64))
+        if btc_path:
+            df = pd.read_csv(btc_path).sort_values("time")
+            self.btc = (_to_ms(df["time"]), df["close"].to_numpy(dtype=np.float64))
+
+    @classmethod
+    def from_dir(cls, path):
+        """
+        Loads fear_greed.csv, dxy.csv, funding_rate.csv and
+        BTCUSDT_15m_historical.csv from `path`, skipping missing files.
+        """
+        def existing(name):
+            full = os.path.join(path, name)
+            return full if os.path.exists(full) else None
+        return cls(existing("fear_greed.csv"), existing("dxy.csv"),
+                   existing("funding_rate.csv"), existing("BTCUSDT_15m_historical.csv"))
+
+    def get_fear_greed(self, ts=None):
+        if self.fng is None:
+            return dict(NEUTRAL_FNG)
+        i = _asof(self.fng[0], ts)
+        if i < 0:
+            return dict(NEUTRAL_FNG)
+        return {"value": int(self.fng[1][i]), "classification": self.fng[2][i]}
+
+    def get_dxy_trend(self, ts=None):
+        if self.dxy is None:
+            return dict(NEUTRAL_DXY)
+        i = _asof(self.dxy[0], ts)
+        if i < 0:
+            return dict(NEUTRAL_DXY)
+        change_pct = float(self.dxy[2][i])
+        return {
+            "price": float(self.dxy[1][i]),
+            "change_pct": change_pct,
+            # For Crypto, DXY UP = BAD (Bearish), DXY DOWN = GOOD (Bullish)
+            "sentiment": "BULLISH" if change_pct < 0 else "BEARISH"
+        }
+
+    def get_funding_rate(self, symbol, ts=None):
+        series = self.funding.get(symbol)
+        if series is None:
+            return 0
+        i = _asof(series[0], ts)
+        return float(series[1][i]) if i >= 0 else 0
+
+    def _btc_change(self, ts):
+        times, closes = self.btc
+        if ts is None:
+            ts = times[-1]
+        now = _asof(times, ts)
+        day_ago = _asof(times, np.asarray(ts, dtype=np.float64) - 86400000)
+        valid = (now >= 0) & (day_ago >= 0)
+        now = np.maximum(now, 0)
+        day_ago = np.maximum(day_ago, 0)
+        change = (closes[now] - closes[day_ago]) / closes[day_ago] * 100
+        return np.where(valid, change, 0.0)
+
+    def get_btc_ticker_24h(self, ts=None):
+        if self.btc is None:
+            return {"priceChangePercent": 0}
+        return {"priceChangePercent": float(self._btc_change(ts))}
+
+    def columns(self, times, symbol):
+        """
+        Per-bar arrays of every input for the given candle open times, in the
+        keyword form compute_signals() accepts.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        n = len(times)
+        fng = np.full(n, 50.0)
+        dxy_sentiment = np.full(n, "NEUTRAL", dtype=object)
+        funding = np.zeros(n)
+        btc_change = np.zeros(n)
+
+        if self.fng is not None:
+            i = _asof(self.fng[0], times)
+            fng = np.where(i >= 0, self.fng[1][np.maximum(i, 0)], 50.0)
+        if self.dxy is not None:
+            i = _asof(self.dxy[0], times)
+            change = self.dxy[2][np.maximum(i, 0)]
+            dxy_sentiment = np.where(i < 0, "NEUTRAL", np.where(change < 0, "BULLISH", "BEARISH"))
+        series = self.funding.get(symbol.replace("USDT", "_USDT"))
+        if series is not None:
+            i = _asof(series[0], times)
+            funding = np.where(i >= 0, series[1][np.maximum(i, 0)], 0.0)
+        if self.btc is not None:
+            btc_change = self._btc_change(times)
+
+        return {
+            "fng": fng,
+            "dxy_sentiment": dxy_sentiment,
+            "funding_rate": funding,
+            "btc_change": btc_change
+        }
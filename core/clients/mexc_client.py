@@ -1,16 +1,37 @@
 import os
-import time
 import hmac
+import threading
 import hashlib
-import requests
-import urllib3
-from dotenv import load_dotenv
+from core.clients import transport
+from core.clients.endpoint_health import EndpointHealth
+from core.clients.clock_sync import ClockSync
+from core.clients.env import load_env
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-load_dotenv()
+def checked_json(response, expect=list):
+    """
+    JSON body of a public MEXC read. Raises on a non-2xx status, an empty or
+    non-list body (expect=list) or an error body such as {"code": 429, "msg": ...}
+    (expect=dict), so EndpointHealth fails over to the next mirror and
+    scores the failure.
+    """
+    if not 200 <= response.status_code < 300:
+        raise RuntimeError(f"HTTP {response.status_code}")
+    data = response.json()
+    if expect is list and not (isinstance(data, list) and data):
+        raise ValueError(f"Unexpected response: {str(data)[:200]}")
+    if expect is dict and (not isinstance(data, dict) or ("code" in data and "symbol" not in data)):
+        raise ValueError(f"Unexpected response: {str(data)[:200]}")
+    return data
 
 class MEXCClient:
-    def __init__(self):
+    # Shared by all instances so every client learns which mirror is healthy
+    health = EndpointHealth()
+    # Shared server clock offset, created on the first signed request
+    clock = None
+    _clock_lock = threading.Lock()
+
+    def __init__(self, hedge_reads=None):
+        load_env()
         self.access_key = os.getenv('MEXC_ACCESS_KEY')
         self.secret_key = os.getenv('MEXC_SECRET_KEY')
         self.base_url = os.getenv('BASE_URL', 'https://api.mexc.com')
@@ -20,55 +41,67 @@ class MEXCClient:
             "https://api.mexc.so", 
             "https://api.coingecko.com/api/v3" # Fallback for public data only
         ]
+        # Race the second mirror on slow read-only calls (klines, 24h ticker)
+        if hedge_reads is None:
+            hedge_reads = os.getenv('MEXC_HEDGE_READS', '0') == '1'
+        self.hedge_reads = hedge_reads
 
-    def _safe_request(self, method, endpoint, params=None, headers=None):
+    def _safe_request(self, method, endpoint, params=None, headers=None, hedge=False):
         """
-        Robust request wrapper with rotation logic.
+        Robust request wrapper: MEXC mirrors in order of health (see
+        EndpointHealth), CoinGecko as a last resort for public prices.
+        hedge=True races a second mirror when the first is slow (GET only).
         """
-        for i, base_url in enumerate(self.endpoints):
+        def fetch(base_url):
+            url = f"{base_url}{endpoint}"
+            if method == "GET":
+                response = transport.get(url, params=params, headers=headers, verify=False, timeout=5)
+            else:
+                response = transport.post(url, headers=headers, verify=False, timeout=5)
+            return response.json()
+
+        try:
+            return self.health.call(fetch, self.endpoints[:2], hedge=hedge and method == "GET")
+        except Exception as e:
+            # print(f"\r⚠️ API Error: {str(e)}. Switching to fallback...", end="")
+            pass
+
+        for base_url in self.endpoints[2:]:
             try:
                 # Adjust for CoinGecko fallback on specific public endpoints
-                if "coingecko" in base_url:
-                    if "ticker/price" in endpoint or "klines" in endpoint:
-                        # Map to CoinGecko equivalent (Simplified)
-                        # Only supports simple price check for now
-                        symbol = params.get("symbol", "").replace("USDT", "").lower() if params else ""
-                        if not symbol: continue
-                        cg_url = f"{base_url}/simple/price?ids={symbol}&vs_currencies=usd"
-                        resp = requests.get(cg_url, verify=False, timeout=5)
-                        data = resp.json()
-                        if "ticker" in endpoint:
-                            # Mimic MEXC response structure
-                            return {"symbol": params.get("symbol"), "price": str(data.get(symbol, {}).get("usd", 0))}
-                        continue # Skip others for CG
-                    else:
-                        continue # Skip private/complex endpoints for CG
-
-                url = f"{base_url}{endpoint}"
-                if method == "GET":
-                    response = requests.get(url, params=params, headers=headers, verify=False, timeout=5)
-                else:
-                    response = requests.post(url, headers=headers, verify=False, timeout=5)
-                
-                return response.json()
-                
-            except Exception as e:
-                # print(f"\r⚠️ API Error ({base_url}): {str(e)}. Switching...", end="")
-                time.sleep(1)
+                if "ticker/price" in endpoint or "klines" in endpoint:
+                    # Map to CoinGecko equivalent (Simplified)
+                    # Only supports simple price check for now
+                    symbol = params.get("symbol", "").replace("USDT", "").lower() if params else ""
+                    if not symbol: continue
+                    cg_url = f"{base_url}/simple/price?ids={symbol}&vs_currencies=usd"
+                    resp = transport.get(cg_url, verify=False, timeout=5)
+                    data = resp.json()
+                    if "ticker" in endpoint:
+                        # Mimic MEXC response structure
+                        return {"symbol": params.get("symbol"), "price": str(data.get(symbol, {}).get("usd", 0))}
+            except Exception:
                 continue
         
         # If all fail
         return {"error": "All endpoints failed"}
 
-    def _get_server_time(self):
+    def _fetch_server_time(self):
         # Time is critical, only trust MEXC
-        for base in self.endpoints[:2]:
-            try:
-                url = f"{base}/api/v3/time"
-                response = requests.get(url, verify=False, timeout=5)
-                return response.json()['serverTime']
-            except: continue
-        return int(time.time() * 1000)
+        def fetch(base):
+            response = transport.get(f"{base}/api/v3/time", verify=False, timeout=5)
+            return response.json()['serverTime']
+        return self.health.call(fetch, self.endpoints[:2])
+
+    def _get_server_time(self):
+        """
+        Server time estimate from the shared ClockSync (no round trip per request).
+        """
+        if MEXCClient.clock is None:
+            with MEXCClient._clock_lock:
+                if MEXCClient.clock is None:
+                    MEXCClient.clock = ClockSync(self._fetch_server_time)
+        return MEXCClient.clock.now_ms()
 
     def _sign(self, query_string):
         return hmac.new(
@@ -108,15 +141,15 @@ class MEXCClient:
             'X-MEXC-APIKEY': self.access_key
         }
         
-        # Order placement MUST try reliable endpoints first
-        for base in self.endpoints[:2]:
-            try: 
-                url = f"{base}{endpoint}?{query_string}&signature={signature}"
-                response = requests.post(url, headers=headers, verify=False, timeout=5)
-                return response.json()
-            except: continue
-            
-        return {"error": "Failed to place order (Network Limit)"}
+        # Order placement MUST try reliable endpoints first (healthiest first, never hedged)
+        def send(base):
+            url = f"{base}{endpoint}?{query_string}&signature={signature}"
+            response = transport.post(url, headers=headers, verify=False, timeout=5)
+            return response.json()
+        try:
+            return self.health.call(send, self.endpoints[:2])
+        except Exception:
+            return {"error": "Failed to place order (Network Limit)"}
 
     def get_account_info(self):
         if not self.access_key or not self.secret_key:
@@ -136,18 +169,19 @@ class MEXCClient:
             'X-MEXC-APIKEY': self.access_key
         }
         
-        for base in self.endpoints[:2]:
-            try:
-                url = f"{base}{endpoint}?{query_string}&signature={signature}"
-                response = requests.get(url, headers=headers, verify=False, timeout=5)
-                return response.json()
-            except: continue
-        return {"error": "Failed to fetch account"}
+        def fetch(base):
+            url = f"{base}{endpoint}?{query_string}&signature={signature}"
+            response = transport.get(url, headers=headers, verify=False, timeout=5, weight=10) # account: weight 10
+            return response.json()
+        try:
+            return self.health.call(fetch, self.endpoints[:2])
+        except Exception:
+            return {"error": "Failed to fetch account"}
 
     def get_ticker(self, symbol="BTCUSDT"):
         endpoint = "/api/v3/ticker/price"
         params = {"symbol": symbol}
-        return self._safe_request("GET", endpoint, params)
+        return self._safe_request("GET", endpoint, params, hedge=self.hedge_reads)
 
     def get_klines(self, symbol, interval, limit=500):
         """
@@ -161,18 +195,15 @@ class MEXCClient:
             "limit": limit
         }
         # KLines is strict on format, avoid CoinGecko for now as it's complex to map
-        for base in self.endpoints[:2]:
-            try:
-                url = f"{base}{endpoint}"
-                # print(f"DEBUG: Fetching KLines from {url}") 
-                response = requests.get(url, params=params, verify=False, timeout=10)
-                data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    return data
-            except Exception as e:
-                # print(f"DEBUG: KLines error {base}: {e}")
-                continue
-        return []
+        def fetch(base):
+            url = f"{base}{endpoint}"
+            response = transport.get(url, params=params, verify=False, timeout=10)
+            return checked_json(response)
+        try:
+            return self.health.call(fetch, self.endpoints[:2], hedge=self.hedge_reads)
+        except Exception as e:
+            # print(f"DEBUG: KLines error: {e}")
+            return []
 
     def get_ticker_24h(self, symbol):
         """
@@ -181,13 +212,35 @@ class MEXCClient:
         endpoint = "/api/v3/ticker/24hr"
         params = {"symbol": symbol}
         # Ticker 24h also strict
-        for base in self.endpoints[:2]:
-            try:
-                url = f"{base}{endpoint}"
-                response = requests.get(url, params=params, verify=False, timeout=5)
-                return response.json()
-            except: continue
-        return {}
+        def fetch(base):
+            url = f"{base}{endpoint}"
+            response = transport.get(url, params=params, verify=False, timeout=5)
+            return checked_json(response, expect=dict)
+        try:
+            return self.health.call(fetch, self.endpoints[:2], hedge=self.hedge_reads)
+        except Exception:
+            return {}
+
+    def get_all_tickers_24h(self):
+        """
+        24-hour statistics of every symbol in one call (weight 40). [] on failure.
+        """
+        return self._get_all("/api/v3/ticker/24hr", weight=40)
+
+    def get_all_book_tickers(self):
+        """
+        Best bid/ask of every symbol in one call. [] on failure.
+        """
+        return self._get_all("/api/v3/ticker/bookTicker", weight=1)
+
+    def _get_all(self, endpoint, weight):
+        def fetch(base):
+            response = transport.get(f"{base}{endpoint}", verify=False, timeout=10, weight=weight)
+            return checked_json(response)
+        try:
+            return self.health.call(fetch, self.endpoints[:2])
+        except Exception:
+            return []
 
 if __name__ == "__main__":
     client = MEXCClient()
@@ -1,29 +1,41 @@
 import os
-import time
 import hmac
+import threading
 import hashlib
-import requests
+from core.clients import transport
+from core.clients.clock_sync import ClockSync
 import urllib.parse
-from dotenv import load_dotenv
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-load_dotenv()
+from core.clients.env import load_env
 
 class MEXCFuturesClient:
     """
     Client for MEXC Futures (Contract) API.
     Base URL: https://contract.mexc.com
     """
+    # Shared server clock offset, created on the first signed request
+    clock = None
+    _clock_lock = threading.Lock()
+
     def __init__(self):
+        load_env()
         self.access_key = os.getenv('MEXC_ACCESS_KEY')
         self.secret_key = os.getenv('MEXC_SECRET_KEY')
         self.base_url = "https://contract.mexc.com"
 
-    def _get_server_time(self):
+    def _fetch_server_time(self):
         url = f"{self.base_url}/api/v1/contract/ping"
-        response = requests.get(url, verify=False)
-        return response.json().get('data', int(time.time() * 1000))
+        response = transport.get(url, verify=False, timeout=5)
+        return response.json()['data']
+
+    def _get_server_time(self):
+        """
+        Server time estimate from the shared ClockSync (no round trip per request).
+        """
+        if MEXCFuturesClient.clock is None:
+            with MEXCFuturesClient._clock_lock:
+                if MEXCFuturesClient.clock is None:
+                    MEXCFuturesClient.clock = ClockSync(self._fetch_server_time)
+        return MEXCFuturesClient.clock.now_ms()
 
     def _sign(self, timestamp, body_str=""):
         # MEXC Contract V1 signature: apiKey + reqTime + body
@@ -38,7 +50,7 @@ class MEXCFuturesClient:
     def get_account_assets(self):
         """Get futures account assets (private)."""
         endpoint = "/api/v1/private/account/assets"
-        timestamp = int(time.time() * 1000)
+        timestamp = self._get_server_time()
         
         signature = self._sign(timestamp)
         
@@ -49,13 +61,13 @@ class MEXCFuturesClient:
         }
         
         url = f"{self.base_url}{endpoint}"
-        response = requests.get(url, headers=headers, verify=False)
+        response = transport.get(url, headers=headers, verify=False)
         return response.json()
 
     def get_positions(self, symbol=None):
         """Get open positions (private)."""
         endpoint = "/api/v1/private/position/open_positions"
-        timestamp = int(time.time() * 1000)
+        timestamp = self._get_server_time()
         params = {}
         if symbol:
             params["symbol"] = symbol
@@ -74,13 +86,13 @@ class MEXCFuturesClient:
             url += f"?{params_str}"
             
         print(f"DEBUG GET: {url}")
-        response = requests.get(url, headers=headers, verify=False)
+        response = transport.get(url, headers=headers, verify=False)
         return response.json()
 
     def change_leverage(self, symbol, leverage, side=None):
         """Change leverage for a symbol (private)."""
         endpoint = "/api/v1/private/position/change_leverage"
-        timestamp = int(time.time() * 1000)
+        timestamp = self._get_server_time()
         
         params = {
             "symbol": symbol,
@@ -102,7 +114,7 @@ class MEXCFuturesClient:
         
         url = f"{self.base_url}{endpoint}"
         print(f"DEBUG POST: {url} | Body: {body_str}")
-        response = requests.post(url, data=body_str, headers=headers, verify=False)
+        response = transport.post(url, data=body_str, headers=headers, verify=False)
         return response.json()
 
     def create_order(self, symbol, side, order_type, vol, leverage, price=None, open_type=1):
@@ -113,7 +125,7 @@ class MEXCFuturesClient:
         open_type: 1=Isolated, 2=Cross
         """
         endpoint = "/api/v1/private/order/create"
-        timestamp = int(time.time() * 1000)
+        timestamp = self._get_server_time()
         
         params = {
             "symbol": symbol,
@@ -138,7 +150,7 @@ class MEXCFuturesClient:
         
         url = f"{self.base_url}{endpoint}"
         print(f"DEBUG POST: {url} | Body: {body_str}")
-        response = requests.post(url, data=body_str, headers=headers, verify=False)
+        response = transport.post(url, data=body_str, headers=headers, verify=False)
         return response.json()
 
     def get_funding_rate(self, symbol):
@@ -147,7 +159,7 @@ class MEXCFuturesClient:
         endpoint = f"/api/v1/contract/funding_rate/{symbol}"
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.get(url, verify=False, timeout=10)
+            response = transport.get(url, verify=False, timeout=10)
             data = response.json()
             if data.get('success'):
                 return data['data'].get('fundingRate', 0)
@@ -156,6 +168,22 @@ class MEXCFuturesClient:
             print(f"⚠️ Error fetching funding rate: {e}")
             return 0
 
+    def get_funding_rates(self):
+        """
+        Funding rate of every contract from one ticker call: {"SOL_USDT": rate, ...}
+        ({} on failure).
+        """
+        url = f"{self.base_url}/api/v1/contract/ticker"
+        try:
+            response = transport.get(url, verify=False, timeout=10)
+            data = response.json()
+            if data.get('success'):
+                return {t['symbol']: t.get('fundingRate', 0) for t in data.get('data', [])}
+            return {}
+        except Exception as e:
+            print(f"⚠️ Error fetching funding rates: {e}")
+            return {}
+
 if __name__ == "__main__":
     client = MEXCFuturesClient()
     print("Testing Futures Account Assets:")
@@ -0,0 +1,222 @@
+import asyncio
+import inspect
+import json
+import time
+from core.logic.candle_store import CandleStore
+
+# WebSocket market data for MEXC spot: kline and book-ticker channels.
+# MEXCStream talks to the exchange (needs the optional `websockets` package);
+# ReplayStream is a local stand-in that replays stored klines as the same
+# messages, for tests and offline runs. StreamingFeed consumes either one,
+# keeps a CandleStore up to date and calls back on every candle close.
+
+WS_URL = "wss://wbs.mexc.com/ws"
+
+# REST interval -> WebSocket kline interval
+INTERVALS = {
+    "1m": "Min1", "5m": "Min5", "15m": "Min15", "30m": "Min30",
+    "60m": "Min60", "4h": "Hour4", "1d": "Day1", "1M": "Month1"
+}
+
+def kline_channel(symbol, interval):
+    return f"spot@public.kline.v3.api@{symbol}@{INTERVALS[interval]}"
+
+def ticker_channel(symbol):
+    return f"spot@public.bookTicker.v3.api@{symbol}"
+
+def parse_message(msg):
+    """
+    Parses a raw (str or dict) MEXC push message.
+    Returns ("kline", symbol, [time_ms, open, high, low, close, volume]),
+    ("ticker", symbol, {"bid": float, "ask": float, ...}) or None for
+    anything else (subscription acks, pongs).
+    """
+    if isinstance(msg, (str, bytes)):
+        try:
+            msg = json.loads(msg)
+        except ValueError:
+            return None
+    channel = msg.get("c", "")
+    data = msg.get("d") or {}
+    symbol = msg.get("s")
+    if ".kline." in channel and "k" in data:
+        k = data["k"]
+        # Window start is in seconds on the stream, REST klines use ms
+        return ("kline", symbol, [int(k["t"]) * 1000, float(k["o"]), float(k["h"]),
+                                  float(k["l"]), float(k["c"]), float(k["v"])])
+    if ".bookTicker." in channel:
+        return ("ticker", symbol, {
+            "bid": float(data.get("b", 0)),
+            "bid_qty": float(data.get("B", 0)),
+            "ask": float(data.get("a", 0)),
+            "ask_qty": float(data.get("A", 0)),
+            "time": msg.get("t")
+        })
+    return None
+
+class MEXCStream:
+    """
+    Live MEXC spot WebSocket subscription with keep-alive pings and reconnects.
+    """
+    def __init__(self, symbols, interval="15m", tickers=True, url=WS_URL, ping_interval=20):
+        self.symbols = list(symbols)
+        self.interval = interval
+        self.url = url
+        self.ping_interval = ping_interval
+        self.channels = [kline_channel(s, interval) for s in self.symbols]
+        if tickers:
+            self.channels += [ticker_channel(s) for s in self.symbols]
+
+    async def _ping(self, ws):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            await ws.send(json.dumps({"method": "PING"}))
+
+    async def messages(self):
+        """
+        Yields raw messages forever, reconnecting after errors.
+        """
+        try:
+            import websockets
+        except ImportError:
+            raise ImportError("Live streaming needs the 'websockets' package: pip install websockets")
+
+        while True:
+            try:
+                async with websockets.connect(self.url, ping_interval=None) as ws:
+                    # MEXC allows at most 30 channels per subscription message
+                    for i in range(0, len(self.channels), 30):
+                        await ws.send(json.dumps({"method": "SUBSCRIPTION", "params": self.channels[i:i + 30]}))
+                    pinger = asyncio.create_task(self._ping(ws))
+                    try:
+                        async for raw in ws:
+                            yield raw
+                    finally:
+                        pinger.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Stream disconnected ({e}). Reconnecting...")
+                await asyncio.sleep(1)
+
+class ReplayStream:
+    """
+    Local stand-in for MEXCStream: replays klines (per symbol) as MEXC kline
+    push messages. Each candle is sent `updates` times with the close moving
+    from open to its final value, like a live forming candle.
+    delay: seconds to sleep between messages (0 = as fast as possible).
+    """
+    def __init__(self, klines_by_symbol, interval="15m", updates=3, delay=0):
+        self.klines_by_symbol = klines_by_symbol
+        self.symbols = list(klines_by_symbol)
+        self.interval = interval
+        self.updates = max(1, updates)
+        self.delay = delay
+
+    def _message(self, symbol, k, close):
+        o, h, l = float(k[1]), float(k[2]), float(k[3])
+        return json.dumps({
+            "c": kline_channel(symbol, self.interval),
+            "d": {"k": {"t": int(k[0]) // 1000, "o": str(o), "h": str(max(h, close)), "l": str(min(l, close)),
+                        "c": str(close), "v": str(k[5]), "i": INTERVALS[self.interval]},
+                  "e": "spot@public.kline.v3.api"},
+            "s": symbol,
+            "t": int(time.time() * 1000)
+        })
+
+    async def messages(self):
+        length = max(len(v) for v in self.klines_by_symbol.values())
+        for i in range(length):
+            for symbol, klines in self.klines_by_symbol.items():
+                if i >= len(klines):
+                    continue
+                k = klines[i]
+                o, c = float(k[1]), float(k[4])
+                for u in range(1, self.updates + 1):
+                    yield self._message(symbol, k, o + (c - o) * u / self.updates)
+                    if self.delay:
+                        await asyncio.sleep(self.delay)
+                    else:
+                        await asyncio.sleep(0)
+
+class StreamingFeed:
+    """
+    Feeds stream messages into a CandleStore and calls
+    on_candle_close(symbol, klines) whenever a candle closes, where `klines`
+    are the stored candles up to and including the closed one.
+    Callbacks run as background tasks (plain functions in a worker thread),
+    so blocking strategy code does not stall the socket and symbols closing
+    on the same boundary are handled concurrently; each symbol's callbacks
+    still run in candle order.
+
+    client: anything with get_klines(symbol, interval, limit) (e.g.
+    MEXCClient). When given, each symbol's buffer is filled from REST before
+    the stream is read, so signals start with the first close instead of
+    after `maxlen` candles of warm-up.
+    """
+    def __init__(self, source, on_candle_close=None, store=None, client=None):
+        self.source = source
+        self.on_candle_close = on_candle_close
+        self.store = store or CandleStore()
+        self.client = client
+        self.tickers = {}
+        self._pending = {} # symbol -> latest callback task
+
+    async def warm_up(self, symbols=None):
+        """
+        Loads the last `store.maxlen` REST candles of every symbol, concurrently.
+        """
+        symbols = symbols or getattr(self.source, "symbols", [])
+        interval = self.source.interval
+
+        async def load(symbol):
+            klines = await asyncio.to_thread(self.client.get_klines, symbol, interval, self.store.maxlen)
+            for k in klines or []:
+                self.store.upsert(symbol, [int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5])])
+            return len(klines or [])
+
+        counts = await asyncio.gather(*[load(s) for s in symbols], return_exceptions=True)
+        for symbol, count in zip(symbols, counts):
+            if isinstance(count, Exception):
+                print(f"⚠️ [{symbol}] REST warm-up failed: {count}")
+
+    async def _dispatch(self, symbol, klines, previous):
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            if inspect.iscoroutinefunction(self.on_candle_close):
+                await self.on_candle_close(symbol, klines)
+            else:
+                await asyncio.to_thread(self.on_candle_close, symbol, klines)
+        except Exception as e:
+            print(f"⚠️ [{symbol}] Candle close handler failed: {e}")
+
+    def _schedule(self, symbol, klines):
+        if not self.on_candle_close:
+            return
+        previous = self._pending.get(symbol)
+        self._pending[symbol] = asyncio.create_task(self._dispatch(symbol, klines, previous))
+
+    async def run(self):
+        if self.client is not None:
+            await self.warm_up()
+        try:
+            await self._consume()
+        finally:
+            # Let callbacks already scheduled finish (e.g. at the end of a replay)
+            pending = [t for t in self._pending.values() if not t.done()]
+            if pending:
+                await asyncio.wait(pending)
+
+    async def _consume(self):
+        async for raw in self.source.messages():
+            parsed = parse_message(raw)
+            if parsed is None:
+                continue
+            kind, symbol, payload = parsed
+            if kind == "ticker":
+                self.tickers[symbol] = payload
+                continue
+            closed = self.store.upsert(symbol, payload)
+            if closed is not None:
+                self._schedule(symbol, self.store.klines(symbol, include_forming=False))
@@ -0,0 +1,111 @@
+import time
+import threading
+
+# Per-host token buckets shared by every client (through core.clients.transport).
+# Limits follow each API's published quota; a request waits only as long as
+# its host's bucket needs, instead of a fixed worst-case sleep.
+
+# host: (tokens refilled per second, bucket size)
+DEFAULT_LIMITS = {
+    "api.mexc.com": (50.0, 50),            # 500 weight / 10 s per IP (spot v3)
+    "api.mexc.so": (50.0, 50),
+    "contract.mexc.com": (10.0, 20),       # 20 requests / 2 s
+    "api.coingecko.com": (0.5, 5),         # 30 calls / min (public demo tier)
+    "api.alternative.me": (1.0, 10),       # 60 requests / min
+    "query1.finance.yahoo.com": (2.0, 5),  # unofficial endpoint, kept gentle
+}
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.acquired = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens):
+        """
+        Takes `tokens` (the balance may go negative, which queues later
+        callers behind this one) and returns how long the caller must wait.
+        During a pause `updated` lies in the future: nothing refills until
+        then and waits count from that point.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+            self.updated = max(self.updated, now)
+            self.tokens -= tokens
+            wait = max(0.0, self.updated - now + max(0.0, -self.tokens) / self.rate)
+            self.acquired += 1
+            if wait > 0:
+                self.throttled += 1
+                self.throttled_seconds += wait
+            return wait
+
+    def acquire(self, tokens=1):
+        """
+        Blocks until `tokens` are available. Returns the seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds):
+        """
+        Blocks the bucket for `seconds` (e.g. after an HTTP 429) and empties
+        it; it refills only from the end of the pause, so callers queued
+        meanwhile leave one by one at `rate`, not in one burst.
+        """
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.updated = max(self.updated, self.blocked_until)
+            self.tokens = 0.0
+
+class RateLimiter:
+    """
+    Registry of token buckets keyed by host. Hosts without a configured
+    limit are not throttled.
+    """
+    def __init__(self, limits=None):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host, rate, capacity):
+        with self._lock:
+            self.limits[host] = (rate, capacity)
+            self.buckets.pop(host, None)
+
+    def bucket(self, host):
+        bucket = self.buckets.get(host)
+        if bucket is None and host in self.limits:
+            with self._lock:
+                bucket = self.buckets.get(host)
+                if bucket is None:
+                    bucket = self.buckets[host] = TokenBucket(*self.limits[host])
+        return bucket
+
+    def acquire(self, host, weight=1):
+        bucket = self.bucket(host)
+        return bucket.acquire(weight) if bucket else 0.0
+
+    def pause(self, host, seconds):
+        bucket = self.bucket(host)
+        if bucket:
+            bucket.pause(seconds)
+
+    def stats(self):
+        """
+        {host: {"requests": int, "throttled": int, "throttled_seconds": float}}
+        """
+        return {
+            host: {"requests": b.acquired, "throttled": b.throttled, "throttled_seconds": round(b.throttled_seconds, 3)}
+            for host, b in list(self.buckets.items())
+        }
+
+limiter = RateLimiter()
@@ -1,7 +1,4 @@
-import requests
-import urllib3
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from core.clients import transport
 
 class FearGreedClient:
     """
@@ -18,18 +15,19 @@ class FearGreedClient:
                 "value": str,
                 "value_classification": str,
                 "timestamp": str,
-                "time_until_update": str
+                "time_until_update": int (seconds until the next value)
             }
         """
         try:
-            response = requests.get(self.base_url, verify=False, timeout=10)
+            response = transport.get(self.base_url, verify=False, timeout=10)
             data = response.json()
             if "data" in data and len(data["data"]) > 0:
                 result = data["data"][0]
                 return {
                     "value": int(result["value"]),
                     "classification": result["value_classification"],
-                    "timestamp": result["timestamp"]
+                    "timestamp": result["timestamp"],
+                    "time_until_update": int(result.get("time_until_update") or 0)
                 }
         except Exception as e:
             print(f"⚠️ Error fetching Fear & Greed Index: {e}")
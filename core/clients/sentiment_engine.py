@@ -1,12 +1,20 @@
-import re
 from core.clients.sentiment_api import FearGreedClient
 from core.clients.gemini_client import GeminiClient
+from core.clients.ttl_cache import TTLCache
+from core.logic.keyword_matcher import KeywordMatcher
+
+def _fng_ttl(fng):
+    # The index is published once a day; cache it until the next update
+    return min(max(fng.get("time_until_update") or 3600, 60), 86400)
 
 class SentimentEngine:
     """
     A simple sentiment engine that analyzes news text for market signals.
     """
-    def __init__(self):
+    # Shared by every engine (and, with QUANT_CACHE_DIR, every process)
+    fng_cache = TTLCache("fear_greed", ttl=_fng_ttl, stale_ttl=3600)
+
+    def __init__(self, keyword_weights=None):
         self.bullish_keywords = [
             'bullish', 'surge', 'pump', 'breakout', 'growth', 'partnership', 
             'adoption', 'listing', 'buy', 'positive', 'green', 'moon'
@@ -15,23 +23,39 @@ class SentimentEngine:
             'bearish', 'drop', 'dump', 'crash', 'negative', 'sell', 'red', 
             'scam', 'hack', 'regulation', 'ban', 'fud'
         ]
+        # Extra {term: weight} entries (multi-word allowed, negative = bearish)
+        weights = {w: 1.0 for w in self.bullish_keywords}
+        weights.update({w: -1.0 for w in self.bearish_keywords})
+        weights.update(keyword_weights or {})
+        self.matcher = KeywordMatcher(weights)
         self.fng_client = FearGreedClient()
-        self.gemini_client = GeminiClient()
+        self._gemini_client = None
+
+    @property
+    def gemini_client(self):
+        """
+        Built on first use, so engines that never see headlines skip the Gemini SDK.
+        """
+        if self._gemini_client is None:
+            self._gemini_client = GeminiClient()
+        return self._gemini_client
+
+    @gemini_client.setter
+    def gemini_client(self, client):
+        self._gemini_client = client
 
     def analyze_text(self, text):
         """
         Analyzes the sentiment of a given text.
         Returns a score between -1 (highly bearish) and 1 (highly bullish).
         """
-        text = text.lower()
-        bull_count = sum(len(re.findall(f'\\b{word}\\b', text)) for word in self.bullish_keywords)
-        bear_count = sum(len(re.findall(f'\\b{word}\\b', text)) for word in self.bearish_keywords)
-        
-        total = bull_count + bear_count
-        if total == 0:
-            return 0
-        
-        return (bull_count - bear_count) / total
+        return self.matcher.score(text)
+
+    def analyze_batch(self, texts):
+        """
+        Keyword scores for many texts in one pass (e.g. news backfills).
+        """
+        return self.matcher.score_batch(texts)
 
     def get_market_sentiment(self, symbol, news_headlines):
         """
@@ -44,8 +68,7 @@ class SentimentEngine:
         gemini_score = self.gemini_client.analyze_sentiment(news_headlines)
         
         # 2. Headline Sentiment (Keyword Fallback)
-        keyword_scores = [self.analyze_text(h) for h in news_headlines]
-        avg_keyword_score = sum(keyword_scores) / len(keyword_scores)
+        avg_keyword_score = float(self.analyze_batch(news_headlines).mean())
         
         # Hybrid Score (60% AI, 40% Keyword)
         avg_score = (gemini_score * 0.6) + (avg_keyword_score * 0.4)
@@ -61,9 +84,9 @@ class SentimentEngine:
         """
         Returns a consolidated market sentiment score using external API.
         """
-        fng = self.fng_client.get_fng_index()
+        fng = self.fng_cache.get("latest", self.fng_client.get_fng_index)
         if fng:
-            return fng # Returns dict with value and classification
+            return dict(fng) # Returns dict with value and classification
         return {"value": 50, "classification": "Neutral (Default)"}
 
 if __name__ == "__main__":
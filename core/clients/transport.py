@@ -0,0 +1,119 @@
+import os
+import threading
+from urllib.parse import urlsplit
+from core.clients.rate_limiter import limiter
+from core.clients.env import load_env
+
+# Shared HTTP transport for every client in core/clients.
+# One requests.Session keeps a keep-alive connection pool per host, so
+# repeated calls to MEXC, CoinGecko, Yahoo and Alternative.me skip the
+# TCP+TLS handshake after the first request.
+#
+# Pool sizes can be set with HTTP_POOL_CONNECTIONS (number of hosts kept
+# pooled) and HTTP_POOL_MAXSIZE (keep-alive connections per host), or at
+# runtime with configure(). requests is imported when the first session is
+# built, so importing a client does not pay for it.
+#
+# Every request also takes a token from its host's bucket in
+# core.clients.rate_limiter (weight= sets the cost for weighted endpoints),
+# so callers never need their own sleeps. An HTTP 429 pauses the host's
+# bucket for Retry-After seconds.
+
+RETRY_AFTER_DEFAULT = 5
+
+_lock = threading.Lock()
+_session = None
+_pool_connections = None
+_pool_maxsize = None
+
+def _build_session():
+    import requests
+    import urllib3
+    from requests.adapters import HTTPAdapter
+    global _pool_connections, _pool_maxsize
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    load_env()
+    _pool_connections = _pool_connections or int(os.getenv("HTTP_POOL_CONNECTIONS", 10))
+    _pool_maxsize = _pool_maxsize or int(os.getenv("HTTP_POOL_MAXSIZE", 10))
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=_pool_connections, pool_maxsize=_pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_session():
+    """
+    Returns the process-wide pooled session, creating it on first use.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+def configure(pool_connections=None, pool_maxsize=None):
+    """
+    Changes pool sizes. Existing pooled connections are closed.
+    """
+    global _session, _pool_connections, _pool_maxsize
+    with _lock:
+        if pool_connections:
+            _pool_connections = int(pool_connections)
+        if pool_maxsize:
+            _pool_maxsize = int(pool_maxsize)
+        if _session is not None:
+            _session.close()
+        _session = _build_session()
+
+def _retry_after(response):
+    try:
+        return float(response.headers.get("Retry-After", RETRY_AFTER_DEFAULT))
+    except (TypeError, ValueError):
+        return RETRY_AFTER_DEFAULT
+
+def request(method, url, weight=1, **kwargs):
+    host = urlsplit(url).hostname
+    limiter.acquire(host, weight)
+    response = get_session().request(method, url, **kwargs)
+    if response.status_code == 429:
+        limiter.pause(host, _retry_after(response))
+    return response
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+def throttle_stats():
+    """
+    Per-host rate limiter counters:
+        {host: {"requests": int, "throttled": int, "throttled_seconds": float}}
+    """
+    return limiter.stats()
+
+def stats():
+    """
+    Per-host connection counters:
+        {host: {"requests": int, "connections": int, "reused": int}}
+    `connections` is the number of new TCP connections opened; every other
+    request went out on a kept-alive one.
+    """
+    result = {}
+    session = _session
+    if session is None:
+        return result
+    for adapter in set(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.host}:{pool.port}" if pool.port else pool.host
+            entry = result.setdefault(host, {"requests": 0, "connections": 0, "reused": 0})
+            entry["requests"] += pool.num_requests
+            entry["connections"] += pool.num_connections
+            entry["reused"] = max(0, entry["requests"] - entry["connections"])
+    return result
@@ -0,0 +1,143 @@
+import os
+import json
+import time
+import threading
+from core.clients.env import cache_dir
+
+# Small TTL cache for slow-moving market inputs (Fear & Greed, DXY).
+# Values are kept in-process and, when QUANT_CACHE_DIR is set (or cache_dir
+# is passed), also in <cache_dir>/<name>.json so several processes share one
+# fetch. Expired values are still served for `stale_ttl` seconds while a
+# background thread refreshes them (stale-while-revalidate); past that the
+# caller fetches synchronously. Concurrent misses on a key share one fetch.
+
+class TTLCache:
+    def __init__(self, name, ttl, stale_ttl=0, cache_dir=None):
+        self.name = name
+        self.ttl = ttl # seconds, or callable(value) -> seconds
+        self.stale_ttl = stale_ttl
+        self._cache_dir = cache_dir
+        self.entries = {} # key -> {"value": ..., "fetched_at": float, "expires_at": float}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._refreshing = set()
+
+    @property
+    def cache_dir(self):
+        # Read at use time: caches are built at import, before .env is loaded
+        if self._cache_dir:
+            return self._cache_dir
+        return cache_dir()
+
+    @property
+    def path(self):
+        return os.path.join(self.cache_dir, f"{self.name}.json") if self.cache_dir else None
+
+    def _load_disk(self, key):
+        if not self.path:
+            return None
+        try:
+            with open(self.path) as f:
+                return json.load(f).get(key)
+        except (OSError, ValueError):
+            return None
+
+    def _save_disk(self, key, entry):
+        if not self.path:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            data[key] = entry
+            tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path) # atomic, readers never see a partial file
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Cache write failed ({self.name}): {e}")
+
+    def _lookup(self, key):
+        """
+        Newest entry for `key` from memory or disk (another process may have refreshed it).
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry["expires_at"] <= time.time():
+            disk = self._load_disk(key)
+            if disk and (entry is None or disk["fetched_at"] > entry["fetched_at"]):
+                entry = self.entries[key] = disk
+        return entry
+
+    def _fetch(self, key, fetch):
+        value = fetch()
+        if value is None:
+            return None
+        ttl = self.ttl(value) if callable(self.ttl) else self.ttl
+        now = time.time()
+        entry = {"value": value, "fetched_at": now, "expires_at": now + ttl}
+        self.entries[key] = entry
+        self._save_disk(key, entry)
+        return entry
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _refresh(self, key, fetch):
+        try:
+            with self._key_lock(key):
+                self._fetch(key, fetch)
+        except Exception as e:
+            print(f"⚠️ Background refresh failed ({self.name}): {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _refresh_in_background(self, key, fetch):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(target=self._refresh, args=(key, fetch), name=f"cache-{self.name}", daemon=True).start()
+
+    def get(self, key, fetch):
+        """
+        Returns the cached value for `key`, calling fetch() when it is missing
+        or too stale. fetch() may raise or return None to signal failure; the
+        last known value is then returned if there is one, else None.
+        """
+        entry = self._lookup(key)
+        now = time.time()
+        if entry is not None and now < entry["expires_at"]:
+            self.hits += 1
+            return entry["value"]
+        if entry is not None and now < entry["expires_at"] + self.stale_ttl:
+            self.hits += 1
+            self._refresh_in_background(key, fetch)
+            return entry["value"]
+
+        with self._key_lock(key):
+            # Another thread may have fetched while we waited for the lock
+            entry = self._lookup(key)
+            if entry is not None and time.time() < entry["expires_at"]:
+                self.hits += 1
+                return entry["value"]
+            self.misses += 1
+            try:
+                fresh = self._fetch(key, fetch)
+            except Exception as e:
+                print(f"⚠️ Fetch failed ({self.name}): {e}")
+                fresh = None
+        if fresh is not None:
+            return fresh["value"]
+        return entry["value"] if entry is not None else None
+
+    def clear(self):
+        self.entries.clear()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
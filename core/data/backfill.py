@@ -0,0 +1,147 @@
+import os
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from core.clients import transport
+from core.data.ohlcv_store import OHLCVStore, INTERVAL_MS
+
+# Historical kline backfill into the OHLCV store.
+# The requested range is split into chunks of `chunk_candles` candles that
+# are fetched concurrently (the shared transport keeps them within MEXC's
+# rate limit). Chunks are appended strictly in time order, so the store
+# never has a hole before its last candle and a new run simply resumes
+# from the last saved candle. A start before the first stored candle
+# deepens the history: that range is fetched into a scratch store and
+# prepended once it is complete.
+
+MAX_LIMIT = 1000 # MEXC /api/v3/klines maximum
+
+def fetch_klines_range(symbol, interval, start_ms, end_ms, base_url=None):
+    """
+    Klines with start_ms <= open time < end_ms (at most MAX_LIMIT of them).
+    """
+    base_url = base_url or os.getenv('BASE_URL', 'https://api.mexc.com')
+    params = {
+        "symbol": symbol,
+        "interval": interval,
+        "startTime": int(start_ms),
+        "endTime": int(end_ms) - 1,
+        "limit": MAX_LIMIT
+    }
+    response = transport.get(f"{base_url}/api/v3/klines", params=params, verify=False, timeout=10)
+    klines = response.json()
+    if not isinstance(klines, list):
+        raise RuntimeError(f"Bad klines response for {symbol}: {klines}")
+    return klines
+
+def find_gaps(times, step, previous=None):
+    """
+    [(from_ms, to_ms), ...] where consecutive open times are more than one
+    interval apart. `previous` is the open time stored before `times`.
+    """
+    gaps = []
+    last = previous
+    for t in times:
+        t = int(t)
+        if last is not None and t - last > step:
+            gaps.append((last + step, t))
+        last = t
+    return gaps
+
+def _fill(symbol, interval, start_ms, end_ms, store, fetch, workers, chunk_ms, retries):
+    """
+    Appends [start_ms, end_ms) to the store chunk by chunk, in time order.
+    Returns (added, gaps, complete).
+    """
+    step = INTERVAL_MS[interval]
+    chunks = [(s, min(s + chunk_ms, end_ms)) for s in range(start_ms, end_ms, chunk_ms)]
+    print(f"📥 Backfilling {symbol} {interval}: {len(chunks)} chunks with {workers} workers...")
+
+    def fetch_chunk(bounds):
+        error = None
+        for attempt in range(retries):
+            try:
+                return fetch(symbol, interval, *bounds)
+            except Exception as e:
+                error = e
+                time.sleep(0.5 * 2 ** attempt)
+        raise error
+
+    added, gaps, complete = 0, [], True
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Bounded look-ahead so memory stays flat on multi-year ranges
+        window = workers * 2
+        futures = [pool.submit(fetch_chunk, c) for c in chunks[:window]]
+        for i, bounds in enumerate(chunks):
+            if i + window < len(chunks):
+                futures.append(pool.submit(fetch_chunk, chunks[i + window]))
+            try:
+                klines = futures[i].result()
+            except Exception as e:
+                print(f"❌ Chunk {i + 1}/{len(chunks)} failed ({e}). Stopping; the next run resumes here.")
+                complete = False
+                for f in futures[i + 1:]:
+                    f.cancel()
+                break
+            futures[i] = None # release the chunk
+            klines = [k for k in klines if bounds[0] <= int(k[0]) < bounds[1]]
+            if not klines:
+                continue
+            klines.sort(key=lambda k: int(k[0]))
+            gaps += find_gaps([k[0] for k in klines], step, store.last_time(symbol, interval))
+            added += store.append(symbol, interval, klines)
+    return added, gaps, complete
+
+def backfill(symbol, interval="15m", start_ms=None, end_ms=None, store=None, workers=4,
+             chunk_candles=MAX_LIMIT, retries=3, fetch=None):
+    """
+    Fills the store for symbol/interval up to end_ms (default: now), from
+    the last stored candle or start_ms (default: one chunk back). A start_ms
+    before the first stored candle also fills the range up to it.
+    fetch(symbol, interval, start_ms, end_ms) -> klines; defaults to MEXC.
+    Returns {"added": int, "gaps": [...], "complete": bool}.
+    """
+    store = store or OHLCVStore()
+    fetch = fetch or fetch_klines_range
+    step = INTERVAL_MS[interval]
+    chunk_ms = step * min(chunk_candles, MAX_LIMIT)
+    end_ms = end_ms or int(time.time() * 1000)
+    # Only closed candles: stop at the open time of the current one
+    end_ms -= end_ms % step
+    if start_ms is not None:
+        start_ms -= start_ms % step
+
+    added, gaps, complete = 0, [], True
+    started = time.perf_counter()
+    first, last = store.first_time(symbol, interval), store.last_time(symbol, interval)
+    if first is not None and start_ms is not None and start_ms < first:
+        # Deepen: the older range goes to a scratch store and is prepended only when complete
+        print(f"⏪ Extending {symbol} {interval} back before {first}...")
+        with tempfile.TemporaryDirectory() as scratch_root:
+            scratch = OHLCVStore(scratch_root)
+            n, older_gaps, complete = _fill(symbol, interval, start_ms, first, scratch, fetch, workers, chunk_ms, retries)
+            if complete:
+                scratch_last = scratch.last_time(symbol, interval)
+                added += store.prepend(symbol, interval, scratch.to_frame(symbol, interval))
+                gaps += older_gaps + find_gaps([first], step, scratch_last)
+            else:
+                print("❌ Older range incomplete; the stored history is left as it was.")
+
+    if last is not None:
+        start_ms = last + step
+    elif start_ms is None:
+        start_ms = end_ms - chunk_ms
+    if start_ms < end_ms:
+        n, newer_gaps, newer_complete = _fill(symbol, interval, start_ms, end_ms, store, fetch, workers, chunk_ms, retries)
+        added += n
+        gaps += newer_gaps
+        complete = complete and newer_complete
+    elif added == 0:
+        print(f"✅ {symbol} {interval} already up to date.")
+        return {"added": 0, "gaps": [], "complete": complete}
+
+    elapsed = time.perf_counter() - started
+    print(f"💾 {symbol} {interval}: +{added} candles in {elapsed:.1f}s ({store.rows(symbol, interval)} stored)")
+    if gaps:
+        print(f"⚠️ {len(gaps)} gap(s) in exchange data, e.g. {gaps[0]}")
+    return {"added": added, "gaps": gaps, "complete": complete}
@@ -0,0 +1,240 @@
+import os
+import json
+import shutil
+import numpy as np
+
+# Local OHLCV store: one directory per symbol/interval holding each column
+# as a raw little-endian binary file plus meta.json (row count, dtypes).
+# Columns are opened with np.memmap, so loading is instant and only the
+# pages of the columns (and rows) actually read are pulled from disk.
+# Rows are kept sorted by open time; range queries use searchsorted on the
+# time column. One writer per series at a time.
+#
+#   <root>/<SYMBOL>/<interval>/meta.json
+#   <root>/<SYMBOL>/<interval>/time.bin, open.bin, ...
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "market")
+
+COLUMNS = {
+    "time": "<i8",
+    "open": "<f8",
+    "high": "<f8",
+    "low": "<f8",
+    "close": "<f8",
+    "volume": "<f8",
+    "close_time": "<i8",
+    "quote_volume": "<f8",
+}
+
+INTERVAL_MS = {
+    "1m": 60000, "5m": 300000, "15m": 900000, "30m": 1800000,
+    "60m": 3600000, "1h": 3600000, "4h": 14400000, "1d": 86400000,
+}
+
+def klines_to_arrays(klines, interval=None):
+    """
+    Converts MEXC klines ([time, open, high, low, close, volume, close_time,
+    quote_volume], the last two optional) or a DataFrame into typed columns.
+    """
+    if hasattr(klines, "columns"):
+        df = klines
+        if "close" not in df.columns:
+            df = df.set_axis(list(COLUMNS)[:len(df.columns)], axis=1)
+        if "quote_volume" not in df.columns and "quote_asset_volume" in df.columns:
+            df = df.rename(columns={"quote_asset_volume": "quote_volume"})
+        raw = {c: df[c].to_numpy() for c in COLUMNS if c in df.columns}
+    else:
+        rows = [list(k) for k in klines]
+        width = min(len(r) for r in rows) if rows else 0
+        raw = {c: np.asarray([r[i] for r in rows], dtype=np.float64)
+               for i, c in enumerate(list(COLUMNS)[:width])}
+
+    n = len(raw["time"]) if "time" in raw else 0
+    arrays = {}
+    for c, dtype in COLUMNS.items():
+        if c in raw:
+            arrays[c] = np.asarray(raw[c], dtype=np.float64).astype(dtype)
+        elif c == "close_time":
+            step = INTERVAL_MS.get(interval, 0)
+            arrays[c] = arrays["time"] + step - 1 if step else np.zeros(n, dtype=dtype)
+        else:
+            arrays[c] = np.full(n, np.nan, dtype=dtype)
+    return arrays
+
+def _sorted_unique(arrays):
+    # Sort by open time, keeping the last copy of duplicated candles
+    times = arrays["time"]
+    order = np.argsort(times, kind="stable")
+    keep = np.ones(len(order), dtype=bool)
+    keep[:-1] = times[order][1:] != times[order][:-1]
+    return {c: a[order][keep] for c, a in arrays.items()}
+
+class OHLCVStore:
+    def __init__(self, root=None):
+        self.root = root or os.getenv("QUANT_DATA_DIR") or DEFAULT_ROOT
+
+    def path(self, symbol, interval):
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def _meta(self, symbol, interval):
+        try:
+            with open(os.path.join(self.path(symbol, interval), "meta.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"rows": 0, "columns": COLUMNS}
+
+    def _write_meta(self, symbol, interval, meta):
+        path = os.path.join(self.path(symbol, interval), "meta.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(path + ".tmp", path)
+
+    def rows(self, symbol, interval):
+        return self._meta(symbol, interval)["rows"]
+
+    def exists(self, symbol, interval):
+        return self.rows(symbol, interval) > 0
+
+    def _column(self, symbol, interval, name, rows, mode="r"):
+        if rows == 0:
+            return np.empty(0, dtype=COLUMNS[name])
+        return np.memmap(os.path.join(self.path(symbol, interval), f"{name}.bin"),
+                         dtype=COLUMNS[name], mode=mode, shape=(rows,))
+
+    def first_time(self, symbol, interval):
+        """
+        Open time (ms) of the oldest stored candle, or None.
+        """
+        rows = self.rows(symbol, interval)
+        if rows == 0:
+            return None
+        return int(self._column(symbol, interval, "time", rows)[0])
+
+    def last_time(self, symbol, interval):
+        """
+        Open time (ms) of the newest stored candle, or None.
+        """
+        rows = self.rows(symbol, interval)
+        if rows == 0:
+            return None
+        return int(self._column(symbol, interval, "time", rows)[-1])
+
+    def append(self, symbol, interval, klines):
+        """
+        Adds candles newer than the stored ones. A candle with the same open
+        time as the newest stored one replaces it (e.g. a closing candle);
+        older ones are ignored. Returns the number of rows added.
+        """
+        arrays = klines_to_arrays(klines, interval)
+        if len(arrays["time"]) == 0:
+            return 0
+        arrays = _sorted_unique(arrays)
+
+        directory = self.path(symbol, interval)
+        os.makedirs(directory, exist_ok=True)
+        meta = self._meta(symbol, interval)
+        rows = meta["rows"]
+        last = self.last_time(symbol, interval)
+
+        if last is not None:
+            same = arrays["time"] == last
+            if same.any():
+                i = int(np.flatnonzero(same)[-1])
+                for c in COLUMNS:
+                    col = self._column(symbol, interval, c, rows, mode="r+")
+                    col[-1] = arrays[c][i]
+                    col.flush()
+            newer = arrays["time"] > last
+            arrays = {c: a[newer] for c, a in arrays.items()}
+
+        added = len(arrays["time"])
+        if added == 0:
+            return 0
+        for c, dtype in COLUMNS.items():
+            path = os.path.join(directory, f"{c}.bin")
+            with open(path, "ab") as f:
+                # Drop bytes of an interrupted earlier append past the committed row count
+                f.truncate(rows * np.dtype(dtype).itemsize)
+                f.write(np.ascontiguousarray(arrays[c], dtype=dtype).tobytes())
+        meta.update({"rows": rows + added, "columns": COLUMNS, "symbol": symbol.upper(), "interval": interval})
+        self._write_meta(symbol, interval, meta)
+        return added
+
+    def prepend(self, symbol, interval, klines):
+        """
+        Adds candles older than the stored ones in front of them (e.g. a
+        backfill deepening the history); the others are ignored. The series
+        is rewritten into a new directory that then replaces the old one, so
+        an interrupted prepend leaves the old series intact. Returns the
+        number of rows added.
+        """
+        first = self.first_time(symbol, interval)
+        if first is None:
+            return self.append(symbol, interval, klines)
+        arrays = klines_to_arrays(klines, interval)
+        if len(arrays["time"]) == 0:
+            return 0
+        arrays = _sorted_unique(arrays)
+        older = arrays["time"] < first
+        arrays = {c: a[older] for c, a in arrays.items()}
+        added = len(arrays["time"])
+        if added == 0:
+            return 0
+
+        directory = self.path(symbol, interval)
+        staging, previous = directory + ".prepend", directory + ".old"
+        for path in (staging, previous):
+            shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(staging)
+        meta = self._meta(symbol, interval)
+        rows = meta["rows"]
+        for c, dtype in COLUMNS.items():
+            column = np.concatenate([arrays[c].astype(dtype), self._column(symbol, interval, c, rows)])
+            with open(os.path.join(staging, f"{c}.bin"), "wb") as f:
+                f.write(np.ascontiguousarray(column, dtype=dtype).tobytes())
+        meta.update({"rows": rows + added, "columns": COLUMNS, "symbol": symbol.upper(), "interval": interval})
+        with open(os.path.join(staging, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        os.replace(directory, previous)
+        os.replace(staging, directory)
+        shutil.rmtree(previous, ignore_errors=True)
+        return added
+
+    def load(self, symbol, interval, start=None, end=None, columns=None):
+        """
+        Memory-mapped columns for candles with start <= open time < end (ms).
+        Returns {name: array}; slices are views, nothing is copied.
+        """
+        rows = self.rows(symbol, interval)
+        names = list(columns or COLUMNS)
+        times = self._column(symbol, interval, "time", rows)
+        lo = int(np.searchsorted(times, start, side="left")) if start is not None else 0
+        hi = int(np.searchsorted(times, end, side="left")) if end is not None else rows
+        return {c: (times if c == "time" else self._column(symbol, interval, c, rows))[lo:hi] for c in names}
+
+    def to_frame(self, symbol, interval, start=None, end=None, columns=None):
+        """
+        load() as a DataFrame (copies the selected range).
+        """
+        import pandas as pd
+        return pd.DataFrame({c: np.array(a) for c, a in self.load(symbol, interval, start, end, columns).items()})
+
+    def import_csv(self, path, symbol, interval):
+        """
+        Appends a historical CSV (data_collector format) to the store.
+        """
+        import pandas as pd
+        df = pd.read_csv(path)
+        added = self.append(symbol, interval, df)
+        print(f"💾 Imported {added} candles from {path} into {self.path(symbol, interval)}")
+        return added
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Import a historical klines CSV into the OHLCV store")
+    parser.add_argument("csv")
+    parser.add_argument("--symbol", default="SOLUSDT")
+    parser.add_argument("--interval", default="15m")
+    parser.add_argument("--root", default=None)
+    args = parser.parse_args()
+    OHLCVStore(args.root).import_csv(args.csv, args.symbol, args.interval)
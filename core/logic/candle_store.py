@@ -0,0 +1,48 @@
+from collections import deque
+
+class CandleStore:
+    """
+    Rolling in-memory store of the most recent candles per symbol.
+    Candles use the MEXC kline layout [time, open, high, low, close, volume]
+    and each symbol keeps at most `maxlen` of them (oldest dropped first).
+    """
+    def __init__(self, maxlen=500):
+        self.maxlen = maxlen
+        self.candles = {}
+
+    def upsert(self, symbol, candle):
+        """
+        Adds or revises a candle. A candle with the open time of the last one
+        replaces it (still forming); a newer one is appended, which closes the
+        previous candle. Returns the candle that just closed, or None.
+        Updates older than the last candle are ignored.
+        """
+        buf = self.candles.get(symbol)
+        if buf is None:
+            buf = self.candles[symbol] = deque(maxlen=self.maxlen)
+        if buf and candle[0] == buf[-1][0]:
+            buf[-1] = candle
+            return None
+        if buf and candle[0] < buf[-1][0]:
+            return None
+        closed = buf[-1] if buf else None
+        buf.append(candle)
+        return closed
+
+    def klines(self, symbol, include_forming=True):
+        """
+        Candles of `symbol`, oldest first. include_forming=False drops the
+        last (still open) candle.
+        """
+        buf = self.candles.get(symbol)
+        if not buf:
+            return []
+        rows = list(buf)
+        return rows if include_forming else rows[:-1]
+
+    def last(self, symbol):
+        buf = self.candles.get(symbol)
+        return buf[-1] if buf else None
+
+    def symbols(self):
+        return list(self.candles)
@@ -1,16 +1,20 @@
-import pandas as pd
 import numpy as np
 
+# pandas is imported inside the functions that use it, so importing the
+# NumPy-only helpers (Fibonacci, volume profile) stays cheap.
+
 def calculate_ema(prices, period):
     """
     Calculate Exponential Moving Average (EMA).
     """
+    import pandas as pd
     return pd.Series(prices).ewm(span=period, adjust=False).mean().tolist()
 
 def calculate_rsi(prices, period=14):
     """
     Calculate Relative Strength Index (RSI).
     """
+    import pandas as pd
     delta = pd.Series(prices).diff()
     gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
     loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
@@ -20,6 +24,28 @@ def calculate_rsi(prices, period=14):
     # Handle NaN values (e.g. flat prices) by filling with 50 (Neutral)
     return rsi.fillna(50).tolist()
 
+def calculate_rsi_batch(series, period=14):
+    """
+    Latest RSI of many price series at once (same definition as calculate_rsi).
+    series: sequences of prices, lengths may differ. Returns a NumPy array,
+    50 (Neutral) where a series is too short (fewer than `period` prices) or flat.
+    """
+    # Only the last period + 1 prices matter; shorter series are NaN-padded.
+    # Like calculate_rsi, a missing delta (the first one) counts as 0.
+    window = np.full((len(series), period + 1), np.nan)
+    lengths = np.array([len(prices) for prices in series])
+    for i, prices in enumerate(series):
+        tail = np.asarray(prices, dtype=np.float64)[-(period + 1):]
+        if len(tail):
+            window[i, -len(tail):] = tail
+    delta = np.diff(window, axis=1)
+    gain = np.where(delta > 0, delta, 0.0).mean(axis=1)
+    loss = np.where(delta < 0, -delta, 0.0).mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + gain / loss)
+    rsi[(lengths < period) | np.isnan(rsi)] = 50.0
+    return rsi
+
 def calculate_fibonacci_levels(high, low):
     """
     Calculate Fibonacci Retracement levels for a given price range.
@@ -69,6 +95,7 @@ def calculate_atr(high, low, close, period=14):
     """
     Calculate Average True Range (ATR).
     """
+    import pandas as pd
     high = pd.Series(high)
     low = pd.Series(low)
     close = pd.Series(close)
@@ -85,6 +112,7 @@ def calculate_bollinger_bands(close, period=20, std_dev=2):
     """
     Calculate Bollinger Bands.
     """
+    import pandas as pd
     close = pd.Series(close)
     ma = close.rolling(window=period).mean()
     std = close.rolling(window=period).std()
@@ -0,0 +1,84 @@
+import re
+import numpy as np
+
+# Keyword sentiment scoring in one regex pass.
+# The whole lexicon is compiled into a single alternation (longest terms
+# first, so multi-word phrases win over their parts). Each term carries a
+# weight: positive = bullish, negative = bearish. A text scores
+#     (bullish weight - bearish weight) / (bullish weight + bearish weight)
+# which, with unit weights, is SentimentEngine's original
+# (bull_count - bear_count) / total.
+
+def _normalise(term):
+    return " ".join(term.lower().split())
+
+class KeywordMatcher:
+    def __init__(self, weights):
+        """
+        weights: {term: weight}; terms may contain several words.
+        """
+        self.weights = {_normalise(t): float(w) for t, w in weights.items() if _normalise(t)}
+        terms = sorted(self.weights, key=len, reverse=True)
+        alternation = "|".join(r"\s+".join(re.escape(word) for word in t.split()) for t in terms)
+        self.pattern = re.compile(rf"\b(?:{alternation})\b") if terms else None
+
+    @classmethod
+    def from_lists(cls, bullish, bearish, weight=1.0):
+        weights = {t: weight for t in bullish}
+        weights.update({t: -weight for t in bearish})
+        return cls(weights)
+
+    def _weight(self, match):
+        return self.weights[_normalise(match)]
+
+    def counts(self, text):
+        """
+        (bullish weight, bearish weight) found in `text`.
+        """
+        bull = bear = 0.0
+        if self.pattern is None:
+            return bull, bear
+        for match in self.pattern.findall(text.lower()):
+            w = self._weight(match)
+            if w > 0:
+                bull += w
+            else:
+                bear -= w
+        return bull, bear
+
+    def score(self, text):
+        """
+        Score between -1 (bearish) and 1 (bullish); 0 when nothing matched.
+        """
+        bull, bear = self.counts(text)
+        total = bull + bear
+        if total == 0:
+            return 0
+        return (bull - bear) / total
+
+    def score_batch(self, texts):
+        """
+        Scores many texts with a single scan over their concatenation.
+        Returns a float array aligned with `texts`.
+        """
+        n = len(texts)
+        if n == 0 or self.pattern is None:
+            return np.zeros(n)
+        lowered = [t.lower() for t in texts]
+        # NUL separates texts: a word boundary that \s+ in phrases cannot cross
+        joined = "\x00".join(lowered)
+        ends = np.cumsum([len(t) + 1 for t in lowered])
+
+        starts, weights = [], []
+        for m in self.pattern.finditer(joined):
+            starts.append(m.start())
+            weights.append(self._weight(m.group()))
+        if not starts:
+            return np.zeros(n)
+
+        doc = np.searchsorted(ends, np.asarray(starts), side="right")
+        weights = np.asarray(weights)
+        bull = np.bincount(doc, weights=np.where(weights > 0, weights, 0), minlength=n)
+        bear = np.bincount(doc, weights=np.where(weights < 0, -weights, 0), minlength=n)
+        total = bull + bear
+        return np.divide(bull - bear, total, out=np.zeros(n), where=total > 0)
@@ -0,0 +1,144 @@
+import numpy as np
+from collections import deque
+from core.data.ohlcv_store import INTERVAL_MS
+
+# Higher-timeframe candles derived from a base (usually 1m) series.
+# Bars are aligned to multiples of the target interval since the epoch (UTC),
+# like exchange klines. A bar is complete once its last base candle is
+# present or a later bar has started (a gap in exchange data); otherwise it
+# is the forming bar, which is what the exchange returns as the last kline.
+
+def _interval_ms(interval):
+    return interval if isinstance(interval, (int, np.integer)) else INTERVAL_MS[interval]
+
+def resample(columns, target, source="1m", include_partial=True):
+    """
+    Aggregates base candles (dict of arrays: time, open, high, low, close,
+    volume, sorted by time) into `target` bars. Returns the same keys plus
+    "complete" (bool array). include_partial=False drops a trailing
+    incomplete bar.
+    """
+    target_ms, source_ms = _interval_ms(target), _interval_ms(source)
+    times = np.asarray(columns["time"], dtype=np.int64)
+    if len(times) == 0:
+        empty = {c: np.empty(0) for c in ["open", "high", "low", "close", "volume"]}
+        empty.update({"time": np.empty(0, dtype=np.int64), "complete": np.empty(0, dtype=bool)})
+        return empty
+
+    buckets = times - times % target_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(times)] - 1
+
+    out = {
+        "time": buckets[starts],
+        "open": np.asarray(columns["open"], dtype=np.float64)[starts],
+        "high": np.maximum.reduceat(np.asarray(columns["high"], dtype=np.float64), starts),
+        "low": np.minimum.reduceat(np.asarray(columns["low"], dtype=np.float64), starts),
+        "close": np.asarray(columns["close"], dtype=np.float64)[ends],
+        "volume": np.add.reduceat(np.asarray(columns["volume"], dtype=np.float64), starts),
+    }
+    complete = np.ones(len(starts), dtype=bool)
+    complete[-1] = times[-1] >= out["time"][-1] + target_ms - source_ms
+    out["complete"] = complete
+    if not include_partial and not complete[-1]:
+        out = {c: a[:-1] for c, a in out.items()}
+    return out
+
+def to_klines(columns):
+    """
+    Column dict -> klines ([time, open, high, low, close, volume]).
+    """
+    return [[int(t), float(o), float(h), float(l), float(c), float(v)] for t, o, h, l, c, v in
+            zip(columns["time"], columns["open"], columns["high"], columns["low"], columns["close"], columns["volume"])]
+
+class IncrementalResampler:
+    """
+    Keeps one higher timeframe up to date from streamed base candles.
+    update() takes base candles in time order; a candle with the same open
+    time as the previous one revises it (the forming candle), as with
+    CandleStore. Returns the finished bar when a new bar starts, else None.
+    """
+    def __init__(self, target, source="1m", maxlen=500):
+        self.target_ms = _interval_ms(target)
+        self.source_ms = _interval_ms(source)
+        self.bars = deque(maxlen=maxlen) # finished bars
+        self.bucket = None
+        self.closed = None  # [open, high, low, close, volume] of closed base candles in the bucket
+        self.forming = None # latest base candle (may still be revised)
+
+    def _fold(self, agg, candle):
+        o, h, l, c, v = (float(x) for x in candle[1:6])
+        if agg is None:
+            return [o, h, l, c, v]
+        return [agg[0], max(agg[1], h), min(agg[2], l), c, agg[4] + v]
+
+    def current(self):
+        """
+        The bar in progress, [time, open, high, low, close, volume], or None.
+        """
+        if self.bucket is None:
+            return None
+        agg = self._fold(self.closed, self.forming) if self.forming is not None else self.closed
+        return [self.bucket] + agg
+
+    def update(self, candle):
+        t = int(candle[0])
+        if self.forming is not None and t < int(self.forming[0]):
+            return None # stale
+        if self.forming is not None and t == int(self.forming[0]):
+            self.forming = list(candle)
+            return None
+
+        finished = None
+        bucket = t - t % self.target_ms
+        if self.forming is not None:
+            if bucket == self.bucket:
+                self.closed = self._fold(self.closed, self.forming)
+            else:
+                finished = self.current()
+                self.bars.append(finished)
+                self.closed = None
+        self.bucket = bucket
+        self.forming = list(candle)
+        return finished
+
+    def extend(self, klines):
+        for k in klines:
+            self.update(k)
+
+    def is_current_complete(self):
+        """
+        True once the bar's last base candle has arrived (it may still be revised).
+        """
+        return self.forming is not None and int(self.forming[0]) >= self.bucket + self.target_ms - self.source_ms
+
+    def klines(self, include_forming=True):
+        bars = list(self.bars)
+        if include_forming and self.bucket is not None:
+            bars.append(self.current())
+        return bars
+
+class MultiTimeframe:
+    """
+    One base feed, several derived timeframes:
+        mtf = MultiTimeframe(["15m", "60m", "4h"])
+        mtf.update(candle_1m)        -> {"15m": finished_bar, ...} for bars that finished
+        mtf.klines("4h")
+    """
+    def __init__(self, targets, source="1m", maxlen=500):
+        self.resamplers = {t: IncrementalResampler(t, source, maxlen) for t in targets}
+
+    def update(self, candle):
+        finished = {}
+        for target, resampler in self.resamplers.items():
+            bar = resampler.update(candle)
+            if bar is not None:
+                finished[target] = bar
+        return finished
+
+    def extend(self, klines):
+        for k in klines:
+            self.update(k)
+
+    def klines(self, target, include_forming=True):
+        return self.resamplers[target].klines(include_forming)
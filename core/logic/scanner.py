@@ -0,0 +1,144 @@
+import time
+import bisect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.clients.mexc_client import MEXCClient
+from core.clients.mexc_futures_client import MEXCFuturesClient
+from core.clients.sentiment_engine import SentimentEngine
+from core.clients.macro_api import MacroClient
+from core.clients.market_context import LiveMarketContext, SnapshotMarketContext
+from core.data.ohlcv_store import INTERVAL_MS
+from core.logic.strategy import HybridStrategy
+
+# Concurrent multi-symbol scan. Inputs every symbol shares (Fear & Greed,
+# DXY, BTC 24h ticker and the funding rates of all contracts, the latter in
+# one bulk call) are fetched once per scan; each symbol then only fetches its
+# own klines. Symbols are fetched and evaluated on a thread pool and ranked
+# as their results arrive.
+
+def score_opportunity(result, killzone=None):
+    """
+    Professional score of one HybridStrategy result (see crypto/professional_scanner.py).
+    """
+    price = result['price']
+    gaps = result['recent_gaps']
+    golden_pocket = result['fib_levels']["0.618"]
+    sentiment = result['fundamental']['sentiment']
+
+    score = 0
+    if "BUY" in result['signal']: score += 3
+    if sentiment == "BULLISH": score += 2
+    if killzone: score += 2
+    if gaps: score += 1
+    # Bonus for POC alignment
+    if price >= result['poc']: score += 1
+    # Bonus for Golden Pocket (0.618) - If price is near it (0.5% proximity)
+    if abs(price - golden_pocket) / price < 0.005: score += 2
+
+    return {
+        "symbol": result['symbol'],
+        "score": score,
+        "price": price,
+        "signal": result['signal'],
+        "sentiment": sentiment,
+        "fng": f"{result['fng']} ({result['fng_class']})",
+        "macro": result['macro']['dxy_sentiment'],
+        "fib618": golden_pocket,
+        "poc": result['poc'],
+        "gaps": len(gaps),
+        "change": result['fundamental']['priceChange24h'],
+    }
+
+def change_24h(klines, interval):
+    """
+    24h % change from the candles themselves, as a 24h ticker stand-in (0 if too short).
+    """
+    per_day = 86400000 // INTERVAL_MS.get(interval, 86400000)
+    if len(klines) <= per_day:
+        return 0
+    start, end = float(klines[-per_day - 1][4]), float(klines[-1][4])
+    return (end - start) / start * 100 if start else 0
+
+class ScannerEngine:
+    """
+    scan(symbols) -> {"opportunities": ranked by score, "errors": {symbol: msg},
+                      "shared_seconds": s, "elapsed": s}
+    Each opportunity carries "latency": {"klines", "wait_shared", "eval", "done_at"}
+    in seconds, done_at measured from the start of the scan.
+    """
+    def __init__(self, interval="15m", limit=100, workers=16, client=None, futures_client=None,
+                 sentiment_engine=None, macro_client=None, context=None):
+        self.interval = interval
+        self.limit = limit
+        self.workers = workers
+        self.client = client or MEXCClient()
+        self.futures_client = futures_client or MEXCFuturesClient()
+        self.sentiment_engine = sentiment_engine or SentimentEngine()
+        self.macro_client = macro_client or MacroClient()
+        self.context = context or LiveMarketContext(self.client, self.futures_client, self.sentiment_engine, self.macro_client)
+
+    def _strategy(self, symbol):
+        # Fresh position state per scan, shared clients
+        return HybridStrategy(symbol, context=self.context, client=self.client, futures_client=self.futures_client,
+                              sentiment_engine=self.sentiment_engine, macro_client=self.macro_client)
+
+    def _scan_symbol(self, symbol, shared, killzone, started, ticker=None):
+        t0 = time.perf_counter()
+        klines = self.client.get_klines(symbol, self.interval, limit=self.limit)
+        t1 = time.perf_counter()
+        fng, dxy, btc_ticker, funding_rates = (f.result() for f in shared)
+        t2 = time.perf_counter()
+
+        futures_symbol = symbol.replace("USDT", "_USDT")
+        if futures_symbol in funding_rates:
+            rates = {futures_symbol: funding_rates[futures_symbol]}
+        else:
+            rates = {futures_symbol: self.context.get_funding_rate(futures_symbol)}
+        context = SnapshotMarketContext(fng, dxy, rates, btc_ticker)
+        ticker = ticker or {"priceChangePercent": change_24h(klines, self.interval)}
+        result = self._strategy(symbol).get_signals_from_klines(klines, context=context, ticker_24h=ticker)
+        if 'error' in result:
+            raise ValueError(f"{result['error']} ({len(klines)} candles)")
+
+        opp = score_opportunity(result, killzone)
+        t3 = time.perf_counter()
+        opp["latency"] = {"klines": t1 - t0, "wait_shared": t2 - t1, "eval": t3 - t2, "done_at": t3 - started}
+        return opp
+
+    def scan(self, symbols, killzone=None, on_result=None, tickers=None):
+        """
+        on_result(opportunity, ranked) is called as each symbol finishes,
+        with the ranking so far (best first). tickers: optional
+        {symbol: {"priceChangePercent": ...}} (e.g. from a bulk snapshot)
+        used instead of the change derived from klines.
+        """
+        tickers = tickers or {}
+        started = time.perf_counter()
+        ranked, errors = [], {}
+        shared_done = {}
+
+        def timed(name, fn, *args):
+            value = fn(*args)
+            shared_done[name] = time.perf_counter() - started
+            return value
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # Submitted first, so no symbol task can wait on a shared input that never starts
+            shared = [pool.submit(timed, "fng", self.context.get_fear_greed),
+                      pool.submit(timed, "dxy", self.context.get_dxy_trend),
+                      pool.submit(timed, "btc", self.context.get_btc_ticker_24h),
+                      pool.submit(timed, "funding", self.futures_client.get_funding_rates)]
+            futures = {pool.submit(self._scan_symbol, s, shared, killzone, started, tickers.get(s)): s for s in symbols}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    opp = future.result()
+                except Exception as e:
+                    errors[symbol] = str(e)
+                    continue
+                bisect.insort(ranked, opp, key=lambda o: -o["score"])
+                if on_result:
+                    on_result(opp, ranked)
+
+        return {"opportunities": ranked, "errors": errors,
+                "shared_seconds": max(shared_done.values(), default=0.0),
+                "elapsed": time.perf_counter() - started}
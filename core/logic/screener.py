@@ -0,0 +1,96 @@
+import numpy as np
+
+# Whole-market screening from one bulk 24h ticker call (plus, optionally, one
+# bulk book ticker call for fresher bid/ask). The snapshot is held as columns,
+# so the filters are a handful of array comparisons over thousands of pairs;
+# only the shortlist goes on to the (per-symbol, network-bound) strategy.
+
+def _column(rows, field):
+    # MEXC sends numbers as strings and may send null
+    return np.array([r.get(field) or "nan" for r in rows], dtype=np.float64)
+
+def snapshot_arrays(tickers, book_tickers=None, quote="USDT"):
+    """
+    Columns of the `quote` pairs in a /api/v3/ticker/24hr snapshot:
+        symbol, last, open, high, low, quote_volume, bid, ask,
+        change_pct, spread_pct, volatility (24h range / last), volatility_rank (0..1)
+    Missing numbers are NaN (and fail every filter).
+    """
+    rows = [t for t in tickers if str(t.get("symbol", "")).endswith(quote)]
+    cols = {"symbol": np.array([r["symbol"] for r in rows], dtype=str)}
+    for name, field in (("last", "lastPrice"), ("open", "openPrice"), ("high", "highPrice"), ("low", "lowPrice"),
+                        ("quote_volume", "quoteVolume"), ("bid", "bidPrice"), ("ask", "askPrice")):
+        cols[name] = _column(rows, field)
+
+    if book_tickers:
+        book = {b.get("symbol"): b for b in book_tickers}
+        matched = [book.get(s, {}) for s in cols["symbol"]]
+        for name, field in (("bid", "bidPrice"), ("ask", "askPrice")):
+            fresh = _column(matched, field)
+            cols[name] = np.where(np.isnan(fresh), cols[name], fresh)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        open_ = np.where(cols["open"] > 0, cols["open"], np.nan)
+        cols["change_pct"] = (cols["last"] - open_) / open_ * 100
+        valid_book = (cols["bid"] > 0) & (cols["ask"] >= cols["bid"])
+        mid = (cols["bid"] + cols["ask"]) / 2
+        cols["spread_pct"] = np.where(valid_book, (cols["ask"] - cols["bid"]) / mid * 100, np.nan)
+        last = np.where(cols["last"] > 0, cols["last"], np.nan)
+        cols["volatility"] = (cols["high"] - cols["low"]) / last
+
+    # Percentile rank among pairs with a known range (NaN otherwise)
+    vol = cols["volatility"]
+    known = ~np.isnan(vol)
+    rank = np.full(len(vol), np.nan)
+    if known.sum() > 1:
+        rank[known] = vol[known].argsort().argsort() / (known.sum() - 1)
+    elif known.any():
+        rank[known] = 1.0
+    cols["volatility_rank"] = rank
+    return cols
+
+def screen(snapshot, min_quote_volume=1_000_000, min_change_pct=None, max_change_pct=None,
+           max_spread_pct=0.5, min_volatility_rank=0.0, sort_by="quote_volume", top=30):
+    """
+    Applies every filter at once and returns the best `top` rows (by
+    `sort_by`, descending) as dicts. None disables a filter.
+    """
+    n = len(snapshot["symbol"])
+    mask = np.ones(n, dtype=bool)
+    with np.errstate(invalid="ignore"):
+        if min_quote_volume is not None:
+            mask &= snapshot["quote_volume"] >= min_quote_volume
+        if min_change_pct is not None:
+            mask &= snapshot["change_pct"] >= min_change_pct
+        if max_change_pct is not None:
+            mask &= snapshot["change_pct"] <= max_change_pct
+        if max_spread_pct is not None:
+            mask &= snapshot["spread_pct"] <= max_spread_pct
+        if min_volatility_rank is not None:
+            mask &= snapshot["volatility_rank"] >= min_volatility_rank
+
+    idx = np.flatnonzero(mask)
+    idx = idx[np.argsort(-snapshot[sort_by][idx], kind="stable")][:top]
+    names = [k for k in snapshot if k != "symbol"]
+    return [{"symbol": str(snapshot["symbol"][i]), **{k: float(snapshot[k][i]) for k in names}} for i in idx]
+
+def fetch_shortlist(client, book=False, quote="USDT", **filters):
+    """
+    One bulk ticker call (and one book ticker call if `book`), screened.
+    Returns (shortlist, number of `quote` pairs screened).
+    """
+    tickers = client.get_all_tickers_24h()
+    book_tickers = client.get_all_book_tickers() if book else None
+    snapshot = snapshot_arrays(tickers, book_tickers, quote)
+    return screen(snapshot, **filters), len(snapshot["symbol"])
+
+if __name__ == "__main__":
+    import time
+    from core.clients.mexc_client import MEXCClient
+
+    start = time.perf_counter()
+    shortlist, universe = fetch_shortlist(MEXCClient(), book=True)
+    print(f"🔎 {len(shortlist)} of {universe} USDT pairs shortlisted in {time.perf_counter() - start:.2f}s")
+    print(f"{'SYMBOL':<14} | {'QUOTE VOL':>14} | {'24H %':>7} | {'SPREAD %':>8} | {'VOL RANK':>8}")
+    for row in shortlist:
+        print(f"{row['symbol']:<14} | {row['quote_volume']:>14,.0f} | {row['change_pct']:>+7.2f} | {row['spread_pct']:>8.3f} | {row['volatility_rank']:>8.2f}")
@@ -1,70 +1,85 @@
-import torch
-import torch.nn as nn
-import os
+import numpy as np
 from core.clients.mexc_client import MEXCClient
 from core.clients.mexc_futures_client import MEXCFuturesClient # Add futures client
-from core.logic.indicators import calculate_ema, calculate_rsi, calculate_fibonacci_levels, calculate_volume_profile
+from core.logic.indicators import calculate_fibonacci_levels, calculate_volume_profile
+from core.logic.streaming_indicators import StreamingIndicators
 from core.clients.sentiment_engine import SentimentEngine
 from core.clients.macro_api import MacroClient
+from core.clients import transport
+from core.clients.market_context import LiveMarketContext, HistoricalMarketContext, fetch_snapshot
+from core.ai import inference
 
-# DQN Architecture (must match train_agent.py)
-class DQN(nn.Module):
-    def __init__(self, state_dim, action_dim):
-        super(DQN, self).__init__()
-        self.fc = nn.Sequential(
-            nn.Linear(state_dim, 64),
-            nn.ReLU(),
-            nn.Linear(64, 64),
-            nn.ReLU(),
-            nn.Linear(64, action_dim)
-        )
-    
-    def forward(self, x):
-        return self.fc(x)
+def __getattr__(name):
+    # DQN Architecture (train_agent.DQN); torch is only imported when it is asked for
+    if name == "DQN":
+        return inference.torch_dqn_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_UNSET = object() # HybridStrategy.model not assigned: use the shared model
+
+def check_killzone():
+    """
+    Check if current UTC time is within London, NY, or Tokyo Killzones.
+    Tokyo: 00:00 - 03:00 UTC
+    London: 07:00 - 10:00 UTC
+    NY: 12:00 - 15:00 UTC (AM)
+    """
+    import datetime
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    hour = now_utc.hour
+
+    if 0 <= hour < 3:
+        return "TOKYO"
+    elif 7 <= hour < 10:
+        return "LONDON"
+    elif 12 <= hour < 15:
+        return "NEW YORK AM"
+    elif 18 <= hour < 20:
+        return "NEW YORK PM MACRO"
+    return None
 
 class HybridStrategy:
-    def __init__(self, symbol="SOLUSDT"):
+    def __init__(self, symbol="SOLUSDT", context=None, backtest_context=None,
+                 client=None, futures_client=None, sentiment_engine=None, macro_client=None):
         self.symbol = symbol
-        self.client = MEXCClient()
-        self.futures_client = MEXCFuturesClient() # Initialize futures client
-        self.sentiment_engine = SentimentEngine()
-        self.macro_client = MacroClient()
+        # Clients can be passed in so many strategies in one process share them
+        self.client = client or MEXCClient()
+        self.futures_client = futures_client or MEXCFuturesClient() # Initialize futures client
+        self.sentiment_engine = sentiment_engine or SentimentEngine()
+        self.macro_client = macro_client or MacroClient()
+        # Providers for Fear & Greed, DXY, funding rate and BTC ticker.
+        # Backtests default to offline (neutral) inputs so they never hit the network.
+        self.context = context or LiveMarketContext(self.client, self.futures_client, self.sentiment_engine, self.macro_client)
+        self.backtest_context = backtest_context or HistoricalMarketContext()
         self.entry_price = None
         self.stop_loss_pct = 0.015 # 1.5% Stop Loss
         self.take_profit_pct = 0.07  # 7% Take Profit (Aggressive Growth)
         self.position_type = None    # "LONG" or "SHORT"
+        # Indicators are updated incrementally as new candles arrive
+        self.indicators = StreamingIndicators()
         
-        # Load AI Model
-        self.model = None
-        if os.path.exists("trading_agent.pth"):
-            try:
-                state_dim = torch.load("trading_agent_metadata.pth")
-                self.model = DQN(state_dim, 3) # 3 actions: HOLD, BUY, SELL
-                self.model.load_state_dict(torch.load("trading_agent.pth"))
-                self.model.eval()
-            except Exception as e:
-                print(f"⚠️ Failed to load AI model: {e}")
+        # AI Model: loaded on first use and shared by every strategy (see model)
+        self._model = _UNSET
         
+    @property
+    def model(self):
+        """
+        Torch-free DQN (core.ai.inference), or None when no model is trained.
+        Assign a model to override it, or None to turn the AI opinion off.
+        """
+        if self._model is _UNSET:
+            return inference.get_model()
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        self._model = value
+
     def check_killzone(self):
         """
-        Check if current UTC time is within London, NY, or Tokyo Killzones.
-        Tokyo: 00:00 - 03:00 UTC
-        London: 07:00 - 10:00 UTC
-        NY: 12:00 - 15:00 UTC (AM)
+        Check if current UTC time is within London, NY, or Tokyo Killzones (see check_killzone()).
         """
-        import datetime
-        now_utc = datetime.datetime.now(datetime.timezone.utc)
-        hour = now_utc.hour
-        
-        if 0 <= hour < 3:
-            return "TOKYO"
-        elif 7 <= hour < 10:
-            return "LONDON"
-        elif 12 <= hour < 15:
-            return "NEW YORK AM"
-        elif 18 <= hour < 20:
-            return "NEW YORK PM MACRO"
-        return None
+        return check_killzone()
 
     def calculate_fvg(self, klines):
         """
@@ -102,9 +117,9 @@ class HybridStrategy:
                 })
         return gaps
 
-    def get_signals(self, news_headlines=None):
+    def _fetch_klines(self):
         """
-        FETCHES data from API and returns signals.
+        Fetches recent candles (CoinGecko first, MEXC as fallback).
         """
         # 1. Fetch Market Data (CoinGecko Fallback for Reliability)
         klines = []
@@ -112,9 +127,8 @@ class HybridStrategy:
             # Map symbol for CoinGecko
             cg_id = "solana" if "SOL" in self.symbol else "bitcoin" if "BTC" in self.symbol else "worldcoin-wld"
             url = f"https://api.coingecko.com/api/v3/coins/{cg_id}/market_chart?vs_currency=usd&days=1"
-            import requests
             headers = {'User-Agent': 'Mozilla/5.0'}
-            resp = requests.get(url, headers=headers, verify=False, timeout=10)
+            resp = transport.get(url, headers=headers, verify=False, timeout=10)
             data = resp.json()
             
             prices = data.get('prices', [])
@@ -135,6 +149,13 @@ class HybridStrategy:
         # If fallback failed, try original client (likely blocked but worth a try)
         if not klines:
              klines = self.client.get_klines(self.symbol, "15m", limit=100)
+        return klines
+
+    def get_signals(self, news_headlines=None):
+        """
+        FETCHES data from API and returns signals.
+        """
+        klines = self._fetch_klines()
              
         if not klines or len(klines) < 60:
             print(f"DEBUG: Klines Fetched: {len(klines)}")
@@ -144,9 +165,42 @@ class HybridStrategy:
         
         return self._calculate_signals(klines, ticker_24h, news_headlines)
 
-    def get_signals_backtest(self, klines, news_headlines=None):
+    async def get_signals_async(self, news_headlines=None):
+        """
+        Same as get_signals(), but klines, funding rate, BTC 24h ticker, DXY and
+        Fear & Greed are fetched concurrently before the signal is evaluated.
+        """
+        import asyncio
+        futures_symbol = self.symbol.replace("USDT", "_USDT")
+        klines, snapshot = await asyncio.gather(
+            asyncio.to_thread(self._fetch_klines),
+            fetch_snapshot(self.context, [futures_symbol])
+        )
+
+        if not klines or len(klines) < 60:
+            print(f"DEBUG: Klines Fetched: {len(klines)}")
+            return {"error": "Insufficient data"}
+
+        ticker_24h = {'priceChangePercent': 0} # simplified
+
+        return self._calculate_signals(klines, ticker_24h, news_headlines, snapshot)
+
+    def get_signals_from_klines(self, klines, news_headlines=None, context=None, ticker_24h=None):
+        """
+        Evaluates candles supplied by the caller (e.g. a streaming feed) with live
+        market inputs, or with `context` (e.g. a snapshot shared by many symbols).
+        """
+        if not klines or len(klines) < 60:
+            return {"error": "Insufficient data"}
+
+        ticker_24h = ticker_24h or {'priceChangePercent': 0} # simplified
+
+        return self._calculate_signals(klines, ticker_24h, news_headlines, context)
+
+    def get_signals_backtest(self, klines, news_headlines=None, context=None):
         """
         Uses PROVIDED klines (historical) and returns signals.
+        Market inputs come from `context` (default: self.backtest_context), looked up at the last candle's time.
         """
         # Mock 24h ticker for backtest (using last 96 candles as a day)
         mock_ticker = {'priceChangePercent': 0}
@@ -155,26 +209,26 @@ class HybridStrategy:
             end_p = float(klines[-1][4])
             mock_ticker['priceChangePercent'] = (end_p - start_p) / start_p * 100
             
-        return self._calculate_signals(klines, mock_ticker, news_headlines)
+        return self._calculate_signals(klines, mock_ticker, news_headlines, context or self.backtest_context)
 
-    def _calculate_signals(self, klines, ticker_24h, news_headlines=None):
+    def _calculate_signals(self, klines, ticker_24h, news_headlines=None, context=None):
         """
         Core logic shared between Live and Backtest.
         """
+        context = context or self.context
+        ts = klines[-1][0]
         # MEXC Klines format: [time, open, high, low, close, volume, ...]
         closes = [float(k[4]) for k in klines]
         
-        # 1. Technical Indicators
-        ema9 = calculate_ema(closes, 9)
-        ema21 = calculate_ema(closes, 21)
-        rsi = calculate_rsi(closes, 14)
+        # 1. Technical Indicators (only candles newer than the last call are processed)
+        inds = self.indicators.sync(klines).values()
         
-        curr_ema9 = ema9[-1]
-        curr_ema21 = ema21[-1]
-        curr_rsi = rsi[-1]
+        curr_ema9 = inds["ema9"]
+        curr_ema21 = inds["ema21"]
+        curr_rsi = inds["rsi"]
         
-        prev_ema9 = ema9[-2]
-        prev_ema21 = ema21[-2]
+        prev_ema9 = inds["prev_ema9"]
+        prev_ema21 = inds["prev_ema21"]
         
         # 2. Fundamental/Sentiment Data
         price_change_percent = float(ticker_24h.get('priceChangePercent', 0)) if ticker_24h else 0
@@ -184,19 +238,19 @@ class HybridStrategy:
             sentiment = self.sentiment_engine.get_market_sentiment(self.symbol, news_headlines)
         
         # 3. Fear & Greed Data
-        fng_data = self.sentiment_engine.get_fear_greed_score()
+        fng_data = context.get_fear_greed(ts)
         fng_value = fng_data["value"]
         fng_class = fng_data["classification"]
         
         # 4. Macro Data (DXY)
-        macro_data = self.macro_client.get_dxy_trend()
+        macro_data = context.get_dxy_trend(ts)
         dxy_sentiment = macro_data["sentiment"] if macro_data else "NEUTRAL"
         dxy_price = macro_data["price"] if macro_data else 0
         
         # 6. Order Flow / Funding Rate (Institutional Protection)
         # Convert SOLUSDT to SOL_USDT for futures API
         futures_symbol = self.symbol.replace("USDT", "_USDT")
-        funding_rate = self.futures_client.get_funding_rate(futures_symbol)
+        funding_rate = context.get_funding_rate(futures_symbol, ts)
         
         # 7. Logic Implementation
         signal = "WAIT"
@@ -212,7 +266,7 @@ class HybridStrategy:
         # 5. Market Correlation (Confirmation from BTC)
         is_market_aligned = True
         if self.symbol != "BTCUSDT":
-            btc_ticker = self.client.get_ticker_24h("BTCUSDT")
+            btc_ticker = context.get_btc_ticker_24h(ts)
             btc_change = float(btc_ticker.get('priceChangePercent', 0))
             # If we want to LONG, BTC shouldn't be crashing (-2% or more)
             if btc_change < -2.0:
@@ -293,13 +347,14 @@ class HybridStrategy:
 
         # AI Prediction
         ai_opinion = "DISABLED"
-        if self.model:
+        model = self.model
+        if model is not None:
             try:
                 # State matches TradingEnvironment: [price, ema9, ema21, rsi, balance, inventory, progress]
                 mock_balance = 100.0 if not self.entry_price else 0.0
                 mock_inv = 0.0 if not self.entry_price else 1.0
                 
-                state = torch.FloatTensor([
+                state = np.array([[
                     closes[-1], 
                     curr_ema9, 
                     curr_ema21, 
@@ -307,11 +362,10 @@ class HybridStrategy:
                     mock_balance, 
                     mock_inv, 
                     1.0
-                ]).unsqueeze(0)
+                ]], dtype=np.float32)
                 
-                with torch.no_grad():
-                    q_values = self.model(state)
-                action = torch.argmax(q_values).item()
+                q_values = model(state)
+                action = int(q_values.argmax())
                 ai_opinion = ["HOLD", "BUY", "SELL"][action]
             except Exception as e:
                 ai_opinion = f"AI ERROR: {str(e)}"
@@ -0,0 +1,215 @@
+import math
+from collections import deque
+
+# Streaming (O(1) per candle) versions of the batch indicators in indicators.py.
+# Each object reproduces the pandas arithmetic of its batch counterpart, so
+# feeding a series candle by candle yields the same values as calling the
+# batch function on the whole series.
+
+def _price(candle, idx=4):
+    """
+    Accepts a raw kline [time, open, high, low, close, volume, ...] or a bare price.
+    """
+    if isinstance(candle, (int, float)):
+        return float(candle)
+    return float(candle[idx])
+
+def _ewm_step(value, alpha, x):
+    """
+    One step of pandas ewm(adjust=False), including its renormalisation.
+    """
+    if value is None:
+        return x
+    old_wt = 1.0 - alpha
+    if value != x:
+        value = ((old_wt * value) + (alpha * x)) / (old_wt + alpha)
+    return value
+
+class StreamingEMA:
+    """
+    Exponential Moving Average. Matches calculate_ema().
+    """
+    def __init__(self, period):
+        self.period = period
+        self.alpha = 1.0 / (1.0 + (period - 1) / 2.0) # pandas span -> alpha
+        self.value = None
+        self.prev_value = None
+
+    def update(self, candle, replace=False):
+        """
+        Adds a candle. replace=True revises the last candle (still forming).
+        """
+        if not replace:
+            self.prev_value = self.value
+        self.value = _ewm_step(self.prev_value, self.alpha, _price(candle))
+        return self.value
+
+class StreamingRSI:
+    """
+    Relative Strength Index (simple rolling mean of gains/losses). Matches calculate_rsi().
+    """
+    def __init__(self, period=14):
+        self.period = period
+        self.gains = deque(maxlen=period)
+        self.losses = deque(maxlen=period)
+        self._dropped = None # (gain, loss) pushed out by the last append
+        self.last_price = None
+        self.prev_price = None
+        self.value = 50.0
+
+    def update(self, candle, replace=False):
+        price = _price(candle)
+        if replace and self.gains:
+            self.gains.pop()
+            self.losses.pop()
+            if self._dropped is not None:
+                self.gains.appendleft(self._dropped[0])
+                self.losses.appendleft(self._dropped[1])
+            self.last_price = self.prev_price
+        else:
+            self.prev_price = self.last_price
+
+        # First candle has no delta; pandas turns its NaN into a 0 gain/loss
+        delta = 0.0 if self.last_price is None else price - self.last_price
+        self._dropped = (self.gains[0], self.losses[0]) if len(self.gains) == self.period else None
+        self.gains.append(delta if delta > 0 else 0.0)
+        self.losses.append(-delta if delta < 0 else 0.0)
+        self.last_price = price
+
+        if len(self.gains) < self.period:
+            self.value = 50.0
+            return self.value
+
+        gain = math.fsum(self.gains) / self.period
+        loss = math.fsum(self.losses) / self.period
+        if loss == 0:
+            # gain/0 -> inf -> RSI 100; 0/0 -> NaN -> filled with 50
+            self.value = 100.0 if gain > 0 else 50.0
+        else:
+            rs = gain / loss
+            self.value = 100 - (100 / (1 + rs))
+        return self.value
+
+class StreamingATR:
+    """
+    Average True Range (Wilder smoothing via ewm alpha=1/period). Matches calculate_atr().
+    """
+    def __init__(self, period=14):
+        self.period = period
+        self.alpha = 1.0 / period
+        self.value = None
+        self.prev_value = None
+        self.last_close = None
+        self.prev_close = None
+
+    def update(self, candle, replace=False):
+        high = _price(candle, 2)
+        low = _price(candle, 3)
+        close = _price(candle, 4)
+        if replace:
+            self.last_close = self.prev_close
+        else:
+            self.prev_value = self.value
+            self.prev_close = self.last_close
+
+        tr = high - low
+        if self.last_close is not None:
+            tr = max(tr, abs(high - self.last_close), abs(low - self.last_close))
+        self.value = _ewm_step(self.prev_value, self.alpha, tr)
+        self.last_close = close
+        return self.value
+
+class StreamingBollinger:
+    """
+    Bollinger Bands (rolling mean +/- std_dev * sample std). Matches calculate_bollinger_bands().
+    Values are NaN until `period` candles have been seen.
+    """
+    def __init__(self, period=20, std_dev=2):
+        self.period = period
+        self.std_dev = std_dev
+        self.window = deque(maxlen=period)
+        self._dropped = None
+        self.ma = self.upper = self.lower = float("nan")
+
+    def update(self, candle, replace=False):
+        price = _price(candle)
+        if replace and self.window:
+            self.window.pop()
+            if self._dropped is not None:
+                self.window.appendleft(self._dropped)
+        self._dropped = self.window[0] if len(self.window) == self.period else None
+        self.window.append(price)
+
+        if len(self.window) < self.period:
+            self.ma = self.upper = self.lower = float("nan")
+            return self.ma, self.upper, self.lower
+
+        n = self.period
+        self.ma = math.fsum(self.window) / n
+        var = math.fsum((p - self.ma) ** 2 for p in self.window) / (n - 1)
+        std = math.sqrt(var)
+        self.upper = self.ma + (std * self.std_dev)
+        self.lower = self.ma - (std * self.std_dev)
+        return self.ma, self.upper, self.lower
+
+class StreamingIndicators:
+    """
+    The indicator set HybridStrategy reads, updated one kline at a time.
+    A kline with the same open time as the previous one revises that candle
+    instead of adding a new one, so the still-forming candle of a live feed
+    can be pushed on every poll.
+    """
+    def __init__(self):
+        self.ema9 = StreamingEMA(9)
+        self.ema21 = StreamingEMA(21)
+        self.rsi = StreamingRSI(14)
+        self.atr = StreamingATR(14)
+        self.bollinger = StreamingBollinger(20, 2)
+        self.last_time = None
+        self.count = 0
+
+    def update(self, candle):
+        replace = self.last_time is not None and candle[0] == self.last_time
+        self.ema9.update(candle, replace)
+        self.ema21.update(candle, replace)
+        self.rsi.update(candle, replace)
+        self.atr.update(candle, replace)
+        self.bollinger.update(candle, replace)
+        self.last_time = candle[0]
+        if not replace:
+            self.count += 1
+
+    def sync(self, klines):
+        """
+        Brings the indicators up to date with a kline window, feeding only the
+        candles at or after the last one seen. Rebuilds from scratch when the
+        window does not overlap with what was already consumed.
+        """
+        start = None
+        if self.last_time is not None:
+            for j in range(len(klines) - 1, -1, -1):
+                t = klines[j][0]
+                if t == self.last_time:
+                    start = j
+                    break
+                if t < self.last_time:
+                    break
+        if start is None:
+            self.__init__()
+            start = 0
+        for k in klines[start:]:
+            self.update(k)
+        return self
+
+    def values(self):
+        return {
+            "ema9": self.ema9.value,
+            "ema21": self.ema21.value,
+            "prev_ema9": self.ema9.prev_value,
+            "prev_ema21": self.ema21.prev_value,
+            "rsi": self.rsi.value,
+            "atr": self.atr.value,
+            "bb_ma": self.bollinger.ma,
+            "bb_upper": self.bollinger.upper,
+            "bb_lower": self.bollinger.lower
+        }
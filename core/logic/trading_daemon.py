@@ -0,0 +1,190 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from core.clients.mexc_client import MEXCClient
+from core.clients.mexc_futures_client import MEXCFuturesClient
+from core.clients.sentiment_engine import SentimentEngine
+from core.clients.macro_api import MacroClient
+from core.clients.market_context import LiveMarketContext, fetch_snapshot
+from core.clients import transport
+from core.data.ohlcv_store import INTERVAL_MS
+from core.logic.strategy import HybridStrategy
+from core.ai.profiler import peak_rss_mb
+
+# One process hosting many HybridStrategy instances behind one scheduler.
+# Every strategy shares the same clients (and so the HTTP pool, rate limiter
+# and endpoint health), sentiment engine, TTL caches and DQN model. Each tick
+# fetches the market context once for all symbols (Fear & Greed, DXY, BTC 24h
+# and each symbol's funding rate) while klines for every symbol are fetched on
+# a thread pool; after the first full fetch only the newest candles are
+# requested and merged in (with a full refetch if they no longer join up,
+# e.g. after a run of failed fetches).
+
+def merge_klines(old, new, limit):
+    """
+    Appends `new` candles to `old` by open time (a candle with the same open
+    time replaces the stored one) and keeps the last `limit`.
+    """
+    if not old:
+        return list(new)[-limit:]
+    merged = list(old)
+    for k in new:
+        if k[0] > merged[-1][0]:
+            merged.append(k)
+        elif k[0] == merged[-1][0]:
+            merged[-1] = k
+    return merged[-limit:]
+
+class TradingDaemon:
+    """
+    Polls `symbols` every `poll_seconds` and trades their signals.
+    dry_run=True (default) logs the orders it would place and tracks paper
+    entries instead of sending them. Spot orders of `amount_usdt` follow the
+    rules of scripts/bot.py: BUY signals buy, SELL signals sell the balance.
+    """
+    def __init__(self, symbols, interval="15m", limit=100, refresh_limit=5, poll_seconds=30, workers=8,
+                 amount_usdt=20.0, dry_run=True, client=None, futures_client=None,
+                 sentiment_engine=None, macro_client=None, context=None):
+        self.interval = interval
+        self.limit = limit
+        self.refresh_limit = refresh_limit
+        self.poll_seconds = poll_seconds
+        self.amount_usdt = amount_usdt
+        self.dry_run = dry_run
+
+        self.client = client or MEXCClient()
+        self.futures_client = futures_client or MEXCFuturesClient()
+        self.sentiment_engine = sentiment_engine or SentimentEngine()
+        self.macro_client = macro_client or MacroClient()
+        self.context = context or LiveMarketContext(self.client, self.futures_client, self.sentiment_engine, self.macro_client)
+        self.strategies = {s: HybridStrategy(s, context=self.context, client=self.client,
+                                             futures_client=self.futures_client,
+                                             sentiment_engine=self.sentiment_engine,
+                                             macro_client=self.macro_client) for s in symbols}
+        self.klines = {s: [] for s in symbols}
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.ticks = 0
+        self.last_tick = {}
+
+    def _get_klines(self, symbol, limit):
+        try:
+            return self.client.get_klines(symbol, self.interval, limit=limit)
+        except Exception as e:
+            print(f"⚠️ [{symbol}] Klines fetch failed: {e}")
+            return []
+
+    def _fetch_klines(self, symbol):
+        # Full history until the buffer is warm, then only the newest candles
+        old = self.klines[symbol]
+        warm = len(old) >= self.limit
+        new = self._get_klines(symbol, self.refresh_limit if warm else self.limit)
+        if warm and new and int(new[0][0]) > int(old[-1][0]) + INTERVAL_MS.get(self.interval, 0):
+            # Candles were missed since the last merge: refetch the whole window
+            print(f"⚠️ [{symbol}] Gap in klines, refetching {self.limit} candles")
+            new = self._get_klines(symbol, self.limit) or new
+        self.klines[symbol] = merge_klines(old, new, self.limit)
+        return self.klines[symbol]
+
+    def tick(self):
+        """
+        One scheduler pass over every symbol. Returns {symbol: signal result}.
+        """
+        import asyncio
+        self.ticks += 1
+        start = time.perf_counter()
+        symbols = list(self.strategies)
+        futures = {s: self.pool.submit(self._fetch_klines, s) for s in symbols}
+        funding_symbols = [s.replace("USDT", "_USDT") for s in symbols]
+        snapshot = asyncio.run(fetch_snapshot(self.context, funding_symbols))
+        klines = {s: f.result() for s, f in futures.items()}
+        fetched = time.perf_counter()
+
+        results = {}
+        for symbol, strategy in self.strategies.items():
+            try:
+                result = strategy.get_signals_from_klines(klines[symbol][-self.limit:], context=snapshot)
+            except Exception as e:
+                result = {"error": str(e)}
+            results[symbol] = result
+            if "error" not in result:
+                self.handle(strategy, result)
+
+        self.last_tick = {"symbols": len(symbols), "fetch_seconds": fetched - start,
+                          "eval_seconds": time.perf_counter() - fetched, "peak_rss_mb": peak_rss_mb()}
+        return results
+
+    def handle(self, strategy, result):
+        """
+        Acts on one strategy's signal (see class docstring).
+        """
+        symbol = strategy.symbol
+        signal = result["signal"]
+        price = result["price"]
+        pnl_str = ""
+        if strategy.entry_price:
+            pnl_str = f" | PNL: {(price - strategy.entry_price) / strategy.entry_price * 100:+.2f}%"
+        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {symbol:<10} Price: {price:,.4f} | AI: {result['ai_opinion']} | Signal: {signal}{pnl_str}")
+
+        if "BUY" in signal and not strategy.entry_price:
+            if self.dry_run:
+                print(f"🧪 [DRY RUN] Would BUY {self.amount_usdt} USDT of {symbol}")
+                strategy.entry_price = price
+                return
+            order = self.client.create_order(symbol=symbol, side="BUY", order_type="MARKET", quoteOrderQty=self.amount_usdt)
+            if 'orderId' in order:
+                print(f"✅ [{symbol}] BUY Order Success: {order['orderId']}")
+                strategy.entry_price = price
+            else:
+                print(f"❌ [{symbol}] BUY Order Failed: {order}")
+
+        elif "SELL" in signal:
+            if self.dry_run:
+                if strategy.entry_price:
+                    print(f"🧪 [DRY RUN] Would SELL all {symbol}")
+                strategy.entry_price = None
+                return
+            asset = symbol.replace("USDT", "")
+            balances = self.client.get_account_info().get('balances', [])
+            balance = next((b['free'] for b in balances if b['asset'] == asset), 0)
+            if float(balance) > 0:
+                order = self.client.create_order(symbol=symbol, side="SELL", order_type="MARKET", quantity=balance)
+                if 'orderId' in order:
+                    print(f"✅ [{symbol}] SELL Order Success: {order['orderId']}")
+                    strategy.entry_price = None
+                else:
+                    print(f"❌ [{symbol}] SELL Order Failed: {order}")
+            else:
+                print(f"⚠️ [{symbol}] No balance to sell.")
+                strategy.entry_price = None
+
+    def print_stats(self):
+        t = self.last_tick
+        rss = f" | RSS {t['peak_rss_mb']:.0f} MB" if t.get("peak_rss_mb") else ""
+        reused = sum(h["reused"] for h in transport.stats().values())
+        print(f"⏱️ Tick {self.ticks}: {t['symbols']} symbols | fetch {t['fetch_seconds']:.2f}s | "
+              f"eval {t['eval_seconds']:.3f}s | reused connections {reused}{rss}")
+
+    def run(self, max_ticks=None):
+        """
+        Polls until interrupted (or for `max_ticks` ticks). A tick that runs
+        long delays the next one instead of overlapping it.
+        """
+        mode = "DRY RUN" if self.dry_run else "LIVE"
+        print(f"🤖 Trading daemon ({mode}) | {len(self.strategies)} symbols | {self.interval} | every {self.poll_seconds}s")
+        try:
+            while max_ticks is None or self.ticks < max_ticks:
+                started = time.monotonic()
+                try:
+                    self.tick()
+                    self.print_stats()
+                except Exception as e:
+                    print(f"⚠️ Error in tick: {e}")
+                if max_ticks is not None and self.ticks >= max_ticks:
+                    break
+                time.sleep(max(0.0, self.poll_seconds - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping trading daemon.")
+        finally:
+            self.close()
+
+    def close(self):
+        self.pool.shutdown(wait=False)
@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Signal codes produced by compute_signals()
+WAIT, BUY, SHORT, BUY_AI = 0, 1, 2, 3
+SIGNAL_NAMES = ["WAIT", "BUY", "SHORT", "BUY (AI DRIVEN)"]
+
+def klines_to_columns(klines):
+    """
+    Converts klines (list of [time, open, high, low, close, volume, ...]) or a
+    DataFrame with those columns into a dict of float64 NumPy arrays.
+    """
+    if isinstance(klines, pd.DataFrame):
+        return {c: klines[c].to_numpy(dtype=np.float64) for c in ["time", "open", "high", "low", "close", "volume"]}
+    arr = np.asarray([k[:6] for k in klines], dtype=np.float64)
+    return {c: arr[:, i] for i, c in enumerate(["time", "open", "high", "low", "close", "volume"])}
+
+def rolling_mean(values, period):
+    """
+    Rolling mean with NaN for the first period-1 entries. Each window is summed
+    on its own (no running cumsum), so exact zeros stay exact.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = sliding_window_view(values, period).sum(axis=1) / period
+    return out
+
+def ema_column(close, period):
+    return pd.Series(close).ewm(span=period, adjust=False).mean().to_numpy()
+
+def rsi_column(close, period=14):
+    """
+    Same definition as calculate_rsi(): simple rolling mean of gains/losses,
+    where the first (undefined) delta counts as zero, NaN filled with 50.
+    """
+    delta = np.diff(close, prepend=close[0])
+    gain = rolling_mean(np.where(delta > 0, delta, 0.0), period)
+    loss = rolling_mean(np.where(delta < 0, -delta, 0.0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + gain / loss))
+    return np.where(np.isnan(rsi), 50.0, rsi)
+
+def poc_column(close, volume, window=100, bins=20, chunk=20000):
+    """
+    Point of Control of calculate_volume_profile() over klines[i-window:i+1],
+    for every bar i >= window (NaN before). Windows are binned in chunks to
+    bound memory.
+    """
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n <= window:
+        return out
+    prices = sliding_window_view(close, window + 1)
+    vols = sliding_window_view(volume, window + 1)
+    for start in range(0, len(prices), chunk):
+        p = prices[start:start + chunk]
+        v = vols[start:start + chunk]
+        rows = len(p)
+        min_p = p.min(axis=1)
+        max_p = p.max(axis=1)
+        flat = max_p == min_p
+        bin_size = np.where(flat, 1.0, (max_p - min_p) / bins)
+        idx = ((p - min_p[:, None]) / bin_size[:, None]).astype(np.int64)
+        # The top price goes into the last bin; rounding can also yield `bins`,
+        # which the dict-based version keeps as a bin of its own
+        idx = np.where(p < max_p[:, None], idx, bins - 1)
+        flat_idx = (np.arange(rows)[:, None] * (bins + 1) + idx).ravel()
+        profile = np.bincount(flat_idx, weights=v.ravel(), minlength=rows * (bins + 1)).reshape(rows, bins + 1)
+        poc = min_p + profile.argmax(axis=1) * bin_size
+        out[window + start:window + start + rows] = np.where(flat, min_p, poc)
+    return out
+
+def ai_actions(model, close, ema9, ema21, rsi):
+    """
+    Runs the DQN on every bar in a single forward pass.
+    State matches _calculate_signals() with no open position.
+    """
+    n = len(close)
+    states = np.column_stack([close, ema9, ema21, rsi, np.full(n, 100.0), np.zeros(n), np.ones(n)]).astype(np.float32)
+    if not hasattr(model, "parameters"):
+        return np.asarray(model(states)).argmax(axis=1) # NumPy export (core.ai.inference)
+    import torch
+    with torch.no_grad():
+        q_values = model(torch.from_numpy(states))
+    return q_values.argmax(dim=1).numpy()
+
+def compute_signals(columns, symbol="SOLUSDT", window=100, fng=50, dxy_sentiment="NEUTRAL",
+                    funding_rate=0.0, btc_change=0.0, model=None):
+    """
+    Evaluates the entry rules of HybridStrategy._calculate_signals() for every
+    bar at once, as get_signals_backtest() would see them on klines[i-window:i+1].
+
+    fng, dxy_sentiment, funding_rate and btc_change may be scalars or per-bar arrays.
+    In backtests the strategy's entry_price is never set, so it carries no
+    position from one bar to the next and only emits entry signals; exits are
+    left to the backtester.
+
+    EMAs run over the whole history, as they do in the per-bar path when one
+    strategy walks the bars in order (its StreamingIndicators carry EMA state
+    from window to window, as in professional_backtester.run()), so the
+    signals match bar for bar. A fresh strategy per window seeds its EMAs
+    on the window's first candle instead; after `window` candles that seed
+    still weighs (1 - 2/22)^window in EMA21 (about 1e-4 for window=100), so
+    crossovers where EMA9 and EMA21 are closer than that can differ.
+
+    Returns a dict of per-bar arrays including `signal` (codes from SIGNAL_NAMES).
+    Bars before `window` are WAIT.
+    """
+    close = columns["close"]
+    n = len(close)
+    ema9 = ema_column(close, 9)
+    ema21 = ema_column(close, 21)
+    rsi = rsi_column(close, 14)
+    poc = poc_column(close, columns["volume"], window)
+
+    prev_ema9 = np.roll(ema9, 1)
+    prev_ema21 = np.roll(ema21, 1)
+    bullish_cross = (prev_ema9 <= prev_ema21) & (ema9 > ema21)
+    bearish_cross = (prev_ema9 >= prev_ema21) & (ema9 < ema21)
+
+    # 24h change over the last 96 candles of the window
+    change_24h = np.zeros(n)
+    if window + 1 >= 96:
+        start_p = np.roll(close, 95)
+        change_24h = (close - start_p) / start_p * 100
+
+    fng = np.broadcast_to(np.asarray(fng, dtype=np.float64), (n,))
+    funding_rate = np.broadcast_to(np.asarray(funding_rate, dtype=np.float64), (n,))
+    macro_favorable = np.broadcast_to(np.asarray(dxy_sentiment) == "BULLISH", (n,))
+    if symbol != "BTCUSDT":
+        market_aligned = np.broadcast_to(np.asarray(btc_change, dtype=np.float64) >= -2.0, (n,))
+    else:
+        market_aligned = np.ones(n, dtype=bool)
+
+    # No headlines in backtests: sentiment is NEUTRAL and the 24h change decides
+    buy = (bullish_cross & (rsi < 65) & market_aligned
+           & ((close >= poc) | (fng < 25) | macro_favorable) & (funding_rate < 0.0003)
+           & ((change_24h > 0) | (fng < 20)))
+    short = bearish_cross & (rsi > 35) & (change_24h < 0)
+
+    signal = np.full(n, WAIT, dtype=np.int8)
+    signal[buy] = BUY
+    signal[short] = SHORT
+    if model is not None:
+        actions = ai_actions(model, close, ema9, ema21, rsi)
+        signal[(signal == WAIT) & (actions == 1)] = BUY_AI
+    signal[:window] = WAIT
+
+    return {
+        "signal": signal,
+        "close": close,
+        "ema9": ema9,
+        "ema21": ema21,
+        "rsi": rsi,
+        "poc": poc,
+        "change_24h": change_24h
+    }
@@ -1,17 +1,31 @@
 import time
-import os
-from mexc_client import MEXCClient
-from strategy import HybridStrategy
+import argparse
+from core.logic.strategy import check_killzone
+from core.logic.scanner import ScannerEngine
+from core.logic.screener import fetch_shortlist
+
+# Symbols to watch (Top MEXC Volume & Movers)
+SYMBOLS = ["SOLUSDT", "BTCUSDT", "ETHUSDT", "XRPUSDT", "DOGEUSDT", "ARBUSDT", "PEPEUSDT"]
+
+def scan_markets(symbols=None, workers=16, show_latency=True, screen_top=None):
+    engine = ScannerEngine(workers=workers)
+    tickers = None
+    if screen_top:
+        # Whole market from one bulk ticker call; only the shortlist is evaluated
+        shortlist, universe = fetch_shortlist(engine.client, book=True, top=screen_top)
+        print(f"🔎 Screener: {len(shortlist)} of {universe} USDT pairs shortlisted")
+        if not shortlist:
+            reason = "bulk ticker call failed" if not universe else "no pair passed the filters"
+            print(f"⚠️ Screener returned no pairs ({reason}); nothing to scan.")
+            return []
+        symbols = [row["symbol"] for row in shortlist]
+        tickers = {row["symbol"]: {"priceChangePercent": row["change_pct"]} for row in shortlist}
+    symbols = [s.replace("_", "") for s in (symbols or SYMBOLS)]
 
-def scan_markets():
-    # Symbols to watch (Top MEXC Volume & Movers)
-    symbols = ["SOLUSDT", "BTCUSDT", "ETHUSDT", "XRPUSDT", "DOGEUSDT", "ARBUSDT", "PEPEUSDT"]
-    
     print(f"🔍 Starting Professional Market Scan | Time: {time.strftime('%H:%M:%S')} WIB")
     
     # Check Killzone first
-    dummy_strat = HybridStrategy("SOLUSDT")
-    killzone = dummy_strat.check_killzone()
+    killzone = check_killzone()
     
     if killzone:
         print(f"🔥 {killzone} SESSION ACTIVE | Expect high volatility.")
@@ -24,64 +38,14 @@ def scan_markets():
         else:
             print(f"💤 Outside Killzones (Quiet Hours). Looking for structural setups.")
 
-    opportunities = []
-
-    for symbol in symbols:
-        try:
-            # Handle MEXC symbol formatting (Spot vs Futures)
-            clean_symbol = symbol.replace("_", "")
-            strategy = HybridStrategy(clean_symbol)
-            
-            result = strategy.get_signals()
-            
-            if result.get('error'):
-                continue
+    def on_result(opp, ranked):
+        best = ranked[0]
+        print(f"   [{len(ranked)}/{len(symbols)}] {opp['symbol']:<12} score {opp['score']} | leader: {best['symbol']} ({best['score']})", end="\r")
 
-            price = result['price']
-            signal = result['signal']
-            gaps = result['recent_gaps']
-            fib = result['fib_levels']
-            poc = result['poc']
-            fng = f"{result['fng']} ({result['fng_class']})"
-            macro = result['macro']['dxy_sentiment']
-            sentiment = result['fundamental']['sentiment']
-            change = result['fundamental']['priceChange24h']
-
-            # Professional Scoring
-            score = 0
-            if "BUY" in signal: score += 3
-            if sentiment == "BULLISH": score += 2
-            if killzone: score += 2
-            if gaps: score += 1
-            
-            # Bonus for POC alignment
-            if price >= poc: score += 1
-            
-            # Bonus for Golden Pocket (0.618) - If price is near it
-            golden_pocket = fib["0.618"]
-            is_near_fib = abs(price - golden_pocket) / price < 0.005 # 0.5% proximity
-            if is_near_fib: score += 2
-
-            opp = {
-                "symbol": symbol,
-                "score": score,
-                "price": price,
-                "signal": signal,
-                "sentiment": sentiment,
-                "fng": fng,
-                "macro": macro,
-                "fib618": golden_pocket,
-                "poc": poc,
-                "gaps": len(gaps),
-                "change": change
-            }
-            opportunities.append(opp)
-            
-        except Exception as e:
-            print(f"⚠️ Error scanning {symbol}: {e}")
-
-    # Sort opportunities by score
-    opportunities = sorted(opportunities, key=lambda x: x['score'], reverse=True)
+    report = engine.scan(symbols, killzone=killzone, on_result=on_result, tickers=tickers)
+    opportunities = report["opportunities"]
+    for symbol, error in report["errors"].items():
+        print(f"⚠️ Error scanning {symbol}: {error}")
 
     print("\n--- Market Opportunity Report ---")
     print(f"{'SYMBOL':<12} | {'SCORE':<5} | {'SIGNAL':<15} | {'F&G INDEX':<12} | {'MACRO (DXY)':<12} | {'SENTIMENT':<10} | {'24H %'}")
@@ -89,5 +53,22 @@ def scan_markets():
     for opp in opportunities:
         print(f"{opp['symbol']:<12} | {opp['score']:<5} | {opp['signal']:<15} | {opp['fng']:<12} | {opp['macro']:<12} | {opp['sentiment']:<10} | {opp['change']:+.2f}%")
 
+    if show_latency:
+        print("\n--- Latency (ms) ---")
+        print(f"{'SYMBOL':<12} | {'KLINES':>8} | {'WAIT SHARED':>11} | {'EVAL':>6} | {'DONE AT':>8}")
+        for opp in sorted(opportunities, key=lambda o: o['latency']['done_at']):
+            lat = opp['latency']
+            print(f"{opp['symbol']:<12} | {lat['klines'] * 1000:>8.0f} | {lat['wait_shared'] * 1000:>11.0f} | {lat['eval'] * 1000:>6.1f} | {lat['done_at'] * 1000:>8.0f}")
+    print(f"\n⏱️ Scanned {len(symbols)} symbols in {report['elapsed']:.2f}s (shared inputs ready after {report['shared_seconds']:.2f}s)")
+    return opportunities
+
 if __name__ == "__main__":
-    scan_markets()
+    parser = argparse.ArgumentParser(description="Rank MEXC symbols by HybridStrategy setup quality")
+    parser.add_argument("--symbols", default=None, help="Comma separated symbols (default: watch list)")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--no-latency", action="store_true", help="Hide the per-symbol latency table")
+    parser.add_argument("--screen", type=int, default=None, metavar="N",
+                        help="Screen the whole market and scan the top N pairs instead of --symbols")
+    args = parser.parse_args()
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()] if args.symbols else None
+    scan_markets(symbols, workers=args.workers, show_latency=not args.no_latency, screen_top=args.screen)
@@ -1,7 +1,5 @@
-import requests
-import pandas as pd
-import time
-from indicators import calculate_rsi
+from core.clients.coingecko_client import CoinGeckoClient
+from core.logic.indicators import calculate_rsi_batch
 
 # Top Memecoins to Scan (CoinGecko IDs)
 MEMES = [
@@ -10,27 +8,18 @@ MEMES = [
     "brett", "mog-coin"
 ]
 
-def get_token_data(coin_id):
-    try:
-        # Fetch 30 days of hourly data for decent RSI calculation
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart?vs_currency=usd&days=14"
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        resp = requests.get(url, headers=headers, verify=False, timeout=10)
-        
-        if resp.status_code == 429:
-            print(f"⚠️ Rate Limit on {coin_id}. Waiting...")
-            time.sleep(5)
-            return None
-            
-        data = resp.json()
-        prices = [p[1] for p in data.get('prices', [])]
-        
-        if len(prices) < 50: return None
-        
-        return pd.Series(prices)
-    except Exception as e:
-        print(f"❌ Error {coin_id}: {e}")
-        return None
+def get_token_data(client, coins):
+    """
+    Hourly prices (14 days, for decent RSI calculation) of every coin, from
+    the chart cache; only points newer than the cache are requested.
+    """
+    charts = client.get_market_charts(coins, days=14)
+    prices = {}
+    for coin in coins:
+        series = [p[1] for p in charts.get(coin, {}).get('prices', [])]
+        if len(series) >= 50:
+            prices[coin] = series
+    return prices
 
 def scan_memes():
     print("🔎 SCANNING MEMECOINS FOR BOTTOM PATTERNS...")
@@ -40,19 +29,16 @@ def scan_memes():
     print("-" * 65)
     
     candidates = []
-    
-    for coin in MEMES:
-        prices = get_token_data(coin)
-        if prices is None: continue
-        
-        # Calculate Indicators
-        rsi_series = calculate_rsi(prices, 14)
-        if isinstance(rsi_series, pd.Series):
-             curr_rsi = rsi_series.iloc[-1]
-        else:
-             curr_rsi = rsi_series[-1]
-             
-        curr_price = prices.iloc[-1]
+
+    client = CoinGeckoClient()
+    markets = client.get_markets(MEMES) # current prices, one call
+    prices = get_token_data(client, MEMES)
+    coins = list(prices)
+    # Calculate Indicators (all coins in one pass)
+    rsis = calculate_rsi_batch([prices[c] for c in coins], 14)
+
+    for coin, curr_rsi in zip(coins, rsis):
+        curr_price = markets.get(coin, {}).get('current_price') or prices[coin][-1]
         
         # Determine Status
         status = "NEUTRAL"
@@ -69,15 +55,16 @@ def scan_memes():
         
         candidates.append({
             "coin": coin,
-            "rsi": curr_rsi,
+            "rsi": float(curr_rsi),
             "price": curr_price
         })
-        
-        # Respect API Rate Limits (HEAVY DELAY for Free Tier)
-        print(f"   (Cooling down for 12s...)")
-        time.sleep(12) 
+
+    for coin in MEMES:
+        if coin not in prices:
+            print(f"⚠️ No chart data for {coin}. Skipping...")
         
     print("-" * 65)
+    print(f"📡 {client.requests} CoinGecko requests")
     
     # Sort by RSI (Lowest First)
     candidates.sort(key=lambda x: x['rsi'])
@@ -90,6 +77,4 @@ def scan_memes():
         print("\n⚠️ No 'Screaming Buy' found. Market might be generally pumpy.")
 
 if __name__ == "__main__":
-    import urllib3
-    urllib3.disable_warnings()
     scan_memes()
@@ -0,0 +1,54 @@
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from core.ai.ai_environment import TradingEnvironment
+
+class LegacyTradingEnvironment(TradingEnvironment):
+    """
+    The previous per-step DataFrame access (df.iloc[step]), kept for comparison.
+    """
+    def _get_observation(self):
+        row = self.df.iloc[self.current_step]
+        return np.array([row['close'], row['ema9'], row['ema21'], row['rsi'], self.balance, self.inventory,
+                         self.current_step / len(self.df)], dtype=np.float32)
+
+    def _add_indicators(self):
+        super()._add_indicators()
+        self.prices = _IlocPrices(self.df)
+
+class _IlocPrices:
+    def __init__(self, df):
+        self.df = df
+
+    def __getitem__(self, i):
+        return self.df.iloc[i]['close']
+
+def synthetic_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    return pd.DataFrame({"time": np.arange(n) * 900000, "open": close, "high": close * 1.001,
+                         "low": close * 0.999, "close": close, "volume": rng.random(n) * 1000})
+
+def steps_per_second(env, steps):
+    rng = np.random.default_rng(1)
+    actions = rng.integers(0, 3, steps)
+    env.reset()
+    started = time.perf_counter()
+    for a in actions:
+        obs, reward, done, info = env.step(int(a))
+        if done:
+            env.reset()
+    return steps / (time.perf_counter() - started)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TradingEnvironment step throughput")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--steps", type=int, default=20000)
+    args = parser.parse_args()
+
+    df = synthetic_frame(args.rows)
+    legacy = steps_per_second(LegacyTradingEnvironment(df=df.copy()), args.steps)
+    fast = steps_per_second(TradingEnvironment(df=df.copy()), args.steps)
+    print(f"🐢 DataFrame iloc env: {legacy:,.0f} steps/s")
+    print(f"🚀 NumPy env:          {fast:,.0f} steps/s ({fast / legacy:.1f}x)")
@@ -0,0 +1,41 @@
+import os
+import sys
+import random
+import argparse
+import numpy as np
+
+# train_agent uses flat imports from core/ai
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core", "ai"))
+
+from ai_environment import TradingEnvironment
+from scripts.benchmark_env import synthetic_frame
+
+def run(num_envs, episodes, rows, seed):
+    import torch
+    import train_agent
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    env = TradingEnvironment(df=synthetic_frame(rows, seed=seed))
+    agent = train_agent.train(num_envs=num_envs, profile=True, env=env, episodes=episodes, save=False, verbose=False)
+    return agent.profiler.report()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reproducible DQN training throughput benchmark on synthetic data")
+    parser.add_argument("--episodes", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--num-envs", default="1,8", help="Comma separated vector sizes to compare")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = {}
+    for n in [int(x) for x in args.num_envs.split(",")]:
+        print(f"\n🏋️ num_envs={n}")
+        results[n] = run(n, args.episodes, args.rows, args.seed)
+
+    print("\n📊 SUMMARY")
+    print(f"{'num_envs':>8} | {'elapsed':>8} | {'steps/s':>10} | {'samples/s':>10} | {'peak RSS':>9}")
+    for n, r in results.items():
+        rss = f"{r['peak_rss_mb']:.0f} MB" if r["peak_rss_mb"] is not None else "n/a"
+        print(f"{n:>8} | {r['elapsed']:>7.2f}s | {r['rates'].get('steps/s', 0):>10,.0f} | "
+              f"{r['rates'].get('samples/s', 0):>10,.0f} | {rss:>9}")
@@ -1,5 +1,4 @@
 from strategy import HybridStrategy
-import time
 
 def check_solid_assets():
     print("🏰 FORTRESS SCAN: Analyzing Solid Fundamentals (BTC & SOL)...")
@@ -66,9 +65,6 @@ def check_solid_assets():
                 
         except Exception as e:
             print(f"❌ Analysis Failed: {e}")
-            
-        print("   (Cooling down API for 16s...)")
-        time.sleep(16) # Heavy delay for Rate Limits
 
 if __name__ == "__main__":
     import urllib3
@@ -1,62 +1,58 @@
-import time
-import pandas as pd
-from mexc_client import MEXCClient
+import argparse
+from datetime import datetime, timezone
+from core.data.ohlcv_store import OHLCVStore, INTERVAL_MS
+from core.data.backfill import backfill
 
-def collect_historical_data(symbol="SOLUSDT", interval="15m", total_batches=5):
+def _to_ms(date_str):
+    dt = datetime.fromisoformat(date_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+def _now_ms():
+    return int(datetime.now(timezone.utc).timestamp() * 1000)
+
+def collect_historical_data(symbol="SOLUSDT", interval="15m", total_batches=5, store=None):
     """
     Collects multiple batches of historical K-lines for AI training.
+    Candles are backfilled into the OHLCV store (resuming from the last
+    saved one, and extending it back if it holds less than total_batches x
+    1000) and the latest total_batches x 1000 are exported to CSV.
     """
-    client = MEXCClient()
+    store = store or OHLCVStore()
     print(f"📥 Starting data collection for {symbol} ({interval})...")
-    
-    all_klines = []
-    
-    # We fetch batches of 1000 (max)
-    # The API returns oldest to newest. To go back in time, we fetch current, then use its oldest timestamp as endTime for the next call.
-    
-    end_time = None
-    for b in range(total_batches):
-        print(f"Fetching batch {b+1}/{total_batches}...")
-        
-        endpoint = "/api/v3/klines"
-        params = {
-            "symbol": symbol,
-            "interval": interval,
-            "limit": 1000
-        }
-        if end_time:
-            params["endTime"] = end_time - 1 # Subtract 1ms to avoid overlap
-            
-        import requests
-        response = requests.get(f"{client.base_url}{endpoint}", params=params)
-        klines = response.json()
-        
-        if not klines or 'error' in klines:
-            print("❌ No more data or error.")
-            break
-            
-        all_klines = klines + all_klines # Prepend older data
-        end_time = klines[0][0] # Update end_time to the oldest timestamp in this batch
-        
-        time.sleep(1) # Rate limit protection
-    
-    if all_klines:
-        # Sort by time just in case
-        all_klines.sort(key=lambda x: x[0])
-    
-    if all_klines:
-        df = pd.DataFrame(all_klines, columns=[
-            'time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_asset_volume'
-        ])
-        
+    span = total_batches * 1000 * INTERVAL_MS[interval]
+    result = backfill(symbol, interval, start_ms=_now_ms() - span, store=store)
+
+    if store.exists(symbol, interval):
+        last = store.last_time(symbol, interval)
+        df = store.to_frame(symbol, interval, start=last - span + INTERVAL_MS[interval])
+
         # Save to CSV for AI4Finance tools to ingest
         filename = f"{symbol}_{interval}_historical.csv"
         df.to_csv(filename, index=False)
         print(f"💾 Data saved to {filename}")
         return filename
     else:
-        print("❌ Failed to collect data.")
+        print(f"❌ Failed to collect data. ({result})")
         return None
 
 if __name__ == "__main__":
-    collect_historical_data()
+    parser = argparse.ArgumentParser(description="Backfill MEXC klines into the local OHLCV store")
+    parser.add_argument("--symbols", default=None, help="Comma separated symbols (backfill mode)")
+    parser.add_argument("--interval", default="15m")
+    parser.add_argument("--start", default=None, help="ISO date, e.g. 2023-01-01 (earlier than the stored history extends it back)")
+    parser.add_argument("--end", default=None, help="ISO date (default: now)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--root", default=None, help="OHLCV store directory")
+    args = parser.parse_args()
+
+    if args.symbols:
+        store = OHLCVStore(args.root)
+        for symbol in [s.strip().upper() for s in args.symbols.split(",") if s.strip()]:
+            backfill(symbol, args.interval,
+                     start_ms=_to_ms(args.start) if args.start else None,
+                     end_ms=_to_ms(args.end) if args.end else None,
+                     store=store, workers=args.workers)
+    else:
+        collect_historical_data()
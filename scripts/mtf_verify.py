@@ -1,9 +1,14 @@
+import time
 from mexc_client import MEXCClient
 from indicators import calculate_ema, calculate_rsi
+from core.data.ohlcv_store import OHLCVStore, INTERVAL_MS
+from core.data.backfill import backfill
+from core.logic.resample import resample, to_klines
 
-def analyze_timeframe(symbol, interval):
-    client = MEXCClient()
-    klines = client.get_klines(symbol, interval, limit=100)
+def analyze_timeframe(symbol, interval, klines=None):
+    if klines is None:
+        client = MEXCClient()
+        klines = client.get_klines(symbol, interval, limit=100)
     if not klines:
         return "ERROR"
     
@@ -22,14 +27,34 @@ def analyze_timeframe(symbol, interval):
         "ema21": ema21
     }
 
-def run_mtfa(symbol="BTCUSDT"):
+def base_klines(symbol, timeframes, store=None, base="1m", bars=100):
+    """
+    Derives the last `bars` klines of every timeframe (forming bar included,
+    like the REST endpoint) from one base series kept up to date in the store.
+    """
+    store = store or OHLCVStore()
+    client = MEXCClient()
+    longest = max(INTERVAL_MS[tf] for tf in timeframes)
+    now = int(time.time() * 1000)
+    start = now - now % longest - (bars - 1) * longest
+    # Incremental after the first run: only candles since the last saved one
+    backfill(symbol, base, start_ms=start, store=store)
+    # The forming base candle is not stored; the REST call covers it
+    forming = client.get_klines(symbol, base, limit=1) or []
+    cols = store.load(symbol, base, start=start)
+    if forming and (len(cols["time"]) == 0 or int(forming[-1][0]) > cols["time"][-1]):
+        cols = {c: list(cols[c]) + [float(forming[-1][i])] for i, c in enumerate(["time", "open", "high", "low", "close", "volume"])}
+    return {tf: to_klines(resample(cols, tf, base))[-bars:] for tf in timeframes}
+
+def run_mtfa(symbol="BTCUSDT", rest=False):
     timeframes = ["15m", "60m", "4h"]
     results = {}
     
     print(f"🔍 Performing Multi-Timeframe Analysis for {symbol}...\n")
+    derived = None if rest else base_klines(symbol, timeframes)
     
     for tf in timeframes:
-        results[tf] = analyze_timeframe(symbol, tf)
+        results[tf] = analyze_timeframe(symbol, tf, derived[tf] if derived else None)
         res = results[tf]
         print(f"[{tf}] Price: {res['price']} | Trend: {res['trend']} | RSI: {res['rsi']:.2f}")
 
@@ -43,4 +68,9 @@ def run_mtfa(symbol="BTCUSDT"):
         print("\n⚠️ CONSENSUS: MIXED (Market is consolidating/neutral)")
 
 if __name__ == "__main__":
-    run_mtfa()
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--symbol", default="BTCUSDT")
+    parser.add_argument("--rest", action="store_true", help="Fetch every timeframe separately instead of resampling the stored 1m series")
+    args = parser.parse_args()
+    run_mtfa(args.symbol, rest=args.rest)
@@ -1,10 +1,20 @@
 import pandas as pd
 import numpy as np
+import time
 from strategy import HybridStrategy
+from core.clients.market_context import HistoricalMarketContext
+from core.data.ohlcv_store import OHLCVStore
+from core.logic.vectorized_backtest import compute_signals, klines_to_columns, SIGNAL_NAMES
 
 class ProfessionalBacktester:
-    def __init__(self, csv_path="/Users/radenyudi/.gemini/antigravity/scratch/quant_trade_ai/SOLUSDT_15m_historical.csv", initial_balance=20.0, leverage=3):
+    def __init__(self, csv_path="/Users/radenyudi/.gemini/antigravity/scratch/quant_trade_ai/SOLUSDT_15m_historical.csv", initial_balance=20.0, leverage=3, context=None, store=None, symbol="SOLUSDT", interval="15m"):
         self.csv_path = csv_path
+        # OHLCVStore to read candles from instead of the CSV
+        self.store = store
+        self.symbol = symbol
+        self.interval = interval
+        # Offline Fear & Greed / DXY / funding / BTC inputs (neutral when None)
+        self.context = context or HistoricalMarketContext()
         self.initial_balance = initial_balance
         self.balance = initial_balance
         self.leverage = leverage
@@ -12,7 +22,11 @@ class ProfessionalBacktester:
         self.entry_price = 0
         self.trades = []
         
-    def run(self):
+    def _load_frame(self):
+        if self.store is not None:
+            print(f"📊 Loading historical data from store {self.store.path(self.symbol, self.interval)}...")
+            return self.store.to_frame(self.symbol, self.interval, columns=["time", "open", "high", "low", "close", "volume"])
+
         print(f"📊 Loading historical data from {self.csv_path}...")
         df = pd.read_csv(self.csv_path)
         
@@ -21,8 +35,12 @@ class ProfessionalBacktester:
         if 'close' not in df.columns:
             # Fallback for raw MEXC list-style CSV
             df.columns = ['time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_vol']
+        return df
+
+    def run(self):
+        df = self._load_frame()
             
-        strategy = HybridStrategy("SOLUSDT")
+        strategy = HybridStrategy(self.symbol, backtest_context=self.context)
         
         print(f"🚀 Starting Professional Backtest | Initial: ${self.balance} | Leverage: {self.leverage}x")
         
@@ -39,45 +57,75 @@ class ProfessionalBacktester:
             result = strategy.get_signals_backtest(current_klines)
             signal = result['signal']
             
-            # Position Management
-            if not self.position:
-                if "BUY" in signal:
-                    self.position = "LONG"
-                    self.entry_price = current_price
-                    # print(f"Entry LONG at ${current_price:.2f}")
-                elif "SHORT" in signal:
-                    self.position = "SHORT"
-                    self.entry_price = current_price
-                    # print(f"Entry SHORT at ${current_price:.2f}")
+            self._manage_position(signal, current_price)
+
+        self.print_summary()
+
+    def _manage_position(self, signal, current_price):
+        """
+        Position state machine shared by the per-bar and vectorized runs.
+        """
+        # Position Management
+        if not self.position:
+            if "BUY" in signal:
+                self.position = "LONG"
+                self.entry_price = current_price
+                # print(f"Entry LONG at ${current_price:.2f}")
+            elif "SHORT" in signal:
+                self.position = "SHORT"
+                self.entry_price = current_price
+                # print(f"Entry SHORT at ${current_price:.2f}")
             
-            else:
-                # Check for Exit (Strategy logic handled crossover)
-                exit_signal = False
-                pnl_pct = 0
+        else:
+            # Check for Exit (Strategy logic handled crossover)
+            exit_signal = False
+            pnl_pct = 0
                 
-                if self.position == "LONG":
-                    pnl_pct = (current_price - self.entry_price) / self.entry_price
-                    if "SELL" in signal or pnl_pct <= -0.015 or pnl_pct >= 0.04:
-                        exit_signal = True
-                elif self.position == "SHORT":
-                    pnl_pct = (self.entry_price - current_price) / self.entry_price
-                    if "COVER" in signal or pnl_pct <= -0.015 or pnl_pct >= 0.04:
-                        exit_signal = True
+            if self.position == "LONG":
+                pnl_pct = (current_price - self.entry_price) / self.entry_price
+                if "SELL" in signal or pnl_pct <= -0.015 or pnl_pct >= 0.04:
+                    exit_signal = True
+            elif self.position == "SHORT":
+                pnl_pct = (self.entry_price - current_price) / self.entry_price
+                if "COVER" in signal or pnl_pct <= -0.015 or pnl_pct >= 0.04:
+                    exit_signal = True
                 
-                if exit_signal:
-                    # Calculate PNL with leverage
-                    trade_profit = self.initial_balance * pnl_pct * self.leverage
-                    self.balance += trade_profit
-                    self.trades.append({
-                        'type': self.position,
-                        'entry': self.entry_price,
-                        'exit': current_price,
-                        'profit': trade_profit,
-                        'pnl_pct': pnl_pct * self.leverage * 100
-                    })
-                    self.position = None
-                    self.entry_price = 0
+            if exit_signal:
+                # Calculate PNL with leverage
+                trade_profit = self.initial_balance * pnl_pct * self.leverage
+                self.balance += trade_profit
+                self.trades.append({
+                    'type': self.position,
+                    'entry': self.entry_price,
+                    'exit': current_price,
+                    'profit': trade_profit,
+                    'pnl_pct': pnl_pct * self.leverage * 100
+                })
+                self.position = None
+                self.entry_price = 0
+
+    def run_vectorized(self, symbol=None, window=100):
+        """
+        Same rules as run(), but indicators and entry conditions are computed
+        once for the whole history; only the position state is walked bar by bar.
+        """
+        symbol = symbol or self.symbol
+        df = self._load_frame()
+
+        strategy = HybridStrategy(symbol)
 
+        print(f"🚀 Starting Vectorized Backtest | Initial: ${self.balance} | Leverage: {self.leverage}x")
+        started = time.perf_counter()
+        columns = klines_to_columns(df)
+        inputs = self.context.columns(columns["time"], symbol)
+        cols = compute_signals(columns, symbol=symbol, window=window, model=strategy.model, **inputs)
+        signals = cols["signal"]
+        closes = cols["close"]
+
+        for i in range(window, len(closes)):
+            self._manage_position(SIGNAL_NAMES[signals[i]], float(closes[i]))
+
+        print(f"⏱️ {len(closes) - window} bars evaluated in {time.perf_counter() - started:.2f}s")
         self.print_summary()
 
     def print_summary(self):
@@ -97,5 +145,21 @@ class ProfessionalBacktester:
         print("="*40)
 
 if __name__ == "__main__":
-    tester = ProfessionalBacktester()
-    tester.run()
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default=None, help="Historical klines CSV")
+    parser.add_argument("--context-dir", default=None, help="Directory with fear_greed.csv, dxy.csv, funding_rate.csv, BTCUSDT_15m_historical.csv")
+    parser.add_argument("--store", nargs="?", const="", default=None, help="Read candles from the OHLCV store (optional root dir) instead of a CSV")
+    parser.add_argument("--symbol", default="SOLUSDT")
+    parser.add_argument("--interval", default="15m")
+    parser.add_argument("--per-bar", action="store_true", help="Re-evaluate the strategy on every bar (slow, reference mode)")
+    args = parser.parse_args()
+
+    context = HistoricalMarketContext.from_dir(args.context_dir) if args.context_dir else None
+    store = OHLCVStore(args.store or None) if args.store is not None else None
+    kwargs = {"context": context, "store": store, "symbol": args.symbol, "interval": args.interval}
+    tester = ProfessionalBacktester(args.csv, **kwargs) if args.csv else ProfessionalBacktester(**kwargs)
+    if args.per_bar:
+        tester.run()
+    else:
+        tester.run_vectorized()
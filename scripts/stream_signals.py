@@ -0,0 +1,38 @@
+import asyncio
+import argparse
+import time
+import pandas as pd
+from core.logic.strategy import HybridStrategy
+from core.clients.mexc_stream import MEXCStream, ReplayStream, StreamingFeed
+from core.clients.mexc_client import MEXCClient
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate HybridStrategy on every closed candle of a WebSocket feed")
+    parser.add_argument("--symbols", default="SOLUSDT", help="Comma separated symbols")
+    parser.add_argument("--interval", default="15m")
+    parser.add_argument("--replay", default=None, help="Replay a klines CSV instead of connecting to MEXC")
+    args = parser.parse_args()
+
+    symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+    strategies = {s: HybridStrategy(s) for s in symbols}
+
+    def on_close(symbol, klines):
+        result = strategies[symbol].get_signals_from_klines(klines[-100:])
+        if 'error' in result:
+            print(f"[{symbol}] Warming up... ({len(klines)} candles)")
+            return
+        print(f"[{time.strftime('%H:%M:%S')}] {symbol} | Price: {result['price']:,.4f} | RSI: {result['indicators']['rsi']:.2f} | AI: {result['ai_opinion']} | Signal: {result['signal']}")
+
+    client = None
+    if args.replay:
+        klines = pd.read_csv(args.replay).values.tolist()
+        source = ReplayStream({s: klines for s in symbols}, args.interval)
+    else:
+        source = MEXCStream(symbols, args.interval)
+        client = MEXCClient() # REST history first, so signals start at the first close
+
+    print(f"📡 Streaming {', '.join(symbols)} ({args.interval})...")
+    asyncio.run(StreamingFeed(source, on_close, client=client).run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import unittest
+import numpy as np
+from core.ai.ai_environment import TradingEnvironment
+from scripts.benchmark_env import LegacyTradingEnvironment, synthetic_frame
+
+class TestTradingEnvironment(unittest.TestCase):
+    def test_matches_dataframe_stepping(self):
+        df = synthetic_frame(300)
+        fast, legacy = TradingEnvironment(df=df.copy()), LegacyTradingEnvironment(df=df.copy())
+        np.testing.assert_array_equal(fast.reset(), legacy.reset())
+        for action in np.random.default_rng(2).integers(0, 3, 400):
+            a, b = fast.step(int(action)), legacy.step(int(action))
+            np.testing.assert_array_equal(a[0], b[0])
+            self.assertEqual(a[1:3], b[1:3])
+            if a[2]:
+                break
+        self.assertTrue(a[2])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import tempfile
+import threading
+import time
+import unittest
+from core.data.ohlcv_store import OHLCVStore
+from core.data.backfill import backfill, find_gaps
+
+STEP = 60000
+MISSING = {30 * STEP, 31 * STEP}  # exchange outage
+
+def fake_exchange(calls, fail_from=None):
+    lock = threading.Lock()
+    def fetch(symbol, interval, start, end):
+        with lock:
+            calls.append(start)
+        if fail_from is not None and start >= fail_from:
+            raise RuntimeError("boom")
+        time.sleep(random.random() * 0.01)  # finish out of order
+        # Overlap one candle on each side to exercise dedupe/filtering
+        return [[t, 1, 1, 1, t / STEP, 1] for t in range(max(0, start - STEP), end + STEP, STEP) if t not in MISSING]
+    return fetch
+
+class TestBackfill(unittest.TestCase):
+    def test_concurrent_in_order_and_resume(self):
+        with tempfile.TemporaryDirectory() as d:
+            store = OHLCVStore(d)
+            calls = []
+            result = backfill("SOLUSDT", "1m", 0, 50 * STEP, store=store, workers=4, chunk_candles=7,
+                              retries=1, fetch=fake_exchange(calls, fail_from=35 * STEP))
+            self.assertFalse(result["complete"])
+            self.assertEqual(store.last_time("SOLUSDT", "1m"), 34 * STEP)
+            self.assertEqual(result["gaps"], [(30 * STEP, 32 * STEP)])
+
+            calls.clear()
+            result = backfill("SOLUSDT", "1m", 0, 50 * STEP, store=store, chunk_candles=7, fetch=fake_exchange(calls))
+            self.assertTrue(result["complete"])
+            self.assertEqual(min(calls), 35 * STEP)  # resumed after the last saved candle
+            times = list(store.load("SOLUSDT", "1m")["time"])
+            self.assertEqual(times, [t * STEP for t in range(50) if t * STEP not in MISSING])
+
+    def test_earlier_start_deepens_history(self):
+        with tempfile.TemporaryDirectory() as d:
+            store = OHLCVStore(d)
+            backfill("SOLUSDT", "1m", 40 * STEP, 50 * STEP, store=store, chunk_candles=7, fetch=fake_exchange([]))
+
+            # A failed older range leaves the stored series untouched
+            result = backfill("SOLUSDT", "1m", 20 * STEP, 50 * STEP, store=store, chunk_candles=7, retries=1,
+                              fetch=fake_exchange([], fail_from=27 * STEP))
+            self.assertFalse(result["complete"])
+            self.assertEqual(store.first_time("SOLUSDT", "1m"), 40 * STEP)
+
+            calls = []
+            result = backfill("SOLUSDT", "1m", 20 * STEP, 50 * STEP, store=store, chunk_candles=7,
+                              fetch=fake_exchange(calls))
+            self.assertTrue(result["complete"])
+            self.assertEqual(result["added"], 18)
+            self.assertEqual(result["gaps"], [(30 * STEP, 32 * STEP)])
+            self.assertEqual(min(calls), 20 * STEP)
+            self.assertTrue(max(calls) < 40 * STEP)  # nothing refetched after the stored range
+            cols = store.load("SOLUSDT", "1m")
+            self.assertEqual(list(cols["time"]), [t * STEP for t in range(20, 50) if t * STEP not in MISSING])
+            self.assertEqual(list(cols["close"][:2]), [20.0, 21.0])
+
+    def test_find_gaps(self):
+        self.assertEqual(find_gaps([3, 4, 7], 1, previous=1), [(2, 3), (5, 7)])
+
+if __name__ == "__main__":
+    unittest.main()
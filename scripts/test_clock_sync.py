@@ -0,0 +1,96 @@
+import time
+import threading
+import unittest
+from unittest import mock
+from core.clients import clock_sync
+from core.clients.clock_sync import ClockSync
+from core.clients.mexc_client import MEXCClient
+from core.clients.mexc_futures_client import MEXCFuturesClient
+
+class FakeTime:
+    """
+    Stand-in for the time module seen by clock_sync: wall clock under test control.
+    """
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+        self.monotonic = time.monotonic
+        self.sleep = time.sleep
+
+    def time(self):
+        return self.now
+
+class FakeServer:
+    """
+    fetch_server_time(): each sample takes rtts[i] seconds and the server
+    clock runs offsets[i] ms ahead at the midpoint. None raises.
+    """
+    def __init__(self, clock, rtts, offsets):
+        self.clock = clock
+        self.samples = list(zip(rtts, offsets))
+
+    def __call__(self):
+        rtt, offset = self.samples.pop(0)
+        if rtt is None:
+            raise ConnectionError("timeout")
+        self.clock.now += rtt / 2
+        server = self.clock.now * 1000 + offset
+        self.clock.now += rtt / 2
+        return server
+
+class TestClockSync(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeTime()
+        patcher = mock.patch.object(clock_sync, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_offset_is_taken_at_rtt_midpoint(self):
+        sync = ClockSync(FakeServer(self.clock, [0.2], [500.0]), samples=1)
+        self.assertAlmostEqual(sync.sync(), 500.0, places=3)
+        self.assertAlmostEqual(sync.rtt_ms, 200.0, places=3)
+        self.assertEqual(sync.now_ms(), int(self.clock.now * 1000 + sync.offset_ms))
+
+    def test_lowest_rtt_sample_wins(self):
+        server = FakeServer(self.clock, [0.4, None, 0.05, 0.3], [700.0, 0, 500.0, 900.0])
+        sync = ClockSync(server, samples=4)
+        self.assertAlmostEqual(sync.sync(), 500.0, places=3)
+        self.assertAlmostEqual(sync.rtt_ms, 50.0, places=3)
+
+    def test_falls_back_to_local_clock_when_sync_fails(self):
+        sync = ClockSync(FakeServer(self.clock, [None] * 3, [0] * 3), samples=3, refresh_interval=3600)
+        with self.assertRaises(RuntimeError):
+            sync.sync()
+        sync._last_attempt = -sync.retry_interval  # allow the first now_ms() to retry
+        server = sync.fetch_server_time = FakeServer(self.clock, [None] * 3, [0] * 3)
+        self.assertEqual(sync.now_ms(), int(self.clock.now * 1000))
+        self.assertIsNone(sync.synced_at)
+        self.assertEqual(server.samples, [])
+        # Within retry_interval the next call does not hit the server again
+        self.assertEqual(sync.now_ms(), int(self.clock.now * 1000))
+
+class TestSharedClock(unittest.TestCase):
+    def test_concurrent_first_calls_build_one_clock(self):
+        created = []
+
+        class SlowClockSync:
+            def __init__(self, fetch_server_time):
+                time.sleep(0.05)  # widen the check-then-set window
+                created.append(self)
+
+            def now_ms(self):
+                return 0
+
+        for cls in (MEXCClient, MEXCFuturesClient):
+            created.clear()
+            module = __import__(cls.__module__, fromlist=["ClockSync"])
+            with mock.patch.object(cls, "clock", None), mock.patch.object(module, "ClockSync", SlowClockSync):
+                client = cls.__new__(cls)
+                threads = [threading.Thread(target=client._get_server_time) for _ in range(8)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+            self.assertEqual(len(created), 1)
+
+if __name__ == "__main__":
+    unittest.main()
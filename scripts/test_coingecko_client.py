@@ -0,0 +1,53 @@
+import time
+import tempfile
+import unittest
+from core.clients.coingecko_client import CoinGeckoClient, merge_points
+
+HOUR = 3600000
+
+class FakeCoinGecko(CoinGeckoClient):
+    """
+    Serves an hourly series ending now; records every request.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+
+    def _get(self, path, params):
+        self.calls.append((path, dict(params)))
+        now_ms = int(time.time() * 1000)
+        if path.endswith("/market_chart"):
+            start = now_ms - params["days"] * 86400000
+        else:
+            start = params["from"] * 1000
+        points = [[t, t / HOUR] for t in range(start, now_ms, HOUR)] + [[now_ms, now_ms / HOUR]]
+        return {"prices": points, "total_volumes": [[t, 1.0] for t, _ in points]}
+
+class TestCoinGeckoClient(unittest.TestCase):
+    def test_merge_drops_provisional_point(self):
+        cached = [[0, 1], [HOUR, 2], [HOUR + 60000, 3]]  # last is the live point
+        new = [[HOUR, 2], [2 * HOUR, 4], [2 * HOUR + 300000, 5], [2 * HOUR + 360000, 6]]
+        self.assertEqual(merge_points(cached, new, HOUR), [[0, 1], [HOUR, 2], [2 * HOUR, 4], [2 * HOUR + 360000, 6]])
+
+    def test_chart_cache_is_incremental(self):
+        with tempfile.TemporaryDirectory() as d:
+            client = FakeCoinGecko(cache_dir=d, max_age=0)
+            first = client.get_market_chart("solana", days=14)
+            self.assertEqual(client.calls[0][0], "/coins/solana/market_chart")
+            self.assertGreater(len(first["prices"]), 14 * 24 - 2)
+
+            # A new process reads the disk cache and only asks for the newest points
+            again = FakeCoinGecko(cache_dir=d, max_age=0)
+            second = again.get_market_chart("solana", days=14)
+            path, params = again.calls[0]
+            self.assertEqual(path, "/coins/solana/market_chart/range")
+            self.assertGreater(params["from"], time.time() - 3 * 3600)
+            self.assertLessEqual(abs(len(second["prices"]) - len(first["prices"])), 1)
+            self.assertGreaterEqual(second["prices"][-1][0], first["prices"][-1][0])
+
+            cached = FakeCoinGecko(cache_dir=d, max_age=300)
+            cached.get_market_chart("solana", days=14)
+            self.assertEqual(cached.calls, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import time
+import unittest
+from core.clients.endpoint_health import EndpointHealth
+
+class TestEndpointHealth(unittest.TestCase):
+    def test_failover_and_circuit_breaker(self):
+        health = EndpointHealth(failure_threshold=2, cooldown=60)
+        calls = []
+
+        def fetch(endpoint):
+            calls.append(endpoint)
+            if endpoint == "dead":
+                raise ConnectionError("down")
+            return endpoint
+
+        self.assertEqual(health.call(fetch, ["dead", "alive"]), "alive")
+        self.assertEqual(calls, ["dead", "alive"])
+        # The failed host is now ranked behind the one that answered
+        self.assertEqual(health.ordered(["dead", "alive"]), ["alive", "dead"])
+
+        health.record_failure("dead")
+        self.assertFalse(health.is_available("dead"))
+        self.assertEqual(health.ordered(["dead", "alive"]), ["alive"])  # open circuit is skipped
+
+    def test_orders_by_latency(self):
+        health = EndpointHealth()
+        health.record_success("slow", 0.8)
+        health.record_success("fast", 0.1)
+        self.assertEqual(health.ordered(["slow", "fast"]), ["fast", "slow"])
+
+    def test_hedged_call_races_next_endpoint(self):
+        health = EndpointHealth(default_hedge_delay=0.05)
+
+        def fetch(endpoint):
+            time.sleep(1.0 if endpoint == "stalled" else 0.01)
+            return endpoint
+
+        started = time.perf_counter()
+        self.assertEqual(health.call(fetch, ["stalled", "mirror"], hedge=True), "mirror")
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+from core.clients.gemini_client import GeminiClient, HeadlineScoreCache, headline_key, parse_scores
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+class StubModel:
+    """
+    Scores "surge" headlines 0.8 and everything else -0.5, and records prompts.
+    """
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        lines = [l for l in prompt.splitlines() if l[:1].isdigit()]
+        return StubResponse(json.dumps([0.8 if "surge" in l else -0.5 for l in lines]))
+
+class TestGeminiCache(unittest.TestCase):
+    def test_only_unseen_headlines_are_sent(self):
+        model = StubModel()
+        client = GeminiClient(model=model, cache_path="")
+        self.assertAlmostEqual(client.analyze_sentiment(["BTC surge", "Exchange hack"]), 0.15)
+        self.assertEqual(client.score_headlines(["btc  SURGE", "New listing"]), [0.8, -0.5])
+        self.assertEqual(len(model.prompts), 2)
+        self.assertNotIn("surge", model.prompts[1].lower())  # cached headline not re-sent
+        client.analyze_sentiment(["Exchange hack", "New listing"])
+        self.assertEqual(len(model.prompts), 2)
+
+    def test_persistence_and_eviction(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "scores.json")
+            GeminiClient(model=StubModel(), cache_path=path, max_entries=2).score_headlines(["a", "b", "c surge"])
+            with open(path) as f:
+                self.assertEqual(len(json.load(f)), 2)
+
+            # A new process starts from the file
+            cache = HeadlineScoreCache(path)
+            self.assertEqual(cache.get(headline_key("c surge")), 0.8)
+            self.assertIsNone(cache.get(headline_key("a")))  # least recently used, evicted
+
+    def test_default_location_follows_quant_cache_dir(self):
+        with tempfile.TemporaryDirectory() as d:
+            # Unset: shared in memory by the process, nothing written
+            with mock.patch.dict(os.environ, {"QUANT_CACHE_DIR": ""}):
+                first, second = GeminiClient(model=StubModel()), GeminiClient(model=StubModel())
+            self.assertIs(first.cache, second.cache)
+            self.assertIsNone(first.cache.path)
+
+            with mock.patch.dict(os.environ, {"QUANT_CACHE_DIR": d}):
+                client = GeminiClient(model=StubModel())
+            client.score_headlines(["BTC surge"])
+            self.assertEqual(client.cache.path, os.path.join(d, "gemini_scores.json"))
+            self.assertTrue(os.path.exists(client.cache.path))
+
+    def test_parse_scores(self):
+        self.assertEqual(parse_scores("Scores: [0.5, -2, 0]", 3), [0.5, -1.0, 0.0])
+        self.assertEqual(parse_scores("1. 0.3\n2. -0.4", 2), [0.3, -0.4])
+        self.assertIsNone(parse_scores("[0.5]", 2))
+
+if __name__ == "__main__":
+    unittest.main()
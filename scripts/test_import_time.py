@@ -0,0 +1,46 @@
+import os
+import re
+import sys
+import subprocess
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the live scripts import at start-up, and the heavy dependencies
+# that must only load once a code path needs them.
+ENTRY_MODULES = ["core.logic.strategy", "core.clients.sentiment_engine", "core.clients.mexc_client",
+                 "core.clients.mexc_futures_client", "core.clients.macro_api"]
+HEAVY = ["torch", "pandas", "google.generativeai", "dotenv", "requests", "asyncio"]
+BUDGET_SECONDS = 1.0
+
+def import_profile(module):
+    """
+    Imports `module` in a fresh interpreter under -X importtime.
+    Returns (cumulative seconds for `module`, heavy modules that got loaded).
+    """
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=ROOT, GEMINI_API_KEY="")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    if result.returncode != 0:
+        raise AssertionError(result.stderr[-2000:])
+    # "import time: self [us] | cumulative | imported package"
+    cumulative = None
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$", line)
+        if match and match.group(2) == module:
+            cumulative = int(match.group(1)) / 1e6
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return cumulative, loaded
+
+class TestImportTime(unittest.TestCase):
+    def test_entry_modules_stay_light(self):
+        for module in ENTRY_MODULES:
+            with self.subTest(module=module):
+                seconds, loaded = import_profile(module)
+                self.assertEqual(loaded, [])
+                self.assertIsNotNone(seconds)
+                self.assertLess(seconds, BUDGET_SECONDS)
+
+if __name__ == "__main__":
+    unittest.main()
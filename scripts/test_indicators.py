@@ -1,12 +1,15 @@
+import math
+import random
 import unittest
-from indicators import calculate_ema, calculate_rsi
+from core.logic.indicators import calculate_ema, calculate_rsi, calculate_rsi_batch, calculate_atr, calculate_bollinger_bands
+from core.logic.streaming_indicators import StreamingIndicators
 
 class TestIndicators(unittest.TestCase):
     def test_ema(self):
         prices = [10, 10, 10, 10, 10]
         ema5 = calculate_ema(prices, 5)
         self.assertEqual(ema5[-1], 10)
-        
+
     def test_rsi_flat(self):
         # All same prices = RSI Neutral/Undefined but handled by pandas
         prices = [10] * 20
@@ -19,5 +22,79 @@ class TestIndicators(unittest.TestCase):
         rsi = calculate_rsi(prices, 14)
         self.assertGreater(rsi[-1], 50)
 
+    def test_rsi_batch_matches_rsi(self):
+        random.seed(3)
+        series = [[100 + random.uniform(-5, 5) for _ in range(n)] for n in (10, 13, 14, 15, 40, 200)] + [[10] * 20]
+        expected = [calculate_rsi(s, 14)[-1] for s in series]
+        for got, want in zip(calculate_rsi_batch(series, 14), expected):
+            self.assertAlmostEqual(got, want, places=9)
+
+class TestStreamingIndicators(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        price = 100.0
+        self.klines = []
+        for i in range(300):
+            close = price + random.gauss(0, 1)
+            high = max(price, close) + abs(random.gauss(0, 0.5))
+            low = min(price, close) - abs(random.gauss(0, 0.5))
+            self.klines.append([i * 900000, price, high, low, close, 1.0])
+            price = close
+        # A flat stretch exercises the zero-loss / zero-gain RSI branches
+        for i in range(300, 330):
+            self.klines.append([i * 900000, price, price, price, price, 1.0])
+
+    def assertSeriesEqual(self, streamed, batch, places=9):
+        for s, b in zip(streamed, batch):
+            if math.isnan(b):
+                self.assertTrue(math.isnan(s))
+            else:
+                self.assertAlmostEqual(s, b, places=places)
+
+    def test_matches_batch(self):
+        closes = [k[4] for k in self.klines]
+        highs = [k[2] for k in self.klines]
+        lows = [k[3] for k in self.klines]
+        ema9 = calculate_ema(closes, 9)
+        rsi = calculate_rsi(closes, 14)
+        atr = calculate_atr(highs, lows, closes, 14)
+        ma, upper, lower = calculate_bollinger_bands(closes)
+
+        inds = StreamingIndicators()
+        rows = []
+        for k in self.klines:
+            inds.update(k)
+            rows.append(inds.values())
+        self.assertSeriesEqual([r["ema9"] for r in rows], ema9)
+        self.assertSeriesEqual([r["rsi"] for r in rows], rsi)
+        self.assertSeriesEqual([r["atr"] for r in rows], atr)
+        self.assertSeriesEqual([r["bb_ma"] for r in rows], ma)
+        # pandas' online rolling variance leaves a ~1e-12 residue on flat windows,
+        # which the square root turns into ~1e-6 on the bands
+        self.assertSeriesEqual([r["bb_upper"] for r in rows], upper, places=5)
+        self.assertSeriesEqual([r["bb_lower"] for r in rows], lower, places=5)
+
+    def test_forming_candle_is_revised(self):
+        inds = StreamingIndicators()
+        ref = StreamingIndicators()
+        for k in self.klines:
+            forming = [k[0], k[1], k[2] + 3, k[3] - 3, k[4] + 2, 1.0]
+            inds.update(forming)
+            inds.update(k)
+            ref.update(k)
+        self.assertEqual(inds.count, len(self.klines))
+        self.assertEqual(inds.values(), ref.values())
+
+    def test_sync_feeds_only_new_candles(self):
+        inds = StreamingIndicators().sync(self.klines[:100])
+        inds.sync(self.klines[50:150])
+        self.assertEqual(inds.count, 150)
+        ref = StreamingIndicators().sync(self.klines[:150])
+        self.assertEqual(inds.values(), ref.values())
+
+        # A window that does not overlap rebuilds the state
+        inds.sync(self.klines[200:260])
+        self.assertEqual(inds.count, 60)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from core.ai import inference
+from core.ai.inference import NumpyDQN, load_model
+
+def fake_state_dict(seed=0):
+    # Shapes of train_agent.DQN(7, 3): torch Linear weights are (out, in)
+    rng = np.random.default_rng(seed)
+    shapes = {0: (64, 7), 2: (64, 64), 4: (3, 64)}
+    sd = {}
+    for i, shape in shapes.items():
+        sd[f"fc.{i}.weight"] = rng.standard_normal(shape).astype(np.float32)
+        sd[f"fc.{i}.bias"] = rng.standard_normal(shape[0]).astype(np.float32)
+    return sd
+
+class TestNumpyDQN(unittest.TestCase):
+    def test_matches_mlp_and_round_trips(self):
+        sd = fake_state_dict()
+        model = NumpyDQN.from_state_dict(sd)
+        states = np.random.default_rng(1).standard_normal((5, 7)).astype(np.float32)
+        h = np.maximum(states @ sd["fc.0.weight"].T + sd["fc.0.bias"], 0)
+        h = np.maximum(h @ sd["fc.2.weight"].T + sd["fc.2.bias"], 0)
+        expected = h @ sd["fc.4.weight"].T + sd["fc.4.bias"]
+        np.testing.assert_allclose(model(states), expected, rtol=1e-5, atol=1e-4)
+        self.assertEqual(model.predict(states[0]), expected[0].argmax())
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "agent.npz")
+            model.save(path)
+            loaded = load_model(os.path.join(d, "missing.pth"), path)
+            np.testing.assert_array_equal(loaded(states), model(states))
+            self.assertIsNone(load_model(os.path.join(d, "missing.pth"), os.path.join(d, "missing.npz")))
+
+class TestStrategyModel(unittest.TestCase):
+    def test_none_disables_shared_model(self):
+        from core.logic.strategy import HybridStrategy
+        shared = NumpyDQN.from_state_dict(fake_state_dict())
+        klines = [[i * 900000, 100.0 + i, 102.0 + i, 99.0 + i, 101.0 + i, 10.0] for i in range(100)]
+        context = mock.Mock(get_fear_greed=lambda ts=None: {"value": 50, "classification": "Neutral"},
+                            get_dxy_trend=lambda ts=None: {"price": 100, "change_pct": 0, "sentiment": "NEUTRAL"},
+                            get_funding_rate=lambda symbol, ts=None: 0.0,
+                            get_btc_ticker_24h=lambda ts=None: {"priceChangePercent": 0})
+        with mock.patch.object(inference, "get_model", lambda: shared):
+            strategy = HybridStrategy(context=context, client=object(), futures_client=object(),
+                                      sentiment_engine=object(), macro_client=object())
+            self.assertIs(strategy.model, shared)
+            self.assertIn(strategy.get_signals_from_klines(klines)["ai_opinion"], ("HOLD", "BUY", "SELL"))
+
+            strategy.model = None
+            self.assertIsNone(strategy.model)
+            self.assertEqual(strategy.get_signals_from_klines(klines)["ai_opinion"], "DISABLED")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import re
+import unittest
+from core.logic.keyword_matcher import KeywordMatcher
+
+BULLISH = ['bullish', 'surge', 'pump', 'breakout', 'growth', 'partnership',
+           'adoption', 'listing', 'buy', 'positive', 'green', 'moon']
+BEARISH = ['bearish', 'drop', 'dump', 'crash', 'negative', 'sell', 'red',
+           'scam', 'hack', 'regulation', 'ban', 'fud']
+
+def reference_score(text):
+    # Original SentimentEngine.analyze_text
+    text = text.lower()
+    bull = sum(len(re.findall(f'\\b{w}\\b', text)) for w in BULLISH)
+    bear = sum(len(re.findall(f'\\b{w}\\b', text)) for w in BEARISH)
+    return 0 if bull + bear == 0 else (bull - bear) / (bull + bear)
+
+HEADLINES = [
+    "Bitcoin surges past 100k as institutional adoption grows",
+    "SOL pump and dump: traders sell the breakout",
+    "Exchange HACK sparks crash; regulators mull ban",
+    "Nothing to see here",
+    "Green candles, moon talk, buy buy buy",
+    "Red Sea shipping news",
+]
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_matches_original_scoring(self):
+        matcher = KeywordMatcher.from_lists(BULLISH, BEARISH)
+        for h in HEADLINES:
+            self.assertAlmostEqual(matcher.score(h), reference_score(h))
+        batch = matcher.score_batch(HEADLINES * 50)
+        for h, s in zip(HEADLINES * 50, batch):
+            self.assertAlmostEqual(s, reference_score(h))
+
+    def test_weighted_multi_word_terms(self):
+        matcher = KeywordMatcher({"etf approved": 3, "approved": 1, "rug pull": -2, "pull": 0.5})
+        self.assertEqual(matcher.counts("Spot ETF  approved after rug pull"), (3.0, 2.0))
+        self.assertAlmostEqual(matcher.score("Spot ETF approved after rug pull"), 0.2)
+        # Phrases do not match across headlines in a batch
+        self.assertEqual(list(matcher.score_batch(["rug", "pull", ""])), [0.0, 1.0, 0.0])
+
+if __name__ == "__main__":
+    unittest.main()
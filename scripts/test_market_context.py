@@ -0,0 +1,139 @@
+import os
+import time
+import asyncio
+import tempfile
+import unittest
+import numpy as np
+from core.clients.market_context import (MarketContextProvider, HistoricalMarketContext, fetch_snapshot,
+                                         NEUTRAL_FNG, NEUTRAL_DXY)
+from core.logic.strategy import HybridStrategy
+
+DELAY = 0.2
+
+class SlowContext(MarketContextProvider):
+    """
+    Every getter takes DELAY seconds, like a network call.
+    """
+    def __init__(self):
+        self.calls = []
+
+    def _slow(self, name, value):
+        time.sleep(DELAY)
+        self.calls.append(name)
+        return value
+
+    def get_fear_greed(self, ts=None):
+        return self._slow("fng", {"value": 50, "classification": "Neutral"})
+
+    def get_dxy_trend(self, ts=None):
+        return self._slow("dxy", {"price": 100, "change_pct": 0, "sentiment": "NEUTRAL"})
+
+    def get_btc_ticker_24h(self, ts=None):
+        return self._slow("btc", {"priceChangePercent": 0})
+
+    def get_funding_rate(self, symbol, ts=None):
+        return self._slow(symbol, 0.0001)
+
+class TestConcurrentInputs(unittest.TestCase):
+    def test_fetch_snapshot_costs_the_slowest_input(self):
+        context = SlowContext()
+        started = time.perf_counter()
+        snapshot = asyncio.run(fetch_snapshot(context, ["SOL_USDT", "ETH_USDT"]))
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(sorted(context.calls), ["ETH_USDT", "SOL_USDT", "btc", "dxy", "fng"])
+        self.assertEqual(snapshot.get_funding_rate("ETH_USDT"), 0.0001)
+        # Five DELAY-long inputs: about max(latencies), far below their sum
+        self.assertLess(elapsed, DELAY * 2)
+
+    def test_get_signals_async_gathers_klines_and_context(self):
+        strategy = HybridStrategy("SOLUSDT", context=SlowContext(), client=object(), futures_client=object(),
+                                  sentiment_engine=object(), macro_client=object())
+
+        def slow_klines():
+            time.sleep(DELAY)
+            return [[i * 900000, 100.0 + i, 102.0 + i, 99.0 + i, 101.0 + i, 10.0] for i in range(100)]
+        strategy._fetch_klines = slow_klines
+
+        started = time.perf_counter()
+        result = asyncio.run(strategy.get_signals_async())
+        elapsed = time.perf_counter() - started
+
+        self.assertIn("signal", result)
+        self.assertLess(elapsed, DELAY * 2)
+
+T0 = 1_700_000_000_000 # ms
+HOUR, DAY = 3600000, 86400000
+
+def write_csv(path, header, rows):
+    with open(path, "w") as f:
+        f.write(header + "\n")
+        for row in rows:
+            f.write(",".join(str(v) for v in row) + "\n")
+
+class TestHistoricalMarketContext(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        d = self.tmp.name
+        # Alternative.me style seconds, out of order on purpose
+        write_csv(os.path.join(d, "fear_greed.csv"), "timestamp,value,classification",
+                  [((T0 + DAY) // 1000, 70, "Greed"), (T0 // 1000, 20, "Extreme Fear")])
+        write_csv(os.path.join(d, "dxy.csv"), "timestamp,price,change_pct",
+                  [(T0, 104.0, 0.3), (T0 + DAY, 103.5, -0.5)])
+        write_csv(os.path.join(d, "funding_rate.csv"), "timestamp,symbol,fundingRate",
+                  [(T0, "SOL_USDT", 0.0001), (T0 + 8 * HOUR, "SOL_USDT", 0.0003), (T0, "ETH_USDT", -0.0002)])
+        # 15m BTC candles over two days, close = 100 + i
+        write_csv(os.path.join(d, "BTCUSDT_15m_historical.csv"), "time,open,high,low,close,volume",
+                  [(T0 + i * 900000, 100 + i, 101 + i, 99 + i, 100 + i, 1) for i in range(192)])
+        self.context = HistoricalMarketContext.from_dir(d)
+
+    def test_asof_has_no_lookahead(self):
+        # Seconds and milliseconds files line up after _to_ms
+        self.assertEqual(self.context.get_fear_greed(T0 + DAY - 1), {"value": 20, "classification": "Extreme Fear"})
+        self.assertEqual(self.context.get_fear_greed(T0 + DAY)["value"], 70)
+        self.assertEqual(self.context.get_fear_greed(), {"value": 70, "classification": "Greed"})
+        self.assertEqual(self.context.get_dxy_trend(T0 + DAY - 1)["sentiment"], "BEARISH")
+        self.assertEqual(self.context.get_dxy_trend(T0 + DAY)["sentiment"], "BULLISH")
+
+    def test_before_first_row_is_neutral(self):
+        self.assertEqual(self.context.get_fear_greed(T0 - 1), NEUTRAL_FNG)
+        self.assertEqual(self.context.get_dxy_trend(T0 - 1), NEUTRAL_DXY)
+        self.assertEqual(self.context.get_funding_rate("SOL_USDT", T0 - 1), 0)
+        self.assertEqual(self.context.get_btc_ticker_24h(T0 - 1), {"priceChangePercent": 0})
+
+    def test_funding_is_per_symbol(self):
+        self.assertEqual(self.context.get_funding_rate("SOL_USDT", T0 + HOUR), 0.0001)
+        self.assertEqual(self.context.get_funding_rate("SOL_USDT", T0 + 8 * HOUR), 0.0003)
+        self.assertEqual(self.context.get_funding_rate("ETH_USDT", T0 + 8 * HOUR), -0.0002)
+        self.assertEqual(self.context.get_funding_rate("XRP_USDT", T0 + 8 * HOUR), 0)
+
+    def test_btc_change(self):
+        # 30h in: candle 120 now, candle 24 a day earlier
+        change = self.context.get_btc_ticker_24h(T0 + 30 * HOUR)["priceChangePercent"]
+        self.assertAlmostEqual(change, (220 - 124) / 124 * 100)
+        # Less than a day of history yet
+        self.assertEqual(self.context.get_btc_ticker_24h(T0 + 23 * HOUR)["priceChangePercent"], 0)
+        self.assertAlmostEqual(self.context.get_btc_ticker_24h()["priceChangePercent"], (291 - 195) / 195 * 100)
+
+    def test_columns_match_scalar_lookups(self):
+        times = [T0 - HOUR, T0, T0 + 8 * HOUR, T0 + DAY - 1, T0 + 30 * HOUR]
+        cols = self.context.columns(times, "SOLUSDT")
+        for k, ts in enumerate(times):
+            self.assertEqual(cols["fng"][k], self.context.get_fear_greed(ts)["value"])
+            self.assertEqual(cols["dxy_sentiment"][k], self.context.get_dxy_trend(ts)["sentiment"])
+            self.assertEqual(cols["funding_rate"][k], self.context.get_funding_rate("SOL_USDT", ts))
+            self.assertAlmostEqual(cols["btc_change"][k], self.context.get_btc_ticker_24h(ts)["priceChangePercent"])
+
+    def test_from_dir_skips_missing_files(self):
+        os.remove(os.path.join(self.tmp.name, "dxy.csv"))
+        os.remove(os.path.join(self.tmp.name, "BTCUSDT_15m_historical.csv"))
+        context = HistoricalMarketContext.from_dir(self.tmp.name)
+        self.assertEqual(context.get_dxy_trend(T0 + DAY), NEUTRAL_DXY)
+        self.assertEqual(context.get_btc_ticker_24h(T0 + DAY), {"priceChangePercent": 0})
+        self.assertEqual(context.get_fear_greed(T0 + DAY)["value"], 70)
+        cols = context.columns(np.array([T0 + DAY]), "SOLUSDT")
+        self.assertEqual((cols["dxy_sentiment"][0], cols["btc_change"][0]), ("NEUTRAL", 0.0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+from core.clients import transport
+from core.clients.endpoint_health import EndpointHealth
+from core.clients.mexc_client import MEXCClient
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+
+    def json(self):
+        return self.data
+
+KLINES = [[0, "1", "2", "0.5", "1.5", "10", 899999, "15"]]
+
+class TestMEXCClientFailover(unittest.TestCase):
+    def setUp(self):
+        self.client = MEXCClient(hedge_reads=False)
+        self.client.health = EndpointHealth()
+        self.calls = []
+
+    def serve(self, bodies):
+        # bodies: {mirror base url: FakeResponse}
+        def get(url, **kwargs):
+            base = next(b for b in bodies if url.startswith(b))
+            self.calls.append(base)
+            return bodies[base]
+        return mock.patch.object(transport, "get", get)
+
+    def test_error_body_fails_over_to_next_mirror(self):
+        bodies = {"https://api.mexc.com": FakeResponse({"code": 429, "msg": "Too many requests"}, 429),
+                  "https://api.mexc.so": FakeResponse(KLINES)}
+        with self.serve(bodies):
+            self.assertEqual(self.client.get_klines("SOLUSDT", "15m", limit=1), KLINES)
+        self.assertEqual(self.calls, ["https://api.mexc.com", "https://api.mexc.so"])
+        # The error body counts against the mirror that sent it
+        self.assertEqual(self.client.health.ordered(self.client.endpoints[:2]),
+                         ["https://api.mexc.so", "https://api.mexc.com"])
+
+    def test_error_body_with_200_status_still_fails_over(self):
+        bodies = {"https://api.mexc.com": FakeResponse({"code": 429}),
+                  "https://api.mexc.so": FakeResponse([{"symbol": "SOLUSDT"}])}
+        with self.serve(bodies):
+            self.assertEqual(self.client.get_all_tickers_24h(), [{"symbol": "SOLUSDT"}])
+
+        bodies = {"https://api.mexc.com": FakeResponse({"code": -1121, "msg": "Invalid symbol."}),
+                  "https://api.mexc.so": FakeResponse({"symbol": "SOLUSDT", "priceChangePercent": "1.5"})}
+        with self.serve(bodies):
+            self.assertEqual(self.client.get_ticker_24h("SOLUSDT")["priceChangePercent"], "1.5")
+
+    def test_all_mirrors_failing_returns_empty(self):
+        bodies = {"https://api.mexc.com": FakeResponse({"code": 429}, 429),
+                  "https://api.mexc.so": FakeResponse([])}
+        with self.serve(bodies):
+            self.assertEqual(self.client.get_klines("SOLUSDT", "15m"), [])
+            self.assertEqual(self.client.get_all_book_tickers(), [])
+
+if __name__ == "__main__":
+    unittest.main()
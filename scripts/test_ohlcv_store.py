@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from core.data.ohlcv_store import OHLCVStore
+
+def make_klines(start, n, step=60000):
+    return [[start + i * step, "1.0", "2.0", "0.5", str(1.0 + i), "10", start + i * step + step - 1, "15"] for i in range(n)]
+
+class TestOHLCVStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = OHLCVStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_append_dedupe_and_range(self):
+        self.assertEqual(self.store.append("SOLUSDT", "1m", make_klines(0, 5)), 5)
+        # Overlap: rows 3 and 4 exist, row 4 (the newest) is revised, 5..7 are new
+        revised = make_klines(180000, 5)
+        revised[1][4] = "99"
+        self.assertEqual(self.store.append("SOLUSDT", "1m", revised), 3)
+        cols = self.store.load("SOLUSDT", "1m")
+        self.assertEqual(list(cols["time"]), [i * 60000 for i in range(8)])
+        self.assertEqual(cols["close"][4], 99.0)
+        self.assertEqual(self.store.last_time("SOLUSDT", "1m"), 7 * 60000)
+
+        window = self.store.load("SOLUSDT", "1m", start=120000, end=300000, columns=["time", "close"])
+        self.assertEqual(list(window), ["time", "close"])
+        self.assertEqual(list(window["time"]), [120000, 180000, 240000])
+        self.assertIsInstance(window["close"], np.memmap)
+
+    def test_import_csv_and_partial_write_recovery(self):
+        path = os.path.join(self.tmp.name, "hist.csv")
+        pd.DataFrame(make_klines(0, 4, 900000), columns=[
+            'time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_asset_volume']).to_csv(path, index=False)
+        self.assertEqual(self.store.import_csv(path, "BTCUSDT", "15m"), 4)
+        self.assertEqual(self.store.to_frame("BTCUSDT", "15m")["quote_volume"].tolist(), [15.0] * 4)
+
+        # Bytes from an interrupted append are dropped on the next one
+        with open(os.path.join(self.store.path("BTCUSDT", "15m"), "close.bin"), "ab") as f:
+            f.write(b"\x00" * 5)
+        self.store.append("BTCUSDT", "15m", [[3600000, 1, 1, 1, 7, 1]])
+        df = self.store.to_frame("BTCUSDT", "15m")
+        self.assertEqual(df["close"].tolist(), [1.0, 2.0, 3.0, 4.0, 7.0])
+        self.assertEqual(int(df["close_time"].iloc[-1]), 3600000 + 900000 - 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import time
+import unittest
+from core.ai.profiler import TrainingProfiler
+
+class TestTrainingProfiler(unittest.TestCase):
+    def test_phases_rates_and_disabled_mode(self):
+        profiler = TrainingProfiler(trace_memory=True)
+        profiler.start()
+        for _ in range(3):
+            with profiler.phase("env_step"):
+                time.sleep(0.01)
+            profiler.count("steps")
+        with profiler.phase("learn"):
+            bytearray(10 ** 6)
+        profiler.stop()
+        report = profiler.report()
+        self.assertEqual(report["phases"]["env_step"]["calls"], 3)
+        self.assertGreaterEqual(report["phases"]["env_step"]["seconds"], 0.03)
+        self.assertAlmostEqual(report["rates"]["steps/s"], 3 / report["elapsed"])
+        self.assertGreater(report["python_peak_mb"], 0.9)
+
+        off = TrainingProfiler(enabled=False)
+        with off.phase("env_step"):
+            off.count("steps")
+        self.assertEqual((off.timings, off.counters), ({}, {}))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import time
+import unittest
+from core.clients.rate_limiter import RateLimiter, TokenBucket
+
+class TestTokenBucket(unittest.TestCase):
+    def test_pause_releases_queue_at_rate(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        bucket.pause(0.2)
+        waits = sorted(bucket._reserve(1) for _ in range(25))
+        # Nobody before the pause ends, then one request per 1/rate seconds
+        self.assertGreaterEqual(waits[0], 0.2)
+        gaps = [b - a for a, b in zip(waits, waits[1:])]
+        self.assertTrue(all(abs(g - 0.1) < 1e-3 for g in gaps))
+        self.assertAlmostEqual(waits[-1] - waits[0], 2.4, places=2)
+
+    def test_burst_then_refill_rate(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+        started = time.monotonic()
+        waits = [bucket.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - started
+        self.assertEqual(waits[:2], [0.0, 0.0])  # burst
+        self.assertGreater(waits[2], 0)
+        self.assertGreaterEqual(elapsed, 0.09)   # 2 extra tokens at 20/s
+        self.assertEqual(bucket.throttled, 2)
+
+    def test_weight_and_pause(self):
+        limiter = RateLimiter({"api.example.com": (100, 10)})
+        self.assertEqual(limiter.acquire("api.example.com", weight=10), 0.0)
+        self.assertGreater(limiter.acquire("api.example.com", weight=5), 0)
+        limiter.pause("api.example.com", 0.1)
+        self.assertGreaterEqual(limiter.acquire("api.example.com"), 0.09)
+        self.assertEqual(limiter.acquire("unlimited.example.com"), 0.0)  # no bucket configured
+        self.assertEqual(limiter.stats()["api.example.com"]["requests"], 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import sys
+import unittest
+import importlib.util
+import numpy as np
+from core.ai.ai_environment import TradingEnvironment
+from core.ai.replay_buffer import ReplayBuffer, SumTree
+from core.ai.vector_env import VectorTradingEnvironment
+from scripts.benchmark_env import synthetic_frame
+
+class TestReplayBuffer(unittest.TestCase):
+    def test_ring_buffer_overwrites_oldest(self):
+        buf = ReplayBuffer(4, state_dim=2, seed=0)
+        for i in range(6):
+            buf.add([i, i], i % 3, float(i), [i + 1, i + 1], i == 5)
+        self.assertEqual(len(buf), 4)
+        self.assertEqual(sorted(buf.rewards), [2.0, 3.0, 4.0, 5.0])
+        buf.add_batch(np.zeros((3, 2)), [0, 1, 2], [7.0, 8.0, 9.0], np.ones((3, 2)), [0, 0, 1])
+        self.assertEqual(sorted(buf.rewards), [5.0, 7.0, 8.0, 9.0])
+        states, actions, rewards, next_states, dones, idx, weights = buf.sample(32)
+        self.assertEqual((states.shape, states.dtype, actions.dtype), ((32, 2), np.float32, np.int64))
+        self.assertTrue((weights == 1).all())
+
+    def test_sum_tree(self):
+        tree = SumTree(5)
+        tree.update([0, 1, 2, 3, 4], [1.0, 2.0, 3.0, 0.0, 4.0])
+        self.assertEqual(tree.total(), 10.0)
+        self.assertEqual(list(tree.find([0.5, 1.5, 3.5, 6.5, 9.9])), [0, 1, 2, 4, 4])
+
+    def test_prioritized_sampling_follows_priorities(self):
+        buf = ReplayBuffer(8, state_dim=1, prioritized=True, alpha=1.0, seed=1)
+        for i in range(8):
+            buf.add([i], 0, 0.0, [i], False)
+        buf.update_priorities(np.arange(8), np.array([9.0] + [1.0] * 7))
+        counts = np.zeros(8)
+        for _ in range(200):
+            _, _, _, _, _, idx, weights = buf.sample(16)
+            counts += np.bincount(idx, minlength=8)
+        self.assertAlmostEqual(counts[0] / counts.sum(), 9 / 16, delta=0.03)
+        # The over-sampled transition gets the smallest importance weight
+        _, _, _, _, _, idx, weights = buf.sample(16)
+        self.assertEqual(weights[idx == 0].max(), weights.min())
+
+class TestVectorReplay(unittest.TestCase):
+    """The add_batch path train_vectorized() uses, without torch."""
+    def test_add_batch_gets_max_priority(self):
+        buf = ReplayBuffer(6, state_dim=2, prioritized=True, alpha=0.5, seed=0)
+        buf.add_batch(np.zeros((4, 2)), np.arange(4), np.zeros(4), np.zeros((4, 2)), np.zeros(4))
+        leaves = buf.tree.tree[buf.tree.leaves:buf.tree.leaves + 6]
+        np.testing.assert_allclose(leaves, [1, 1, 1, 1, 0, 0])
+
+        buf.update_priorities(np.array([0, 1]), np.array([4.0, 0.0]))
+        self.assertAlmostEqual(buf.max_priority, 4.0 + buf.eps)
+        # Rows 4, 5 and the wrapped row 0 get the new maximum; row 1 keeps its TD error
+        buf.add_batch(np.ones((3, 2)), np.arange(3), np.ones(3), np.ones((3, 2)), np.ones(3))
+        leaves = buf.tree.tree[buf.tree.leaves:buf.tree.leaves + 6]
+        top = (4.0 + buf.eps) ** 0.5
+        np.testing.assert_allclose(leaves, [top, buf.eps ** 0.5, 1, 1, top, top])
+        self.assertAlmostEqual(buf.tree.total(), leaves.sum())
+        self.assertEqual((buf.pos, len(buf)), (1, 6))
+        self.assertEqual(buf.actions.tolist(), [2, 1, 2, 3, 0, 1])
+
+    def test_vector_steps_fill_prioritized_buffer(self):
+        venv = VectorTradingEnvironment([TradingEnvironment(df=synthetic_frame(200))], num_envs=4,
+                                        max_steps=30, seed=0)
+        buf = ReplayBuffer(1000, state_dim=7, prioritized=True, seed=0)
+        rng = np.random.default_rng(0)
+        states = venv.reset()
+        truncations = 0
+        dones = []
+        for _ in range(60):
+            # Same call as train_vectorized()
+            actions = rng.integers(0, 3, venv.num_envs)
+            next_states, rewards, terminated, truncated, info = venv.step(actions)
+            buf.add_batch(states, actions, rewards, info["final_observation"], terminated)
+            truncations += int(truncated.sum())
+            dones.append(terminated)
+            if truncated.any():
+                # The stored next state is the cut-off episode's last observation, not the reset one
+                np.testing.assert_array_equal(buf.next_states[buf.pos - 4:buf.pos][truncated],
+                                              info["final_observation"][truncated])
+                self.assertFalse(np.array_equal(info["final_observation"][truncated], next_states[truncated]))
+            states = next_states
+        self.assertGreater(truncations, 0)
+        self.assertEqual(len(buf), 240)
+        # Only terminations are stored as done; 30-step cut-offs keep bootstrapping
+        np.testing.assert_array_equal(buf.dones[:240], np.concatenate(dones))
+        np.testing.assert_allclose(buf.tree.total(), 240.0)
+
+        s, a, r, ns, d, idx, weights = buf.sample(32)
+        self.assertTrue((idx < 240).all())
+        np.testing.assert_array_equal(s, buf.states[idx])
+        np.testing.assert_array_equal(a, buf.actions[idx])
+        # Equal priorities: every importance weight is 1
+        np.testing.assert_allclose(weights, 1.0)
+
+        buf.update_priorities(idx, np.full(32, 3.0))
+        self.assertAlmostEqual(buf.max_priority, 3.0 + buf.eps)
+
+@unittest.skipUnless(importlib.util.find_spec("torch"), "torch is not installed")
+class TestAgentReplay(unittest.TestCase):
+    def test_replay_learns_from_both_buffers(self):
+        # train_agent uses flat imports from core/ai
+        saved = list(sys.path)
+        self.addCleanup(sys.path.__setitem__, slice(None), saved)
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core", "ai"))
+        from train_agent import Agent
+
+        rng = np.random.default_rng(0)
+        for prioritized in (False, True):
+            agent = Agent(7, 3, prioritized=prioritized)
+            for _ in range(80):
+                agent.remember(rng.normal(size=7), int(rng.integers(3)), float(rng.normal()), rng.normal(size=7), False)
+            before = [p.detach().clone() for p in agent.model.parameters()]
+            total = agent.memory.tree.total() if prioritized else None
+            agent.replay(32)
+            changed = any((b != a.detach()).any() for b, a in zip(before, agent.model.parameters()))
+            self.assertTrue(changed)
+            self.assertLess(agent.epsilon, 1.0)
+            if prioritized:
+                # Sampled transitions got their TD error as new priority
+                self.assertNotAlmostEqual(agent.memory.tree.total(), total)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+import pandas as pd
+from core.logic.resample import resample, IncrementalResampler, MultiTimeframe, to_klines
+
+MIN = 60000
+
+def make_base(n, start=0, missing=()):
+    rng = np.random.default_rng(1)
+    times = [start + i * MIN for i in range(n) if i not in missing]
+    close = 100 + rng.standard_normal(len(times)).cumsum()
+    return {"time": np.array(times), "open": close - 0.1, "high": close + 0.5,
+            "low": close - 0.5, "close": close, "volume": rng.random(len(times))}
+
+class TestResample(unittest.TestCase):
+    def test_matches_pandas_and_flags_partial_bar(self):
+        base = make_base(130, missing={40, 41})  # 8 full 15m bars + 10 minutes
+        bars = resample(base, "15m")
+        df = pd.DataFrame(base).set_index(pd.to_datetime(base["time"], unit="ms"))
+        expected = df.resample("15min").agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        for c in ["open", "high", "low", "close", "volume"]:
+            np.testing.assert_allclose(bars[c], expected[c].to_numpy())
+        self.assertEqual(list(bars["complete"]), [True] * 8 + [False])
+        self.assertEqual(len(resample(base, "15m", include_partial=False)["time"]), 8)
+
+    def test_incremental_matches_batch(self):
+        base = make_base(250)
+        mtf = MultiTimeframe(["15m", "60m"])
+        finished = []
+        for k in to_klines(base):
+            # Each minute arrives as a forming update first, then its final values
+            finished += mtf.update([k[0], k[1], k[1], k[1], k[1], 0.0]).get("60m", [])[:1]
+            finished += mtf.update(k).get("60m", [])[:1]
+        for tf in ["15m", "60m"]:
+            batch = to_klines(resample(base, tf))
+            np.testing.assert_allclose(np.array(mtf.klines(tf)), np.array(batch))
+        self.assertEqual(len(finished), 4)
+
+        r = IncrementalResampler("15m")
+        r.extend(to_klines(base)[:15])
+        self.assertTrue(r.is_current_complete())
+        self.assertEqual(len(r.klines(include_forming=False)), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import time
+import unittest
+from core.logic.scanner import ScannerEngine, change_24h
+from core.clients.market_context import MarketContextProvider
+
+def make_klines(n, start=100.0, step=1.0):
+    return [[i * 900000, start + i * step, start + i * step + 2, start + i * step - 1, start + (i + 1) * step, 10.0] for i in range(n)]
+
+class FakeClient:
+    def get_klines(self, symbol, interval, limit=500):
+        time.sleep(0.05)  # network stand-in
+        if symbol == "NEWUSDT":
+            return make_klines(10)
+        if symbol == "DOWNUSDT":
+            return make_klines(limit, start=300.0, step=-1.0)
+        return make_klines(limit)
+
+class FakeFutures:
+    def __init__(self):
+        self.bulk_calls = 0
+
+    def get_funding_rates(self):
+        self.bulk_calls += 1
+        return {"SOL_USDT": 0.0001}
+
+class CountingContext(MarketContextProvider):
+    def __init__(self):
+        self.calls = []
+
+    def get_fear_greed(self, ts=None):
+        self.calls.append("fng")
+        return {"value": 50, "classification": "Neutral"}
+
+    def get_dxy_trend(self, ts=None):
+        self.calls.append("dxy")
+        return {"price": 100, "change_pct": 0, "sentiment": "NEUTRAL"}
+
+    def get_btc_ticker_24h(self, ts=None):
+        self.calls.append("btc")
+        return {"priceChangePercent": 0}
+
+    def get_funding_rate(self, symbol, ts=None):
+        self.calls.append(symbol)
+        return 0.0
+
+class TestScannerEngine(unittest.TestCase):
+    def test_concurrent_scan_shares_inputs(self):
+        symbols = [f"S{i}USDT" for i in range(20)] + ["SOLUSDT", "DOWNUSDT", "NEWUSDT"]
+        futures, context = FakeFutures(), CountingContext()
+        engine = ScannerEngine(workers=16, client=FakeClient(), futures_client=futures,
+                               sentiment_engine=object(), macro_client=object(), context=context)
+        seen = []
+        report = engine.scan(symbols, on_result=lambda opp, ranked: seen.append(len(ranked)))
+
+        self.assertEqual(futures.bulk_calls, 1)
+        self.assertEqual(sorted(c for c in context.calls if c in ("fng", "dxy", "btc")), ["btc", "dxy", "fng"])
+        # SOL_USDT comes from the bulk funding map; symbols missing from it fall back to a per-symbol lookup
+        self.assertNotIn("SOL_USDT", context.calls)
+        self.assertIn("S0_USDT", context.calls)
+        self.assertEqual(list(report["errors"]), ["NEWUSDT"])
+        self.assertEqual(seen, list(range(1, len(symbols))))
+
+        opps = report["opportunities"]
+        self.assertEqual([o["score"] for o in opps], sorted((o["score"] for o in opps), reverse=True))
+        self.assertTrue(all(set(o["latency"]) == {"klines", "wait_shared", "eval", "done_at"} for o in opps))
+        self.assertLess(report["elapsed"], 0.05 * len(symbols) / 2)  # not sequential
+        down = next(o for o in opps if o["symbol"] == "DOWNUSDT")
+        self.assertLess(down["change"], 0)
+
+    def test_change_24h(self):
+        klines = make_klines(100)
+        self.assertAlmostEqual(change_24h(klines, "15m"), (200 - 104) / 104 * 100)
+        self.assertEqual(change_24h(klines[:50], "15m"), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+from core.logic.screener import snapshot_arrays, screen
+
+def ticker(symbol, last, open_, high, low, quote_volume, bid=None, ask=None):
+    return {"symbol": symbol, "lastPrice": str(last), "openPrice": str(open_), "highPrice": str(high),
+            "lowPrice": str(low), "quoteVolume": str(quote_volume),
+            "bidPrice": None if bid is None else str(bid), "askPrice": None if ask is None else str(ask)}
+
+TICKERS = [
+    ticker("AAAUSDT", 110, 100, 120, 95, 5e6, 109.9, 110.1),  # +10%, tight spread, wide range
+    ticker("BBBUSDT", 95, 100, 101, 94, 8e6, 94.9, 95.1),     # -5%
+    ticker("CCCUSDT", 10, 10, 10.1, 9.9, 2e5, 9.99, 10.01),   # illiquid
+    ticker("DDDUSDT", 50, 50, 60, 40, 3e6, 49.0, 51.0),       # 4% spread
+    ticker("EEEUSDT", 20, 20, 20.2, 19.8, 9e6),               # no book in the 24h ticker
+    ticker("AAABTC", 1, 1, 1, 1, 1e9, 1, 1),                  # other quote asset
+]
+
+class TestScreener(unittest.TestCase):
+    def test_snapshot_columns(self):
+        snap = snapshot_arrays(TICKERS)
+        self.assertEqual(list(snap["symbol"]), ["AAAUSDT", "BBBUSDT", "CCCUSDT", "DDDUSDT", "EEEUSDT"])
+        np.testing.assert_allclose(snap["change_pct"], [10, -5, 0, 0, 0])
+        self.assertTrue(np.isnan(snap["spread_pct"][4]))
+        self.assertEqual(snap["volatility_rank"].argmax(), 3)  # DDD: 40% range
+
+    def test_filters_and_order(self):
+        snap = snapshot_arrays(TICKERS, book_tickers=[{"symbol": "EEEUSDT", "bidPrice": "19.99", "askPrice": "20.01"}])
+        rows = screen(snap, min_quote_volume=1e6, max_spread_pct=0.5)
+        self.assertEqual([r["symbol"] for r in rows], ["EEEUSDT", "BBBUSDT", "AAAUSDT"])
+        rows = screen(snap, min_quote_volume=1e6, min_change_pct=1, max_spread_pct=None)
+        self.assertEqual([r["symbol"] for r in rows], ["AAAUSDT"])
+        rows = screen(snap, min_quote_volume=None, max_spread_pct=None, min_volatility_rank=0.5,
+                      sort_by="volatility", top=1)
+        self.assertEqual(rows[0]["symbol"], "DDDUSDT")
+
+if __name__ == "__main__":
+    unittest.main()
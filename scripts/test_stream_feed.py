@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+from core.logic.candle_store import CandleStore
+from core.clients.mexc_stream import ReplayStream, StreamingFeed, parse_message
+
+def make_klines(n, start=100.0):
+    return [[i * 900000, start + i, start + i + 2, start + i - 1, start + i + 1, 10.0 + i] for i in range(n)]
+
+class TestCandleStore(unittest.TestCase):
+    def test_ring_buffer_and_close(self):
+        store = CandleStore(maxlen=3)
+        self.assertIsNone(store.upsert("SOLUSDT", [0, 1, 1, 1, 1, 1]))
+        self.assertIsNone(store.upsert("SOLUSDT", [0, 1, 2, 1, 2, 1]))  # revision
+        closed = store.upsert("SOLUSDT", [1, 2, 2, 2, 2, 1])
+        self.assertEqual(closed, [0, 1, 2, 1, 2, 1])
+        for t in range(2, 5):
+            store.upsert("SOLUSDT", [t, 1, 1, 1, 1, 1])
+        self.assertEqual([k[0] for k in store.klines("SOLUSDT")], [2, 3, 4])
+        self.assertEqual([k[0] for k in store.klines("SOLUSDT", include_forming=False)], [2, 3])
+        self.assertIsNone(store.upsert("SOLUSDT", [1, 1, 1, 1, 1, 1]))  # stale update ignored
+
+class TestStreamingFeed(unittest.TestCase):
+    def test_replay_drives_candle_close(self):
+        data = {"SOLUSDT": make_klines(10), "BTCUSDT": make_klines(6, 50000.0)}
+        closes = []
+        feed = StreamingFeed(ReplayStream(data, updates=4), lambda s, k: closes.append((s, k[-1])))
+        asyncio.run(feed.run())
+
+        # The last candle of each symbol is still forming when the replay ends
+        self.assertEqual(len([c for c in closes if c[0] == "SOLUSDT"]), 9)
+        self.assertEqual(len([c for c in closes if c[0] == "BTCUSDT"]), 5)
+        # Closed candles carry their final values, in candle order per symbol
+        sol = [k for s, k in closes if s == "SOLUSDT"]
+        self.assertEqual(sol[0], [0, 100.0, 102.0, 99.0, 101.0, 10.0])
+        self.assertEqual([k[0] for k in sol], [k[0] for k in data["SOLUSDT"][:9]])
+        self.assertEqual(feed.store.last("SOLUSDT")[4], data["SOLUSDT"][-1][4])
+
+    def test_rest_warm_up_fills_buffer(self):
+        history = make_klines(20)
+        requests = []
+
+        class FakeClient:
+            def get_klines(self, symbol, interval, limit=500):
+                requests.append((symbol, interval, limit))
+                return [[str(v) for v in k] for k in history[:12]][-limit:]
+
+        closes = []
+        feed = StreamingFeed(ReplayStream({"SOLUSDT": history[11:14]}, updates=2),
+                             lambda s, k: closes.append(len(k)), store=CandleStore(maxlen=50), client=FakeClient())
+        asyncio.run(feed.run())
+
+        self.assertEqual(requests, [("SOLUSDT", "15m", 50)])
+        # The first close already sees the REST history
+        self.assertEqual(closes, [12, 13])
+        self.assertEqual(feed.store.klines("SOLUSDT")[0], history[0])
+
+    def test_slow_callback_does_not_block_stream(self):
+        data = {"SOLUSDT": make_klines(4), "BTCUSDT": make_klines(4, 50000.0)}
+        seen = []
+
+        async def on_close(symbol, klines):
+            seen.append(("start", symbol, klines[-1][0]))
+            await asyncio.sleep(0.05)
+            seen.append(("end", symbol, klines[-1][0]))
+
+        asyncio.run(StreamingFeed(ReplayStream(data, updates=1), on_close).run())
+
+        self.assertEqual(len(seen), 12)
+        # Both symbols' first closes start before either one finishes
+        self.assertEqual([e[0] for e in seen[:2]], ["start", "start"])
+        for symbol in data:
+            self.assertEqual([e[2] for e in seen if e[1] == symbol and e[0] == "end"], [0, 900000, 1800000])
+
+    def test_parse_ticker(self):
+        msg = {"c": "spot@public.bookTicker.v3.api@SOLUSDT", "d": {"b": "120.1", "B": "5", "a": "120.2", "A": "3"},
+               "s": "SOLUSDT", "t": 1}
+        kind, symbol, payload = parse_message(msg)
+        self.assertEqual((kind, symbol, payload["ask"]), ("ticker", "SOLUSDT", 120.2))
+        self.assertIsNone(parse_message('{"id":0,"code":0,"msg":"PONG"}'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from core.logic.trading_daemon import TradingDaemon, merge_klines
+from core.clients.market_context import MarketContextProvider
+
+def make_klines(n, start=100.0, t0=0):
+    return [[t0 + i * 900000, start + i, start + i + 2, start + i - 1, start + i + 1, 10.0] for i in range(n)]
+
+class FakeClient:
+    def __init__(self, n=120):
+        self.limits = []
+        self.n = n
+
+    def get_klines(self, symbol, interval, limit=500):
+        self.limits.append(limit)
+        return make_klines(self.n)[-limit:]
+
+class CountingContext(MarketContextProvider):
+    def __init__(self):
+        self.calls = {"fng": 0, "dxy": 0, "btc": 0, "funding": []}
+
+    def get_fear_greed(self, ts=None):
+        self.calls["fng"] += 1
+        return {"value": 50, "classification": "Neutral"}
+
+    def get_dxy_trend(self, ts=None):
+        self.calls["dxy"] += 1
+        return {"price": 100, "change_pct": 0, "sentiment": "NEUTRAL"}
+
+    def get_btc_ticker_24h(self, ts=None):
+        self.calls["btc"] += 1
+        return {"priceChangePercent": 0}
+
+    def get_funding_rate(self, symbol, ts=None):
+        self.calls["funding"].append(symbol)
+        return 0.0001
+
+class TestMergeKlines(unittest.TestCase):
+    def test_merge(self):
+        old = make_klines(5)
+        new = [list(old[-1]), *make_klines(2, t0=5 * 900000)]
+        new[0][4] = 999.0  # revised forming candle
+        merged = merge_klines(old, new, limit=6)
+        self.assertEqual([k[0] // 900000 for k in merged], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(merged[3][4], 999.0)
+
+class TestTradingDaemon(unittest.TestCase):
+    def test_tick_shares_one_snapshot(self):
+        symbols = ["SOLUSDT", "ETHUSDT", "XRPUSDT"]
+        client, context = FakeClient(), CountingContext()
+        daemon = TradingDaemon(symbols, client=client, futures_client=object(), sentiment_engine=object(),
+                               macro_client=object(), context=context, workers=2)
+        try:
+            for _ in range(2):
+                results = daemon.tick()
+        finally:
+            daemon.close()
+
+        self.assertEqual(set(results), set(symbols))
+        self.assertTrue(all("signal" in r for r in results.values()))
+        # One market context fetch per tick for all symbols
+        self.assertEqual((context.calls["fng"], context.calls["dxy"], context.calls["btc"]), (2, 2, 2))
+        self.assertEqual(sorted(context.calls["funding"]), sorted(["SOL_USDT", "ETH_USDT", "XRP_USDT"] * 2))
+        # Full history on the first tick, only the newest candles afterwards
+        self.assertEqual(sorted(client.limits), [5, 5, 5, 100, 100, 100])
+        self.assertTrue(all(s.client is client for s in daemon.strategies.values()))
+
+    def test_gap_triggers_full_refetch(self):
+        client = FakeClient()
+        daemon = TradingDaemon(["SOLUSDT"], client=client, futures_client=object(), sentiment_engine=object(),
+                               macro_client=object(), context=CountingContext(), workers=1)
+        try:
+            daemon._fetch_klines("SOLUSDT")
+            client.n = 122  # two new candles: the refresh overlaps
+            daemon._fetch_klines("SOLUSDT")
+            client.n = 140  # missed more than refresh_limit candles
+            klines = daemon._fetch_klines("SOLUSDT")
+        finally:
+            daemon.close()
+
+        self.assertEqual(client.limits, [100, 5, 5, 100])
+        self.assertEqual([k[0] // 900000 for k in klines], list(range(40, 140)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import threading
+import unittest
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from core.clients import transport
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.host = f"127.0.0.1:{self.server.server_port}"
+        self.url = f"http://{self.host}/ping"
+
+        # Fresh shared session for this test, process defaults restored afterwards
+        saved = (transport._session, transport._pool_connections, transport._pool_maxsize)
+        def restore():
+            if transport._session is not None and transport._session is not saved[0]:
+                transport._session.close()
+            transport._session, transport._pool_connections, transport._pool_maxsize = saved
+        self.addCleanup(restore)
+        transport._session = None
+        env = mock.patch.dict(os.environ, {"NO_PROXY": "127.0.0.1", "no_proxy": "127.0.0.1"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_session_reuse_and_counters(self):
+        self.assertEqual(transport.stats(), {})  # no session yet
+        session = transport.get_session()
+        for _ in range(5):
+            self.assertEqual(transport.get(self.url, timeout=5).json(), {"ok": True})
+        self.assertIs(transport.get_session(), session)
+        self.assertEqual(transport.stats()[self.host], {"requests": 5, "connections": 1, "reused": 4})
+
+    def test_configure_rebuilds_pool(self):
+        transport.get(self.url, timeout=5)
+        old = transport.get_session()
+        transport.configure(pool_connections=2, pool_maxsize=3)
+        session = transport.get_session()
+        self.assertIsNot(session, old)
+        adapter = session.get_adapter(self.url)
+        self.assertEqual((adapter._pool_connections, adapter._pool_maxsize), (2, 3))
+        # Counters start over with the new pool
+        self.assertEqual(transport.stats(), {})
+        transport.get(self.url, timeout=5)
+        transport.get(self.url, timeout=5)
+        self.assertEqual(transport.stats()[self.host], {"requests": 2, "connections": 1, "reused": 1})
+
+if __name__ == "__main__":
+    unittest.main()
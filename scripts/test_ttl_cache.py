@@ -0,0 +1,35 @@
+import time
+import tempfile
+import unittest
+from core.clients.ttl_cache import TTLCache
+
+class TestTTLCache(unittest.TestCase):
+    def test_fresh_hit_and_failure_not_cached(self):
+        calls = []
+        cache = TTLCache("t", ttl=60)
+        self.assertIsNone(cache.get("k", lambda: None))
+        self.assertEqual(cache.get("k", lambda: calls.append(1) or {"v": 1}), {"v": 1})
+        self.assertEqual(cache.get("k", lambda: calls.append(1) or {"v": 2}), {"v": 1})
+        self.assertEqual(len(calls), 1)
+
+    def test_stale_while_revalidate(self):
+        cache = TTLCache("t", ttl=0.05, stale_ttl=60)
+        cache.get("k", lambda: 1)
+        time.sleep(0.06)
+        self.assertEqual(cache.get("k", lambda: 2), 1)  # stale value served at once
+        for _ in range(50):
+            if cache.entries["k"]["value"] == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(cache.get("k", lambda: 3), 2)
+
+    def test_ttl_from_value_and_disk_sharing(self):
+        with tempfile.TemporaryDirectory() as d:
+            first = TTLCache("fng", ttl=lambda v: v["time_until_update"], cache_dir=d)
+            first.get("latest", lambda: {"value": 20, "time_until_update": 600})
+            second = TTLCache("fng", ttl=60, cache_dir=d)  # e.g. another process
+            self.assertEqual(second.get("latest", lambda: {"value": 99})["value"], 20)
+            self.assertAlmostEqual(second.entries["latest"]["expires_at"] - time.time(), 600, delta=5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+from core.ai.ai_environment import TradingEnvironment
+from core.ai.vector_env import VectorTradingEnvironment
+from scripts.benchmark_env import synthetic_frame
+
+class TestVectorEnvironment(unittest.TestCase):
+    def test_lockstep_matches_single_envs(self):
+        sources = [TradingEnvironment(df=synthetic_frame(200, seed=s)) for s in (0, 1)]
+        venv = VectorTradingEnvironment(sources, num_envs=4, random_start=False, max_steps=1000)
+        singles = [TradingEnvironment(df=synthetic_frame(200, seed=i % 2)) for i in range(4)]
+        obs = venv.reset()
+        for i, env in enumerate(singles):
+            np.testing.assert_array_equal(obs[i], env.reset())
+
+        rng = np.random.default_rng(3)
+        for _ in range(177):  # last step before the episodes end
+            actions = rng.integers(0, 3, 4)
+            obs, rewards, terminated, truncated, info = venv.step(actions)
+            for i, env in enumerate(singles):
+                o, r, d, inf = env.step(int(actions[i]))
+                np.testing.assert_array_equal(obs[i], o)
+                self.assertAlmostEqual(rewards[i], r)
+                self.assertEqual(terminated[i], d)
+        self.assertFalse(terminated.any() or truncated.any())
+        final = [env.step(0)[0] for env in singles]
+        obs, rewards, terminated, truncated, info = venv.step(np.zeros(4, dtype=int))
+        self.assertTrue(terminated.all())
+        self.assertFalse(truncated.any())
+        self.assertTrue((obs[:, 4] == 100.0).all())  # auto-reset
+        np.testing.assert_array_equal(info["final_observation"], np.stack(final))
+
+    def test_random_starts_fees_and_horizon(self):
+        venv = VectorTradingEnvironment([TradingEnvironment(df=synthetic_frame(1000))], num_envs=8,
+                                        fees=(0.0, 0.01), max_steps=50, seed=0)
+        venv.reset()
+        self.assertGreater(len(set(venv.current_step)), 1)
+        buy_price = venv.prices[venv.base + venv.current_step]
+        venv.step(np.ones(8, dtype=int))
+        np.testing.assert_allclose(venv.inventory[:2] * buy_price[:2], [100.0, 99.0])  # 1% fee on env 1
+        for _ in range(48):
+            obs, _, terminated, truncated, info = venv.step(np.zeros(8, dtype=int))
+        self.assertFalse(truncated.any())
+        before = obs.copy()
+        obs, _, terminated, truncated, info = venv.step(np.zeros(8, dtype=int))
+        # The 50-step cap truncates: not terminal, and the final observation is kept
+        self.assertTrue(truncated.all())
+        self.assertFalse(terminated.any())
+        np.testing.assert_allclose(info["final_observation"][:, 6], before[:, 6] + 1 / venv.length)
+        np.testing.assert_array_equal(info["final_observation"][:, 5], before[:, 5])
+
+if __name__ == "__main__":
+    unittest.main()
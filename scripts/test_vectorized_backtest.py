@@ -0,0 +1,51 @@
+import random
+import unittest
+from core.logic.indicators import calculate_ema, calculate_rsi, calculate_volume_profile
+from core.logic.vectorized_backtest import compute_signals, klines_to_columns, poc_column, rsi_column, WAIT, SIGNAL_NAMES
+from core.logic.strategy import HybridStrategy
+
+class TestVectorizedBacktest(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        price = 100.0
+        self.klines = []
+        for i in range(600):
+            close = price * (1 + random.gauss(0, 0.004))
+            self.klines.append([i * 900000, price, max(price, close), min(price, close), close, random.random() * 1000])
+            price = close
+        self.cols = klines_to_columns(self.klines)
+
+    def test_rsi_matches_batch(self):
+        closes = [k[4] for k in self.klines]
+        for a, b in zip(rsi_column(self.cols["close"]), calculate_rsi(closes, 14)):
+            self.assertAlmostEqual(a, b, places=9)
+
+    def test_poc_matches_volume_profile(self):
+        poc = poc_column(self.cols["close"], self.cols["volume"], window=100)
+        for i in range(100, len(self.klines)):
+            self.assertAlmostEqual(poc[i], calculate_volume_profile(self.klines[i - 100:i + 1]), places=9)
+
+    def test_signals_follow_crossovers(self):
+        out = compute_signals(self.cols)
+        closes = [k[4] for k in self.klines]
+        ema9 = calculate_ema(closes, 9)
+        ema21 = calculate_ema(closes, 21)
+        for i in range(101, len(closes)):
+            crossed = (ema9[i - 1] <= ema21[i - 1]) != (ema9[i] <= ema21[i])
+            if out["signal"][i] != WAIT:
+                self.assertTrue(crossed)
+        self.assertTrue((out["signal"][:100] == WAIT).all())
+
+    def test_matches_per_bar_strategy(self):
+        # Same walk as professional_backtester.run(): one strategy, klines[i-100:i+1] per bar
+        strategy = HybridStrategy("SOLUSDT", client=object(), futures_client=object(),
+                                  sentiment_engine=object(), macro_client=object())
+        strategy.model = None
+        out = compute_signals(self.cols, window=100)
+        signals = [strategy.get_signals_backtest(self.klines[i - 100:i + 1])["signal"]
+                   for i in range(100, len(self.klines))]
+        self.assertEqual(signals, [SIGNAL_NAMES[c] for c in out["signal"][100:]])
+        self.assertGreater(sum(s != "WAIT" for s in signals), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+import argparse
+from core.logic.trading_daemon import TradingDaemon
+
+def main():
+    parser = argparse.ArgumentParser(description="Run HybridStrategy for many symbols in one process")
+    parser.add_argument("--symbols", default="SOLUSDT,BTCUSDT", help="Comma separated symbols")
+    parser.add_argument("--interval", default="15m")
+    parser.add_argument("--poll", type=float, default=30, help="Seconds between ticks")
+    parser.add_argument("--workers", type=int, default=8, help="Threads fetching klines")
+    parser.add_argument("--amount", type=float, default=20.0, help="USDT per BUY")
+    parser.add_argument("--ticks", type=int, default=None, help="Stop after this many ticks")
+    parser.add_argument("--live", action="store_true", help="Send real orders (default: dry run)")
+    args = parser.parse_args()
+
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+    daemon = TradingDaemon(symbols, interval=args.interval, poll_seconds=args.poll, workers=args.workers,
+                           amount_usdt=args.amount, dry_run=not args.live)
+    daemon.run(max_ticks=args.ticks)
+
+if __name__ == "__main__":
+    main()